@@ -2,9 +2,183 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 import os
+import re
 import math
+import functools
+import time
+from collections import OrderedDict
 IMAGE_FOLDER = "graphics/ships/"
 
+# Cheaper resample for the live beam preview (Pillow < 9.1 has no Image.Resampling)
+try:
+    _PREVIEW_RESAMPLE = Image.Resampling.BILINEAR
+    _MASTER_RESAMPLE = Image.Resampling.LANCZOS
+except AttributeError:
+    _PREVIEW_RESAMPLE = Image.BILINEAR
+    _MASTER_RESAMPLE = Image.LANCZOS
+# The preview canvas never needs more than this; textures are shrunk once on load
+_PREVIEW_MASTER_SIZE = (512, 512)
+try:
+    _ROTATE_180 = Image.Transpose.ROTATE_180
+except AttributeError:
+    _ROTATE_180 = Image.ROTATE_180
+
+
+# (artfileroot, data_dir) -> preferred image path found on disk. Misses, and hits on a
+# fallback candidate, are never stored, so images added mid-session still show up.
+_ship_image_hits = {}
+
+
+def _resolve_ship_image(artfileroot, data_dir):
+    """Return the preview texture path for a ship (1024 px, then 256 px), or None.
+
+    Falls back to unknown1024.png when the ship has no artfileroot.
+    """
+    key = (artfileroot, data_dir)
+    path = _ship_image_hits.get(key)
+    if path is not None:
+        if os.path.exists(path):
+            return path
+        del _ship_image_hits[key]
+    base_dir = os.path.join(data_dir, IMAGE_FOLDER)
+    if artfileroot:
+        norm_art = os.path.normpath(artfileroot.lstrip("\\/"))
+        candidates = (norm_art + "1024.png", norm_art + "256.png")
+    else:
+        candidates = ("unknown1024.png",)
+    for i, name in enumerate(candidates):
+        path = os.path.join(base_dir, name)
+        if os.path.exists(path):
+            if i == 0:
+                _ship_image_hits[key] = path
+            return path
+    return None
+
+
+# Numbers in a pasted position: "[x, y, z],", "x, y, z", "x y z", ...
+_NUM_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+# Last clipboard read as (monotonic time, text); rapid Paste Pos clicks reuse it
+_CLIPBOARD_TTL = 0.1
+_clipboard_cache = None
+
+
+def _clipboard_text(widget, refresh=False):
+    """Return the clipboard text, reading the OS clipboard at most once per 100 ms.
+
+    Pass refresh=True to force a fresh read.
+    """
+    global _clipboard_cache
+    now = time.monotonic()
+    if refresh or _clipboard_cache is None or now - _clipboard_cache[0] > _CLIPBOARD_TTL:
+        _clipboard_cache = (now, widget.clipboard_get())
+    return _clipboard_cache[1]
+
+
+def _parse_clipboard_position(text):
+    """Return the first three numbers in text as strings, or None if there are fewer."""
+    nums = _NUM_RE.findall(text)
+    if len(nums) < 3:
+        return None
+    return nums[:3]
+
+
+# Cell contents that are only the start of a number while the user is still typing
+_PARTIAL_NUMBERS = frozenset(("-", "+", ".", "-.", "+."))
+
+
+def _preview_number(text):
+    """Float value of a preview cell: 0.0 when empty, None while half-typed (no exception)."""
+    text = str(text).strip()
+    if not text:
+        return 0.0
+    if text in _PARTIAL_NUMBERS:
+        return None
+    return float(text)
+
+
+# Prepared preview masters keyed by (path, mtime) and the scaled PhotoImages built from
+# them keyed by (master key, canvas size); shared by every dialog opened this session.
+_PREVIEW_CACHE_SIZE = 8
+_preview_master_cache = OrderedDict()
+_preview_photo_cache = OrderedDict()
+
+
+def _cache_put(cache, key, value):
+    cache[key] = value
+    while len(cache) > _PREVIEW_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _load_preview_master(image_path):
+    """Return (cache key, rotated and downsampled RGBA preview master) for a ship texture.
+
+    The result is cached in memory and reused until the file's mtime changes.
+    """
+    key = (image_path, os.path.getmtime(image_path))
+    img = _preview_master_cache.get(key)
+    if img is None:
+        img = Image.open(image_path)
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        img = img.transpose(_ROTATE_180)
+        img.thumbnail(_PREVIEW_MASTER_SIZE, _MASTER_RESAMPLE)
+        _cache_put(_preview_master_cache, key, img)
+    else:
+        _preview_master_cache.move_to_end(key)
+    return key, img
+
+
+def _preview_photo(master_key, master_img, canvas_w, canvas_h):
+    """Return a PhotoImage of the master fitted to ~90% of the canvas, reusing earlier ones.
+
+    The cache also keeps the PhotoImage alive while a canvas still shows it.
+    """
+    key = (master_key, canvas_w, canvas_h)
+    photo = _preview_photo_cache.get(key)
+    if photo is None:
+        desired_w = max(1, int(canvas_w * 0.9))
+        desired_h = max(1, int(canvas_h * 0.9))
+        # Aspect-preserving fit; resize() leaves the master untouched so no copy() is needed
+        src_w, src_h = master_img.size
+        fit = min(desired_w / src_w, desired_h / src_h)
+        img = master_img.resize((max(1, int(src_w * fit)), max(1, int(src_h * fit))),
+                                _PREVIEW_RESAMPLE)
+        photo = ImageTk.PhotoImage(img)
+        _cache_put(_preview_photo_cache, key, photo)
+    else:
+        _preview_photo_cache.move_to_end(key)
+    return photo
+
+
+# Angular step (degrees) used when flattening a beam arc into polygon points
+_ARC_STEP_DEG = 5.0
+
+
+@functools.lru_cache(maxsize=256)
+def _beam_arc_geometry(barrel_angle, arc_width):
+    """Return unit (x, y) offsets along a beam arc, in canvas coordinates.
+
+    Prefixed with the center, they form a single pie-slice polygon: the closing
+    edges are the two radial lines. Full circles start and end at the barrel angle,
+    so they draw one radial line plus the circle. Only depends on the two angles,
+    so resizes and range edits never redo the trig.
+    """
+    # Tkinter's angles start at 3 o'clock and run counter-clockwise.
+    center_angle = 90 - barrel_angle
+    if arc_width >= 360:
+        start_angle, extent = center_angle, 360.0
+    else:
+        start_angle, extent = center_angle - (arc_width / 2), arc_width
+    steps = max(1, int(math.ceil(abs(extent) / _ARC_STEP_DEG)))
+    radians, cos, sin = math.radians, math.cos, math.sin
+    points = []
+    for k in range(steps + 1):
+        rad = radians(start_angle + extent * k / steps)
+        points.append((cos(rad), -sin(rad)))
+    return tuple(points)
+
 
 class EditTorpedoDialog:
     def __init__(self, parent, current_list, available_types):
@@ -13,8 +187,9 @@ class EditTorpedoDialog:
         self.result = None
         self.available_types = available_types
         
-        # Store rows, each row is a dict with variables.
-        self.rows = []
+        # Live rows keyed by a monotonic id, each row is a dict with variables.
+        self.rows = {}
+        self._next_row_id = 0
         self.frm_rows = ttk.Frame(self.top)
         self.frm_rows.grid(row=0, column=0, columnspan=3, padx=10, pady=10)
         
@@ -52,39 +227,38 @@ class EditTorpedoDialog:
         self.top.wait_window(self.top)
         
     def add_row(self, torpedo_type: str = "", count: str = "0"):
-        row_index = len(self.rows)
+        row_id = self._next_row_id
+        self._next_row_id += 1
         type_var = tk.StringVar(value=torpedo_type)
         count_var = tk.StringVar(value=count)
         combobox_type = ttk.Combobox(self.frm_rows, textvariable=type_var, values=self.available_types, width=12)
-        combobox_type.grid(row=row_index, column=0, padx=5, pady=2)
+        combobox_type.grid(row=row_id, column=0, padx=5, pady=2)
         combobox_type.config(state="normal")  # editable
         entry_count = ttk.Entry(self.frm_rows, textvariable=count_var, width=8)
-        entry_count.grid(row=row_index, column=1, padx=5, pady=2)
-        btn_remove = ttk.Button(self.frm_rows, text="Remove", command=lambda idx=row_index: self.remove_row(idx))
-        btn_remove.grid(row=row_index, column=2, padx=5, pady=2)
-        self.rows.append({
+        entry_count.grid(row=row_id, column=1, padx=5, pady=2)
+        btn_remove = ttk.Button(self.frm_rows, text="Remove", command=lambda rid=row_id: self.remove_row(rid))
+        btn_remove.grid(row=row_id, column=2, padx=5, pady=2)
+        self.rows[row_id] = {
             "type_var": type_var,
             "count_var": count_var,
             "combobox_type": combobox_type,
             "entry_count": entry_count,
             "btn_remove": btn_remove
-        })
+        }
+        return row_id
         
-    def remove_row(self, idx):
-        row = self.rows[idx]
+    def remove_row(self, row_id):
+        row = self.rows.pop(row_id, None)
         if row is None:
             return
         row["combobox_type"].destroy()
         row["entry_count"].destroy()
         row["btn_remove"].destroy()
-        self.rows[idx] = None
         
     def on_ok(self):
         result = []
         types_seen = set()
-        for row in self.rows:
-            if row is None:
-                continue
+        for row in self.rows.values():
             ttype = row["type_var"].get().strip()
             count_str = row["count_var"].get().strip()
             if ttype:
@@ -104,13 +278,15 @@ class EditTorpedoDialog:
     def on_cancel(self):
         self.top.destroy()
         
-import tkinter as tk
-from tkinter import ttk, messagebox
-from tksheet import Sheet  # Make sure to install tksheet via pip install tksheet
-
 
 # --- Edit Beam Ports Dialog Class ---
 class EditBeamPortsDialog:
+    # Sheet column order; on_ok / the preview look fields up by name through _col.
+    col_fields = ["x", "y", "z", "color", "arccolor", "cycle_time", "damage_coeff", "range", "arcwidth", "barrel_angle"]
+    default_row = ["0", "0", "0", "", "red", "0", "0", "0", "0", "0"]
+    # Per-column converter applied by on_ok, in col_fields order
+    col_types = (float, float, float, str, str, int, float, int, int, int)
+
     def __init__(self, parent, current_list, ship_artfileroot=None, open_3d_callback=None):
         # Save the ship's artfileroot, if provided.
         self.ship_artfileroot = ship_artfileroot
@@ -118,7 +294,17 @@ class EditBeamPortsDialog:
         self.top = tk.Toplevel(parent)
         self.top.title("Edit Beam Ports")
         self.result = None
-        self.rows = []
+        self._col = {field: col for col, field in enumerate(self.col_fields)}
+        # Preview overlay polygon ids, one per sheet row
+        self._row_items = []
+        # Scaled preview PhotoImage is reused until the canvas size changes
+        self._photo_cache_key = None
+        self._preview_base = None
+        # Pending after() id: bursts of keystrokes/resizes collapse into one redraw
+        self._redraw_job = None
+        # What the preview currently shows; redraws that would not change it are skipped
+        self._last_sig = None
+        self._last_arcs = []
 
         # --- Create preview frame and canvas BEFORE adding rows ---
         preview_frame = ttk.Frame(self.top)
@@ -126,71 +312,65 @@ class EditBeamPortsDialog:
         self.preview_canvas = tk.Canvas(preview_frame, width=400, height=400, background="black")
         self.preview_canvas.pack(expand=True, fill="both")
         # Redraw when the canvas is resized so the image stays centered/scaled
-        self.preview_canvas.bind("<Configure>", lambda e: self.update_beam_preview())
+        self.preview_canvas.bind("<Configure>", self._on_preview_configure)
+        # Background image item; created first so the beam overlays stack above it
+        self._image_item = self.preview_canvas.create_image(0, 0, anchor="center", state="hidden")
         self.load_preview_base_image()  # Load the ship image (or fallback image)
         # Ensure the two main columns (left form / right preview) resize well
         self.top.grid_columnconfigure(0, weight=1)
         self.top.grid_columnconfigure(1, weight=1)
         self.top.grid_rowconfigure(1, weight=1)
         
-        # Set up header for beam port rows.
-        self.headers = ["X", "Y", "Z", "Color", "ArcColor", "Cycle Time", 
-                        "Damage Coeff", "Range", "ArcWidth", "Barrel Angle", " ", " "]
-        self.header_frame = ttk.Frame(self.top)
-        self.header_frame.grid(row=0, column=0, sticky="ew", padx=2, pady=2)
-        for col, text in enumerate(self.headers):
-            lbl = ttk.Label(self.header_frame, text=text, font=("Arial", 10, "bold"))
-            lbl.grid(row=0, column=col, padx=2, pady=2, sticky="ew")
-            self.header_frame.grid_columnconfigure(col, weight=1, uniform="col")
-        
-        self.frm_rows = ttk.Frame(self.top)
-        self.frm_rows.grid(row=1, column=0, sticky="ew", padx=2, pady=2)
-        
-        # Populate rows from the current_list (or add a default row if none provided).
-        if current_list:
-            for entry in current_list:
-                pos = entry.get("position", [0, 0, 0])
-                row_data = {
-                    "x": tk.StringVar(value=str(pos[0])),
-                    "y": tk.StringVar(value=str(pos[1])),
-                    "z": tk.StringVar(value=str(pos[2])),
-                    "color": tk.StringVar(value=entry.get("color", "")),
-                    "arccolor": tk.StringVar(value=entry.get("arccolor", "red")),
-                    "cycle_time": tk.StringVar(value=str(entry.get("cycle_time", 0))),
-                    "damage_coeff": tk.StringVar(value=str(entry.get("damage_coeff", 0))),
-                    "range": tk.StringVar(value=str(entry.get("range", 0))),
-                    "arcwidth": tk.StringVar(value=str(entry.get("arcwidth", 0))),
-                    "barrel_angle": tk.StringVar(value=str(entry.get("barrel_angle", 0)))
-                }
-                self.add_row(row_data)
-        else:
-            self.add_row()
+        # Beam port rows live in a single canvas-drawn sheet instead of a grid of Entry widgets.
+        self.headers = ["X", "Y", "Z", "Color", "ArcColor", "Cycle Time",
+                        "Damage Coeff", "Range", "ArcWidth", "Barrel Angle"]
+        rows = []
+        for entry in current_list or []:
+            pos = entry.get("position", [0, 0, 0])
+            rows.append([str(pos[0]), str(pos[1]), str(pos[2]),
+                         entry.get("color", ""),
+                         entry.get("arccolor", "red"),
+                         str(entry.get("cycle_time", 0)),
+                         str(entry.get("damage_coeff", 0)),
+                         str(entry.get("range", 0)),
+                         str(entry.get("arcwidth", 0)),
+                         str(entry.get("barrel_angle", 0))])
+        if not rows:
+            rows.append(list(self.default_row))
+        # Imported here so app start-up does not pay for tksheet until this dialog opens
+        from tksheet import Sheet  # Make sure to install tksheet via pip install tksheet
+        self.sheet = Sheet(self.top, headers=self.headers, data=rows,
+                           default_column_width=80, width=820, height=300)
+        self.sheet.enable_bindings("single_select", "row_select", "edit_cell",
+                                   "arrowkeys", "copy", "paste", "delete")
+        # Any edit that can change the arcs feeds the (debounced) preview.
+        self.sheet.extra_bindings([("end_edit_cell", self._schedule_redraw),
+                                   ("end_paste", self._schedule_redraw),
+                                   ("end_delete", self._schedule_redraw)])
+        self.sheet.grid(row=0, column=0, rowspan=2, sticky="nsew", padx=2, pady=2)
         
         # Add buttons for row control.
-        # Controls row (left column): Add Row + Open 3D Viewer
+        # Controls row (left column): Add Row / Remove / Paste Pos + Open 3D Viewer
         controls_frame = ttk.Frame(self.top)
         controls_frame.grid(row=2, column=0, padx=5, pady=5, sticky="ew")
-        controls_frame.columnconfigure(0, weight=1)
-        controls_frame.columnconfigure(1, weight=1)
+        controls_frame.columnconfigure(3, weight=1)
         btn_add = ttk.Button(controls_frame, text="Add Row", command=lambda: self.add_row())
         btn_add.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        btn_remove = ttk.Button(controls_frame, text="Remove", command=self.remove_selected_rows)
+        btn_remove.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        btn_paste = ttk.Button(controls_frame, text="Paste Pos", command=self.paste_position)
+        btn_paste.grid(row=0, column=2, padx=5, pady=5, sticky="w")
         if open_3d_callback is not None:
             btn_3d = ttk.Button(controls_frame, text="Open 3D Viewer",
                                 command=lambda cb=open_3d_callback: cb(parent=self.top))
-            btn_3d.grid(row=0, column=1, padx=5, pady=5, sticky="e")
+            btn_3d.grid(row=0, column=3, padx=5, pady=5, sticky="e")
         btn_ok = ttk.Button(self.top, text="OK", command=self.on_ok)
         btn_ok.grid(row=3, column=0, padx=5, pady=5, sticky="e")
         btn_cancel = ttk.Button(self.top, text="Cancel", command=self.on_cancel)
         btn_cancel.grid(row=3, column=0, padx=5, pady=5, sticky="w")
         
-        # Bind key release events on arc-related fields to update the preview.
-        for row in self.rows:
-            for field in ["range", "arcwidth", "barrel_angle", "arccolor"]:
-                entry_widget = row["widgets"].get(field)
-                if entry_widget:
-                    entry_widget.bind("<KeyRelease>", lambda e: self.update_beam_preview())
-        
-        self.update_beam_preview()
+        # First draw waits until the canvas is on screen so the dialog pops up immediately
+        self.preview_canvas.bind("<Map>", self._schedule_redraw, add="+")
         self.top.grab_set()
         self.top.wait_window(self.top)
     
@@ -198,195 +378,167 @@ class EditBeamPortsDialog:
         try:
             # Resolve under <cosmos_root>/data if the editor set it for us
             data_dir = os.environ.get("COSMOS_DATA_DIR", os.getcwd())
-            base_dir = os.path.join(data_dir, IMAGE_FOLDER)
-            if self.ship_artfileroot:
-                norm_art = os.path.normpath(str(self.ship_artfileroot).lstrip("\\/"))
-                image_path_1024 = os.path.join(base_dir, norm_art + "1024.png")
-                image_path_256 = os.path.join(base_dir, norm_art + "256.png")
-                image_path = image_path_1024 if os.path.exists(image_path_1024) else image_path_256
-                print("Attempting to load image from:", os.path.abspath(image_path))
-            else:
-                image_path = os.path.join(base_dir, "unknown1024.png")
-            
-            if os.path.exists(image_path):
-                # Keep the original PIL image; we’ll scale it per current canvas size
-                base_img = Image.open(image_path).convert("RGBA").rotate(180)
-                self.preview_base_img = base_img
-                self.preview_base = None  # will be created in update_beam_preview()
+            image_path = _resolve_ship_image(str(self.ship_artfileroot or ""), data_dir)
+            if image_path:
+                # Small rotated master; we’ll scale it per current canvas size
+                self._preview_key, self.preview_base_img = _load_preview_master(image_path)
             else:
                 self.preview_base_img = None
-                self.preview_base = None
         except Exception as e:
             print("Error loading preview base image:", e)
-            self.preview_base = None
-
-    def update_beam_preview(self):
-        self.preview_canvas.delete("all")
+            self.preview_base_img = None
+        self._preview_base = None  # will be created in _do_redraw()
+        self._photo_cache_key = None
+        self._last_sig = None
+
+    def _on_preview_configure(self, event=None):
+        # Size changed: drop the cached PhotoImage so the next redraw rescales it
+        self._photo_cache_key = None
+        self._last_sig = None
+        self._schedule_redraw()
+
+    def _schedule_redraw(self, event=None):
+        if self._redraw_job:
+            self.top.after_cancel(self._redraw_job)
+        self._redraw_job = self.top.after(30, self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_job = None
+        if not self.preview_canvas.winfo_exists():
+            return
+        canvas = self.preview_canvas
         # Actual current size (winfo_*) with sane minimums to avoid 0 sizes
-        canvas_w = max(2, int(self.preview_canvas.winfo_width() or 0))
-        canvas_h = max(2, int(self.preview_canvas.winfo_height() or 0))
+        canvas_w = max(2, int(canvas.winfo_width() or 0))
+        canvas_h = max(2, int(canvas.winfo_height() or 0))
+        # Arc-relevant values per row. Half-typed numbers ("", "-", "1.") keep the
+        # row's last good values so typing transients neither flicker nor redraw.
+        c_barrel, c_width = self._col["barrel_angle"], self._col["arcwidth"]
+        c_range, c_color = self._col["range"], self._col["arccolor"]
+        last_arcs = self._last_arcs
+        arcs = []
+        for i, values in enumerate(self.sheet.get_sheet_data()):
+            try:
+                arc = (_preview_number(values[c_barrel]),
+                       _preview_number(values[c_width]),
+                       _preview_number(values[c_range]),
+                       str(values[c_color]).strip() or "red")
+            except ValueError:
+                arc = None
+            if arc is None or None in arc:
+                arc = last_arcs[i] if i < len(last_arcs) else None
+            arcs.append(arc)
+        sig = (canvas_w, canvas_h, tuple(arcs))
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+        self._last_arcs = arcs
         # Center point for both image and arcs
         cx, cy = canvas_w // 2, canvas_h // 2
         # (Re)build a scaled PhotoImage so the ship texture is centered and sized to the panel
         if getattr(self, "preview_base_img", None) is not None:
-            # Fit image into ~90% of the canvas area while keeping aspect
-            desired_w = max(1, int(canvas_w * 0.9))
-            desired_h = max(1, int(canvas_h * 0.9))
-            img = self.preview_base_img.copy()
-            img.thumbnail((desired_w, desired_h))
-            self.preview_base = ImageTk.PhotoImage(img)
-            # Draw centered
-            self.preview_canvas.create_image(cx, cy, anchor="center", image=self.preview_base)
+            key = (canvas_w, canvas_h)
+            if key != self._photo_cache_key or self._preview_base is None:
+                # Fit image into ~90% of the canvas area while keeping aspect
+                self._preview_base = _preview_photo(self._preview_key, self.preview_base_img,
+                                                    canvas_w, canvas_h)
+                self._photo_cache_key = key
+                canvas.itemconfigure(self._image_item, image=self._preview_base)
+            # Keep it centered (and underneath the arcs)
+            canvas.coords(self._image_item, cx, cy)
+            canvas.itemconfigure(self._image_item, state="normal")
+        else:
+            canvas.itemconfigure(self._image_item, state="hidden")
         scale = 0.1  # Adjust scale as needed.
 
-        # Draw an overlay for each beam row.
-        for row in self.rows:
-            if row is None:
+        # Keep one pie-slice polygon per sheet row; rows come and go via the sheet.
+        while len(self._row_items) < len(arcs):
+            # Preview overlay items are created once per row and only moved/recoloured on redraw
+            self._row_items.append(canvas.create_polygon(0, 0, 0, 0, fill="", outline="red",
+                                                         width=2, state="hidden"))
+        while len(self._row_items) > len(arcs):
+            canvas.delete(self._row_items.pop())
+
+        # Bound once: the row loop runs per redraw and these are all it calls
+        set_coords, configure, geometry = canvas.coords, canvas.itemconfigure, _beam_arc_geometry
+        for arc, item in zip(arcs, self._row_items):
+            # Nothing to draw without a range (or before the row ever parsed)
+            if arc is None or arc[2] <= 0:
+                configure(item, state="hidden")
                 continue
-            data = row["data"]
+
+            barrel_angle, arc_width, port_range, arc_color = arc
+            pixel_radius = port_range * scale
+            coords = [cx, cy]
+            append = coords.append
+            for ux, uy in geometry(barrel_angle, arc_width):
+                append(cx + pixel_radius * ux)
+                append(cy + pixel_radius * uy)
+
             try:
-                barrel_angle = float(data["barrel_angle"].get() or 0)
-                arc_width = float(data["arcwidth"].get() or 0)
-                port_range = float(data["range"].get() or 0)
-            except Exception as e:
-                print("Conversion error:", e)
+                set_coords(item, coords)
+                configure(item, outline=arc_color, state="normal")
+            except tk.TclError:
+                # Half-typed colour names are rejected by Tk; keep the previous look until valid
                 continue
 
-            arc_color = data.get("arccolor").get() or "red"
-            pixel_radius = port_range * scale
-            # Compute center angle (Tkinter's coordinate system starts at 3 o’clock).
-            center_angle = 90 - barrel_angle
-            # Define bounding box for the arc or circle.
-            x0, y0 = cx - pixel_radius, cy - pixel_radius
-            x1, y1 = cx + pixel_radius, cy + pixel_radius
-            
-            if arc_width >= 360:
-                # Draw a full circle.
-                self.preview_canvas.create_oval(x0, y0, x1, y1, outline=arc_color, width=2)
-                # Optional: draw a radial line to indicate the barrel angle.
-                angle_rad = math.radians(center_angle)
-                x_line = cx + pixel_radius * math.cos(angle_rad)
-                y_line = cy - pixel_radius * math.sin(angle_rad)
-                self.preview_canvas.create_line(cx, cy, x_line, y_line, fill=arc_color, width=2)
-            else:
-                # Draw arc.
-                start_angle = center_angle - (arc_width / 2)
-                self.preview_canvas.create_arc(x0, y0, x1, y1,
-                                               start=start_angle, extent=arc_width,
-                                               style="arc", outline=arc_color, width=2)
-                # Draw the two radial lines at the start and end of the arc.
-                start_rad = math.radians(start_angle)
-                end_rad = math.radians(start_angle + arc_width)
-                x_start = cx + pixel_radius * math.cos(start_rad)
-                y_start = cy - pixel_radius * math.sin(start_rad)
-                x_end = cx + pixel_radius * math.cos(end_rad)
-                y_end = cy - pixel_radius * math.sin(end_rad)
-                self.preview_canvas.create_line(cx, cy, x_start, y_start, fill=arc_color, width=2)
-                self.preview_canvas.create_line(cx, cy, x_end, y_end, fill=arc_color, width=2)
+    def add_row(self, values=None):
+        self.sheet.insert_row(list(values) if values is not None else list(self.default_row))
+        self._schedule_redraw()
 
-    
-    def add_row(self, row_data=None):
-        row_index = len(self.rows)
-        if row_data is None:
-            row_data = {
-                "x": tk.StringVar(value="0"),
-                "y": tk.StringVar(value="0"),
-                "z": tk.StringVar(value="0"),
-                "color": tk.StringVar(value=""),
-                "arccolor": tk.StringVar(value="red"),
-                "cycle_time": tk.StringVar(value="0"),
-                "damage_coeff": tk.StringVar(value="0"),
-                "range": tk.StringVar(value="0"),
-                "arcwidth": tk.StringVar(value="0"),
-                "barrel_angle": tk.StringVar(value="0")
-            }
-        entries = {}
-        col_fields = ["x", "y", "z", "color", "arccolor", "cycle_time", "damage_coeff", "range", "arcwidth", "barrel_angle"]
-        for col, field in enumerate(col_fields):
-            ent = ttk.Entry(self.frm_rows, textvariable=row_data[field], width=8)
-            ent.grid(row=row_index, column=col, padx=2, pady=2, sticky="ew")
-            self.frm_rows.grid_columnconfigure(col, weight=1, uniform="col")
-            entries[field] = ent
-            if field in ["range", "arcwidth", "barrel_angle", "arccolor"]:
-                ent.bind("<KeyRelease>", lambda e: self.update_beam_preview())
-        
-        btn_paste = ttk.Button(self.frm_rows, text="Paste Pos", command=lambda idx=row_index: self.paste_position(idx))
-        btn_paste.grid(row=row_index, column=len(col_fields), padx=2, pady=2, sticky="ew")
-        self.frm_rows.grid_columnconfigure(len(col_fields), weight=1, uniform="col")
-        
-        btn_remove = ttk.Button(self.frm_rows, text="Remove", command=lambda idx=row_index: self.remove_row(idx))
-        btn_remove.grid(row=row_index, column=len(col_fields)+1, padx=2, pady=2, sticky="ew")
-        self.frm_rows.grid_columnconfigure(len(col_fields)+1, weight=1, uniform="col")
-        
-        self.rows.append({
-            "data": row_data,
-            "widgets": entries,
-            "btn_paste": btn_paste,
-            "btn_remove": btn_remove
-        })
-        self.update_beam_preview()
+    def _selected_rows(self):
+        rows = self.sheet.get_selected_rows(get_cells_as_rows=True)
+        if not rows:
+            cur = self.sheet.get_currently_selected()
+            if cur:
+                rows = {cur.row}
+        return sorted(rows)
 
-    def paste_position(self, idx):
+    def paste_position(self, idx=None):
         """Accept legacy format "[x,y,z]," or plain raw numbers "x, y, z" / "x y z" / "x,y,z"."""
+        if idx is None:
+            selected = self._selected_rows()
+            if not selected:
+                messagebox.showerror("Error", "Select a beam port row to paste the position into.")
+                return
+            idx = selected[0]
         try:
-            clip = self.top.clipboard_get().strip()
-            # Drop trailing comma if present (legacy)
-            if clip.endswith(','):
-                clip = clip[:-1].strip()
-            # If bracketed, strip brackets
-            if clip.startswith('[') and clip.endswith(']'):
-                clip = clip[1:-1].strip()
-            # Split by comma or whitespace
-            parts = [p for p in clip.replace(',', ' ').split() if p]
-            if len(parts) != 3:
+            parts = _parse_clipboard_position(_clipboard_text(self.top))
+            if parts is None:
                 messagebox.showerror("Error", "Clipboard does not contain three numbers (x, y, z).")
                 return
-            x, y, z = parts[0], parts[1], parts[2]
-            self.rows[idx]["data"]["x"].set(x)
-            self.rows[idx]["data"]["y"].set(y)
-            self.rows[idx]["data"]["z"].set(z)
-            self.update_beam_preview()
+            for field, value in zip(("x", "y", "z"), parts):
+                self.sheet.set_cell_data(idx, self._col[field], value)
+            self.sheet.redraw()
+            self._schedule_redraw()
         except Exception as e:
             messagebox.showerror("Error", f"Error pasting position: {e}")
 
-    def remove_row(self, idx):
-        row = self.rows[idx]
-        if row is None:
+    def remove_selected_rows(self):
+        selected = self._selected_rows()
+        if not selected:
             return
-        for widget in row["widgets"].values():
-            widget.destroy()
-        row["btn_paste"].destroy()
-        row["btn_remove"].destroy()
-        self.rows[idx] = None
-        self.update_beam_preview()
+        self.sheet.del_rows(selected)
+        self._schedule_redraw()
 
     def on_ok(self):
         result = []
-        for row in self.rows:
-            if row is None:
-                continue
-            data = row["data"]
+        fields, types = self.col_fields, self.col_types
+        for values in self.sheet.get_sheet_data():
             try:
-                x = float(data["x"].get().strip())
-                y = float(data["y"].get().strip())
-                z = float(data["z"].get().strip())
-                cycle_time = int(data["cycle_time"].get().strip())
-                damage_coeff = float(data["damage_coeff"].get().strip())
-                range_val = int(data["range"].get().strip())
-                arcwidth = int(data["arcwidth"].get().strip())
-                barrel_angle = int(data["barrel_angle"].get().strip())
+                # One pass per row: each column goes through its converter exactly once
+                row = dict(zip(fields, (conv(str(v).strip()) for conv, v in zip(types, values))))
             except ValueError:
                 messagebox.showerror("Error", "Numeric values in beam ports must be valid numbers.")
                 return
             entry = {
-                "position": [x, y, z],
-                "color": data["color"].get().strip(),
-                "arccolor": data["arccolor"].get().strip(),
-                "cycle_time": cycle_time,
-                "damage_coeff": damage_coeff,
-                "range": range_val,
-                "arcwidth": arcwidth,
-                "barrel_angle": barrel_angle
+                "position": [row["x"], row["y"], row["z"]],
+                "color": row["color"],
+                "arccolor": row["arccolor"],
+                "cycle_time": row["cycle_time"],
+                "damage_coeff": row["damage_coeff"],
+                "range": row["range"],
+                "arcwidth": row["arcwidth"],
+                "barrel_angle": row["barrel_angle"]
             }
             result.append(entry)
         self.result = result
@@ -402,7 +554,9 @@ class EditExhaustPortsDialog:
         self.top = tk.Toplevel(parent)
         self.top.title("Edit Exhaust Ports")
         self.result = None
-        self.rows = []
+        # Live rows keyed by a monotonic id so removals never leave holes behind
+        self.rows = {}
+        self._next_row_id = 0
         
         # Define headers for the 4 data columns plus 2 action columns.
         self.headers = ["X", "Y", "Z", "Color", "Paste", "Remove"]
@@ -419,18 +573,20 @@ class EditExhaustPortsDialog:
         # Frame for data rows
         self.frm_rows = ttk.Frame(self.top)
         self.frm_rows.grid(row=1, column=0, sticky="ew", padx=2, pady=2)
+        # Column layout is a property of the frame; configure it once, not per row
+        for col in range(len(self.headers)):
+            self.frm_rows.grid_columnconfigure(col, weight=1, uniform="col")
         
         # Populate with existing data, if any; otherwise add one blank row.
         if current_list:
             for entry in current_list:
                 pos = entry.get("position", [0, 0, 0])
-                row_data = {
-                    "x": tk.StringVar(value=str(pos[0])),
-                    "y": tk.StringVar(value=str(pos[1])),
-                    "z": tk.StringVar(value=str(pos[2])),
-                    "color": tk.StringVar(value=entry.get("color", ""))
-                }
-                self.add_row(row_data)
+                self.add_row({
+                    "x": str(pos[0]),
+                    "y": str(pos[1]),
+                    "z": str(pos[2]),
+                    "color": entry.get("color", "")
+                })
         else:
             self.add_row()
 
@@ -450,90 +606,74 @@ class EditExhaustPortsDialog:
         self.top.wait_window(self.top)
     
     def add_row(self, row_data=None):
-        row_index = len(self.rows)
+        row_id = self._next_row_id
+        self._next_row_id += 1
         if row_data is None:
-            row_data = {
-                "x": tk.StringVar(value="0"),
-                "y": tk.StringVar(value="0"),
-                "z": tk.StringVar(value="0"),
-                "color": tk.StringVar(value="")
-            }
+            row_data = {"x": "0", "y": "0", "z": "0", "color": ""}
         entries = {}
         # Define the 4 data columns for Exhaust.
+        # Plain Entry text (no StringVar): values are read straight from the widgets.
         col_fields = ["x", "y", "z", "color"]
         for col, field in enumerate(col_fields):
-            ent = ttk.Entry(self.frm_rows, textvariable=row_data[field], width=8)
-            ent.grid(row=row_index, column=col, padx=2, pady=2, sticky="ew")
-            self.frm_rows.grid_columnconfigure(col, weight=1, uniform="col")
+            ent = ttk.Entry(self.frm_rows, width=8)
+            ent.insert(0, row_data[field])
+            ent.grid(row=row_id, column=col, padx=2, pady=2, sticky="ew")
             entries[field] = ent
         
         # Column for Paste button.
         btn_paste = ttk.Button(self.frm_rows, text="Paste Pos", 
-                                command=lambda idx=row_index: self.paste_position(idx))
-        btn_paste.grid(row=row_index, column=len(col_fields), padx=2, pady=2, sticky="ew")
-        self.frm_rows.grid_columnconfigure(len(col_fields), weight=1, uniform="col")
+                                command=lambda rid=row_id: self.paste_position(rid))
+        btn_paste.grid(row=row_id, column=len(col_fields), padx=2, pady=2, sticky="ew")
         
         # Column for Remove button.
         btn_remove = ttk.Button(self.frm_rows, text="Remove", 
-                                 command=lambda idx=row_index: self.remove_row(idx))
-        btn_remove.grid(row=row_index, column=len(col_fields)+1, padx=2, pady=2, sticky="ew")
-        self.frm_rows.grid_columnconfigure(len(col_fields)+1, weight=1, uniform="col")
+                                 command=lambda rid=row_id: self.remove_row(rid))
+        btn_remove.grid(row=row_id, column=len(col_fields)+1, padx=2, pady=2, sticky="ew")
         
-        self.rows.append({
-            "data": row_data,
+        self.rows[row_id] = {
             "widgets": entries,
             "btn_paste": btn_paste,
             "btn_remove": btn_remove
-        })
+        }
+        return row_id
     
-    def paste_position(self, idx):
+    def paste_position(self, row_id):
+        """Accept legacy format "[x,y,z]," or plain raw numbers "x, y, z" / "x y z" / "x,y,z"."""
         try:
-            clip = self.top.clipboard_get().strip()
-            if clip.endswith(','):
-                clip = clip[:-1].strip()
-            if clip.startswith("[") and clip.endswith("]"):
-                content = clip[1:-1].strip()
-                if content.endswith(','):
-                    content = content[:-1].strip()
-                parts = [p for p in content.split(",") if p.strip() != ""]
-                if len(parts) != 3:
-                    messagebox.showerror("Error", "Clipboard does not contain three numbers.")
-                    return
-                x, y, z = parts[0].strip(), parts[1].strip(), parts[2].strip()
-                self.rows[idx]["data"]["x"].set(x)
-                self.rows[idx]["data"]["y"].set(y)
-                self.rows[idx]["data"]["z"].set(z)
-            else:
-                messagebox.showerror("Error", "Clipboard content not in expected format (e.g. [ x, y, z ]).")
+            parts = _parse_clipboard_position(_clipboard_text(self.top))
+            if parts is None:
+                messagebox.showerror("Error", "Clipboard does not contain three numbers (x, y, z).")
+                return
+            widgets = self.rows[row_id]["widgets"]
+            for field, value in zip(("x", "y", "z"), parts):
+                widgets[field].delete(0, tk.END)
+                widgets[field].insert(0, value)
         except Exception as e:
             messagebox.showerror("Error", f"Error pasting position: {e}")
     
-    def remove_row(self, idx):
-        row = self.rows[idx]
+    def remove_row(self, row_id):
+        row = self.rows.pop(row_id, None)
         if row is None:
             return
         for widget in row["widgets"].values():
             widget.destroy()
         row["btn_paste"].destroy()
         row["btn_remove"].destroy()
-        self.rows[idx] = None
         
     def on_ok(self):
         result = []
-        for row in self.rows:
-            if row is None:
-                continue
-            data = row["data"]
+        for row in self.rows.values():
+            widgets = row["widgets"]
             try:
-                x = float(data["x"].get().strip())
-                y = float(data["y"].get().strip())
-                z = float(data["z"].get().strip())
+                x = float(widgets["x"].get().strip())
+                y = float(widgets["y"].get().strip())
+                z = float(widgets["z"].get().strip())
             except ValueError:
                 messagebox.showerror("Error", "Position values in exhaust ports must be valid numbers.")
                 return
             entry = {
                 "position": [x, y, z],
-                "color": data["color"].get().strip()
+                "color": widgets["color"].get().strip()
             }
             result.append(entry)
         self.result = result
@@ -1,160 +1,603 @@
 
 import os
+import sys
 import math
+import ctypes
+import hashlib
+import tempfile
+import threading
+from array import array
 import tkinter as tk
+from tkinter import messagebox
+import numpy as np
 from PIL import Image
 from pyopengltk import OpenGLFrame
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.error import GLError
+from OpenGL.GL import shaders
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Interleaved VBO layout: x, y, z, u, v, nx, ny, nz (float32)
+_VBO_STRIDE = 8 * 4
+_VBO_UV_OFFSET = ctypes.c_void_p(3 * 4)
+# Overlay stream buffer starts with room for 4096 lines (2 float32 xyz points each)
+_OVERLAY_INITIAL_BYTES = 4096 * 2 * 3 * 4
+
+
+# GLSL 1.20 keeps the fixed-function matrices/texcoords; only the UV toggles move to the GPU
+_UV_VERTEX_SHADER = """#version 120
+uniform bool uSwap;
+uniform bool uFlipU;
+uniform bool uFlipV;
+varying vec2 vTex;
+void main() {
+    vec2 uv = gl_MultiTexCoord0.xy;
+    if (uSwap) uv = uv.yx;
+    if (uFlipU) uv.x = 1.0 - uv.x;
+    if (uFlipV) uv.y = 1.0 - uv.y;
+    vTex = uv;
+    gl_FrontColor = gl_Color;
+    gl_Position = ftransform();
+}
+"""
+_UV_FRAGMENT_SHADER = """#version 120
+uniform sampler2D uTex;
+varying vec2 vTex;
+void main() {
+    gl_FragColor = texture2D(uTex, vTex) * gl_Color;
+}
+"""
+
+# Picking: meshes below this size are scanned linearly, larger ones through a BVH
+_BVH_MIN_TRIS = 1000
+_BVH_LEAF_SIZE = 8
+_RAY_EPS = 1e-8
+
+
+def _safe_inverse(rd):
+    """Per-axis 1/d for the slab test, with huge finite values instead of division by zero."""
+    return np.array([1.0 / d if abs(d) > 1e-12 else math.copysign(1e30, d) for d in rd])
+
+
+def _raycast_numpy(v0, v1, v2, ro, rd):
+    """Möller–Trumbore for every triangle at once; returns (t, index) of the nearest hit or None."""
+    e1 = v1 - v0
+    e2 = v2 - v0
+    pvec = np.cross(rd, e2)
+    det = np.einsum("ij,ij->i", e1, pvec)
+    ok = np.abs(det) >= _RAY_EPS
+    inv_det = np.divide(1.0, det, out=np.zeros_like(det), where=ok)
+    tvec = ro - v0
+    u = np.einsum("ij,ij->i", tvec, pvec) * inv_det
+    qvec = np.cross(tvec, e1)
+    v = (qvec @ rd) * inv_det
+    t = np.einsum("ij,ij->i", e2, qvec) * inv_det
+    ok &= (u >= 0.0) & (u <= 1.0) & (v >= 0.0) & (u + v <= 1.0) & (t > _RAY_EPS)
+    if not ok.any():
+        return None
+    idx = np.flatnonzero(ok)
+    best = idx[np.argmin(t[idx])]
+    return float(t[best]), int(best)
+
+
+def _build_bvh(v0, v1, v2):
+    """Median-split BVH over triangles, stored as parallel arrays.
+
+    Returns (bmin, bmax, left, right, start, count, order): node bounds, child
+    indices (-1 for leaves), each leaf's slice into `order`, and the triangle
+    permutation that makes every leaf contiguous.
+    """
+    tmin = np.minimum(np.minimum(v0, v1), v2)
+    tmax = np.maximum(np.maximum(v0, v1), v2)
+    centroid = (tmin + tmax) * 0.5
+    order = np.arange(len(v0))
+    bmin, bmax, left, right, start, count = [], [], [], [], [], []
+
+    def new_node(lo, hi):
+        idx = order[lo:hi]
+        bmin.append(tmin[idx].min(axis=0))
+        bmax.append(tmax[idx].max(axis=0))
+        left.append(-1); right.append(-1)
+        start.append(lo); count.append(hi - lo)
+        return len(bmin) - 1
+
+    stack = [new_node(0, len(order))]
+    while stack:
+        node = stack.pop()
+        lo, n = start[node], count[node]
+        if n <= _BVH_LEAF_SIZE:
+            continue
+        idx = order[lo:lo + n]
+        cen = centroid[idx]
+        axis = int(np.argmax(cen.max(axis=0) - cen.min(axis=0)))
+        mid = n // 2
+        order[lo:lo + n] = idx[np.argpartition(cen[:, axis], mid)]
+        left[node] = new_node(lo, lo + mid)
+        right[node] = new_node(lo + mid, lo + n)
+        count[node] = 0
+        stack.extend((left[node], right[node]))
+    return (np.array(bmin), np.array(bmax), np.array(left, dtype=np.int64),
+            np.array(right, dtype=np.int64), np.array(start, dtype=np.int64),
+            np.array(count, dtype=np.int64), order)
+
+
+def _slab_entry(bmin, bmax, ro, inv):
+    """Ray/AABB slab test; returns the entry distance or None when the box is missed."""
+    t1 = (bmin - ro) * inv
+    t2 = (bmax - ro) * inv
+    t_near = float(np.minimum(t1, t2).max())
+    t_far = float(np.maximum(t1, t2).min())
+    if t_far < max(t_near, 0.0):
+        return None
+    return t_near
+
+
+def _bvh_raycast_numpy(bvh, v0, v1, v2, ro, rd):
+    """Nearest hit through the BVH (NumPy leaf tests); returns (t, reordered index) or None."""
+    bmin, bmax, left, right, start, count, _ = bvh
+    inv = _safe_inverse(rd)
+    best = None
+    stack = [0]
+    while stack:
+        node = stack.pop()
+        t_near = _slab_entry(bmin[node], bmax[node], ro, inv)
+        if t_near is None or (best is not None and t_near > best[0]):
+            continue
+        if count[node]:
+            lo = start[node]
+            hi = lo + count[node]
+            hit = _raycast_numpy(v0[lo:hi], v1[lo:hi], v2[lo:hi], ro, rd)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = (hit[0], lo + hit[1])
+            continue
+        # Push the farther child first so the closer one is visited (and prunes) first
+        a, b = left[node], right[node]
+        ta = _slab_entry(bmin[a], bmax[a], ro, inv)
+        tb = _slab_entry(bmin[b], bmax[b], ro, inv)
+        if ta is not None and tb is not None and tb < ta:
+            a, b, ta, tb = b, a, tb, ta
+        if tb is not None:
+            stack.append(b)
+        if ta is not None:
+            stack.append(a)
+    return best
+
+
+if njit is not None:
+    _NJIT_CACHE = not getattr(sys, "frozen", False)
+    # fastmath minus the no-inf/no-nan assumptions: misses are reported as inf
+    _FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+    @njit(fastmath=_FASTMATH, cache=_NJIT_CACHE)
+    def _tri_hit(v0s, v1s, v2s, i, ro, rd):
+        """Möller–Trumbore for triangle i; returns t, or inf when missed."""
+        eps = 1e-8
+        e1x = v1s[i, 0] - v0s[i, 0]; e1y = v1s[i, 1] - v0s[i, 1]; e1z = v1s[i, 2] - v0s[i, 2]
+        e2x = v2s[i, 0] - v0s[i, 0]; e2y = v2s[i, 1] - v0s[i, 1]; e2z = v2s[i, 2] - v0s[i, 2]
+        px = rd[1]*e2z - rd[2]*e2y
+        py = rd[2]*e2x - rd[0]*e2z
+        pz = rd[0]*e2y - rd[1]*e2x
+        det = e1x*px + e1y*py + e1z*pz
+        if -eps < det < eps:
+            return np.inf
+        inv_det = 1.0 / det
+        tx = ro[0] - v0s[i, 0]; ty = ro[1] - v0s[i, 1]; tz = ro[2] - v0s[i, 2]
+        u = (tx*px + ty*py + tz*pz) * inv_det
+        if u < 0.0 or u > 1.0:
+            return np.inf
+        qx = ty*e1z - tz*e1y
+        qy = tz*e1x - tx*e1z
+        qz = tx*e1y - ty*e1x
+        v = (rd[0]*qx + rd[1]*qy + rd[2]*qz) * inv_det
+        if v < 0.0 or u + v > 1.0:
+            return np.inf
+        t = (e2x*qx + e2y*qy + e2z*qz) * inv_det
+        if t > eps:
+            return t
+        return np.inf
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=_NJIT_CACHE)
+    def _raycast_kernel(v0s, v1s, v2s, ro, rd):
+        """Linear scan over contiguous (n, 3) corner arrays; returns (t, index) or (-1, -1)."""
+        n = v0s.shape[0]
+        ts = np.empty(n)
+        for i in prange(n):
+            ts[i] = _tri_hit(v0s, v1s, v2s, i, ro, rd)
+        best = -1
+        best_t = np.inf
+        for i in range(n):
+            if ts[i] < best_t:
+                best_t = ts[i]
+                best = i
+        if best < 0:
+            return -1.0, -1
+        return best_t, best
+
+    @njit(cache=_NJIT_CACHE)
+    def _bvh_raycast_kernel(bmin, bmax, left, right, start, count, v0s, v1s, v2s, ro, rd, inv):
+        """Iterative BVH traversal, closer child first; returns (t, reordered index) or (-1, -1)."""
+        stack = np.empty(128, dtype=np.int64)
+        stack[0] = 0
+        top = 1
+        best = -1
+        best_t = np.inf
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            t_near = -np.inf
+            t_far = np.inf
+            for k in range(3):
+                t1 = (bmin[node, k] - ro[k]) * inv[k]
+                t2 = (bmax[node, k] - ro[k]) * inv[k]
+                t_near = max(t_near, min(t1, t2))
+                t_far = min(t_far, max(t1, t2))
+            if t_far < max(t_near, 0.0) or t_near > best_t:
+                continue
+            if count[node] > 0:
+                for i in range(start[node], start[node] + count[node]):
+                    t = _tri_hit(v0s, v1s, v2s, i, ro, rd)
+                    if t < best_t:
+                        best_t = t
+                        best = i
+                continue
+            # Children are pushed far-then-near by centre distance along the ray
+            a = left[node]
+            b = right[node]
+            da = 0.0
+            db = 0.0
+            for k in range(3):
+                da += (bmin[a, k] + bmax[a, k] - 2.0 * ro[k]) * rd[k]
+                db += (bmin[b, k] + bmax[b, k] - 2.0 * ro[k]) * rd[k]
+            if db < da:
+                a, b = b, a
+            stack[top] = b
+            stack[top + 1] = a
+            top += 2
+        if best < 0:
+            return -1.0, -1
+        return best_t, best
+else:
+    _raycast_kernel = None
+    _bvh_raycast_kernel = None
+
+
+# Parsed meshes are cached per user (never next to the game's OBJ files); bump on format change
+_OBJ_CACHE_VERSION = 4
+
+
+def _obj_cache_path(obj_path):
+    """Per-user .npz cache location for a parsed OBJ."""
+    root = (os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"))
+    digest = hashlib.sha1(os.path.abspath(obj_path).encode("utf-8")).hexdigest()[:20]
+    return os.path.join(root, "CosmosShipDataEditor", "objcache", digest + ".npz")
+
+
+def _decode_texture(path):
+    """Decode an image to (width, height, RGBA bytes)."""
+    # Load texture with PIL (Pillow-SIMD is a drop-in replacement if installed)
+    with Image.open(path) as img:
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        # Native row order; the V flip is applied to the texcoords (see _uv_toggles)
+        return img.size[0], img.size[1], img.tobytes()
+
+
+def _perspective_matrix(fovy_deg, aspect, near, far):
+    """gluPerspective as a column-major float32 array for glLoadMatrixf."""
+    f = 1.0 / math.tan(math.radians(fovy_deg) * 0.5)
+    m = np.zeros((4, 4), dtype=np.float32)
+    m[0, 0] = f / aspect
+    m[1, 1] = f
+    m[2, 2] = (far + near) / (near - far)
+    m[2, 3] = 2.0 * far * near / (near - far)
+    m[3, 2] = -1.0
+    return np.ascontiguousarray(m.T)
+
+
+def _view_matrix(yaw_deg, pitch_deg, zoom):
+    """T(0, 0, -zoom) . Rx(pitch) . Ry(yaw) as a column-major float32 array for glLoadMatrixf."""
+    cp, sp = math.cos(math.radians(pitch_deg)), math.sin(math.radians(pitch_deg))
+    cy, sy = math.cos(math.radians(yaw_deg)), math.sin(math.radians(yaw_deg))
+    rx = np.array([[1, 0, 0], [0, cp, -sp], [0, sp, cp]])
+    ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    m = np.identity(4, dtype=np.float32)
+    m[:3, :3] = rx @ ry
+    m[2, 3] = -zoom
+    return np.ascontiguousarray(m.T)
+
+
+def _count_lines(text, prefix):
+    """Number of lines starting with prefix (a pre-scan size hint; may undercount odd spacing)."""
+    return text.count("\n" + prefix) + text.startswith(prefix)
+
+
+def _parse_rows(rows, width):
+    """Parse the text after a 'v'/'vt'/'vn' tag into an (n, width) float64 array.
+
+    Extra columns (w, vertex colours) are ignored. Rows with fewer than `width` numbers
+    become zero rows rather than being dropped, so face indices (counted per row while
+    parsing) still line up with the array.
+    """
+    if not rows:
+        return np.zeros((0, width), dtype=np.float64)
+    parts = [r.split() for r in rows]
+    per_row = len(parts[0])
+    if per_row >= width and all(len(p) == per_row for p in parts):
+        # Uniform rows (the usual case): one conversion over the whole bucket
+        tokens = [t for p in parts for t in p]
+        arr = np.fromiter(map(float, tokens), dtype=np.float64, count=len(tokens))
+        return arr.reshape(len(rows), per_row)[:, :width]
+    out = np.zeros((len(rows), width), dtype=np.float64)
+    for i, p in enumerate(parts):
+        if len(p) >= width:
+            out[i] = [float(x) for x in p[:width]]
+    return out
+
+
+def _resolve_texture(base_dir, mtl_libs, used_mtls):
+    """Path of the first map_Kd among the used materials (in first-use order), or None.
+
+    Not part of the parsed-OBJ cache: the .mtl files and textures can change on their own.
+    """
+    mtl_map = {}  # name -> { 'map_Kd': path }
+    # Parse first mtl that has map_Kd; stop once every used material has been read
+    pending = set(used_mtls)
+    for mtl in mtl_libs:
+        if not pending:
+            break
+        mpath = os.path.join(base_dir, mtl)
+        if not os.path.exists(mpath):
+            continue
+        try:
+            with open(mpath, "r", encoding="utf-8", errors="ignore") as mf:
+                name = None
+                props = {}
+                for line in mf:
+                    parts = line.split(None, 1)
+                    if len(parts) < 2:
+                        continue
+                    if parts[0] == "newmtl":
+                        if name is not None:
+                            mtl_map[name] = props
+                            pending.discard(name)
+                            if not pending:
+                                name = None
+                                break
+                        name = parts[1].split()[0]
+                        props = {}
+                    elif parts[0] == "map_Kd":
+                        props["map_Kd"] = " ".join(parts[1].split())
+                if name is not None:
+                    mtl_map[name] = props
+                    pending.discard(name)
+        except Exception:
+            pass
+
+    # Try to pick a diffuse texture: pick the first map_Kd in the used material set
+    for m in used_mtls:
+        props = mtl_map.get(m, {})
+        if "map_Kd" in props:
+            tex = os.path.join(base_dir, props["map_Kd"])
+            return tex if os.path.exists(tex) else None
+    return None
 
-def _triangulate(indices):
-    # Fan triangulation: (0,i,i+1)
-    tris = []
-    for i in range(1, len(indices) - 1):
-        tris.append((indices[0], indices[i], indices[i+1]))
-    return tris
 
 class ObjModel:
+    __slots__ = ("positions", "uvs", "normals",
+                 "bounds_center", "bounds_radius", "center", "scale", "texture_path",
+                 "mtl_libs", "used_mtls", "_corners", "_bvh")
+
     def __init__(self):
-        self.v = []     # [(x,y,z)]
-        self.vt = []    # [(u,v)]
-        self.vn = []    # [(nx,ny,nz)]
-        # triangles as list of [(vi, ti, ni), (vi, ti, ni), (vi, ti, ni)]
-        self.triangles = []
-        self.bounds_center = (0.0, 0.0, 0.0)
-        self.bounds_radius = 1.0
-        self.center = (0.0, 0.0, 0.0)   # original OBJ centroid before normalization
-        self.scale  = 1.0               # normalization scale (1 / max_distance)
-        self.triangles = []
+        # Triangle soup, three consecutive rows per triangle (float32, the VBO layout)
+        self.positions = np.zeros((0, 3), dtype=np.float32)
+        self.uvs = np.zeros((0, 2), dtype=np.float32)
+        self.normals = np.zeros((0, 3), dtype=np.float32)
         self.bounds_center = (0.0, 0.0, 0.0)
         self.bounds_radius = 1.0
         self.center = (0.0, 0.0, 0.0)  # original OBJ centroid before normalization
         self.scale = 1.0  # normalization scale (1 / max_distance)
         self.texture_path = None
+        self.mtl_libs = ()   # mtllib file names, as listed in the OBJ
+        self.used_mtls = ()  # materials referenced by faces, in first-use order
+        self._corners = None
+        self._bvh = None
+
+    @property
+    def triangle_count(self):
+        return len(self.positions) // 3
+
+    def triangle_corners(self):
+        """Contiguous (n, 3) arrays of each triangle's three corners, built once per load."""
+        if self._corners is None:
+            tris = self.positions.reshape(-1, 3, 3)
+            self._corners = tuple(np.ascontiguousarray(tris[:, k]) for k in range(3))
+        return self._corners
+
+    def bvh(self):
+        """(node arrays, reordered corner arrays) for picking, built on first use."""
+        if self._bvh is None:
+            v0, v1, v2 = self.triangle_corners()
+            nodes = _build_bvh(v0, v1, v2)
+            order = nodes[-1]
+            self._bvh = (nodes, tuple(np.ascontiguousarray(c[order]) for c in (v0, v1, v2)))
+        return self._bvh
 
     def load(self, obj_path):
+        """Load an OBJ, reusing the per-user parsed cache when the file is unchanged."""
+        st = os.stat(obj_path)
+        stamp = np.array([_OBJ_CACHE_VERSION, st.st_mtime_ns, st.st_size], dtype=np.int64)
+        cache_path = _obj_cache_path(obj_path)
+        if self._load_cache(cache_path, stamp):
+            # Materials and textures can change without the OBJ changing, so re-resolve
+            self.texture_path = _resolve_texture(os.path.dirname(obj_path), self.mtl_libs, self.used_mtls)
+            return
+        self._parse(obj_path)
+        self._save_cache(cache_path, stamp)
+
+    def _load_cache(self, cache_path, stamp):
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                if not np.array_equal(data["stamp"], stamp):
+                    return False
+                self.__init__()
+                self.positions = data["positions"]
+                self.uvs = data["uvs"]
+                self.normals = data["normals"]
+                self.center = tuple(float(c) for c in data["center"])
+                self.scale = float(data["scale"])
+                self.mtl_libs = tuple(str(m) for m in data["mtl_libs"])
+                self.used_mtls = tuple(str(m) for m in data["used_mtls"])
+        except Exception:
+            return False
+        return True
+
+    def _save_cache(self, cache_path, stamp):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Write to a temp file in the same folder and rename, so readers never see a torn file
+            fd, tmp = tempfile.mkstemp(suffix=".npz", dir=os.path.dirname(cache_path))
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, stamp=stamp, positions=self.positions, uvs=self.uvs,
+                         normals=self.normals, center=np.array(self.center),
+                         scale=np.array(self.scale), mtl_libs=np.array(self.mtl_libs, dtype=str),
+                         used_mtls=np.array(self.used_mtls, dtype=str))
+            os.replace(tmp, cache_path)
+        except Exception as e:
+            print("Could not write OBJ cache:", e)
+
+    def _parse(self, obj_path):
         self.__init__()
         base_dir = os.path.dirname(obj_path)
         mtl_libs = []
         active_mtl = None
-        mtl_map = {}  # name -> { 'map_Kd': path }
 
+        # Vertex data is bucketed as raw text and converted per bucket with NumPy;
+        # faces are resolved on the fly against the running bucket sizes.
         with open(obj_path, "r", encoding="utf-8", errors="ignore") as f:
-            faces = []
-            for line in f:
-                if not line or line.startswith("#"):
+            text = f.read()
+        # Pre-scan: size the buckets up front and fill them by index (append only on overflow)
+        v_rows = [None] * _count_lines(text, "v ")
+        vt_rows = [None] * _count_lines(text, "vt ")
+        vn_rows = [None] * _count_lines(text, "vn ")
+        nv = nvt = nvn = 0
+        tri_idx = array("i")    # flat vi, ti, ni per triangle corner, -1 = missing
+        used_mtls = {}  # materials referenced by faces, in first-use order
+        lines = text.splitlines()
+        del text
+
+        def _idx(val, n):
+            """OBJ indices: positive are 1-based; negative are relative to the end."""
+            if not val:
+                return -1
+            i = int(val)
+            if i > 0:
+                return i - 1
+            if i < 0:
+                return n + i
+            return -1
+
+        sep = (" ", "\t")
+        for line in lines:
+            # Dispatch on the first character(s); only lines we use are ever split
+            if not line:
+                continue
+            c0 = line[0]
+            if c0 in sep:
+                line = line.lstrip()
+                if not line:
                     continue
-                parts = line.strip().split()
-                if not parts:
+                c0 = line[0]
+            if c0 == "v":
+                c1 = line[1:2]
+                if c1 in sep:
+                    if nv < len(v_rows):
+                        v_rows[nv] = line[2:]
+                    else:
+                        v_rows.append(line[2:])
+                    nv += 1
+                elif line[2:3] not in sep:
                     continue
-                tag = parts[0]
-                if tag == "v" and len(parts) >= 4:
-                    self.v.append(tuple(map(float, parts[1:4])))
-                elif tag == "vt" and len(parts) >= 3:
-                    u = float(parts[1]); v = float(parts[2])
-                    self.vt.append((u, v))
-                elif tag == "vn" and len(parts) >= 4:
-                    self.vn.append(tuple(map(float, parts[1:4])))
-                elif tag == "f" and len(parts) >= 4:
-                    fidx = []
-                    def _idx(val, n):
-                        """OBJ indices: positive are 1-based; negative are relative to the end."""
-                        if not val:
-                            return None
-                        i = int(val)
-                        if i > 0:
-                            return i - 1
-                        if i < 0:
-                            return n + i
-                        return None
-                    for p in parts[1:]:
-                        vi = ti = ni = None
-                        if "/" in p:
-                            toks = p.split("/")
-                            if len(toks) == 3:
-                                vi = _idx(toks[0], len(self.v))
-                                ti = _idx(toks[1], len(self.vt))
-                                ni = _idx(toks[2], len(self.vn))
-                            elif len(toks) == 2:
-                                vi = _idx(toks[0], len(self.v))
-                                ti = _idx(toks[1], len(self.vt))
-                            else:  # e.g., 'v//n'
-                                vi = _idx(toks[0], len(self.v))
-                        else:
-                            vi = _idx(p, len(self.v))
-                        fidx.append((vi, ti, ni, active_mtl))
-                    faces.append(fidx)
-                elif tag == "mtllib" and len(parts) >= 2:
-                    mtl_libs.extend(parts[1:])
-                elif tag == "usemtl" and len(parts) >= 2:
-                    active_mtl = parts[1]
-
-        # Parse first mtl that has map_Kd
-        for mtl in mtl_libs:
-            mpath = os.path.join(base_dir, mtl)
-            if not os.path.exists(mpath):
-                continue
-            try:
-                with open(mpath, "r", encoding="utf-8", errors="ignore") as mf:
-                    name = None
-                    props = {}
-                    for line in mf:
-                        parts = line.strip().split()
-                        if not parts:
-                            continue
-                        if parts[0] == "newmtl" and len(parts) >= 2:
-                            if name is not None:
-                                mtl_map[name] = props
-                            name = parts[1]
-                            props = {}
-                        elif parts[0] == "map_Kd" and len(parts) >= 2:
-                            props["map_Kd"] = " ".join(parts[1:])
-                    if name is not None:
-                        mtl_map[name] = props
-            except Exception:
-                pass
+                elif c1 == "t":
+                    if nvt < len(vt_rows):
+                        vt_rows[nvt] = line[3:]
+                    else:
+                        vt_rows.append(line[3:])
+                    nvt += 1
+                elif c1 == "n":
+                    if nvn < len(vn_rows):
+                        vn_rows[nvn] = line[3:]
+                    else:
+                        vn_rows.append(line[3:])
+                    nvn += 1
+            elif c0 == "f":
+                if line[1:2] not in sep:
+                    continue
+                toks_all = line[2:].split()
+                if len(toks_all) < 3:
+                    continue
+                face = []   # flat vi, ti, ni per polygon corner
+                for p in toks_all:
+                    toks = p.split("/")
+                    face.append(_idx(toks[0], nv))
+                    face.append(_idx(toks[1], nvt) if len(toks) >= 2 else -1)
+                    face.append(_idx(toks[2], nvn) if len(toks) >= 3 else -1)
+                # Fan triangulation (0, i, i+1), written straight into the int32 corner array
+                first = face[0:3]
+                for i in range(3, len(face) - 3, 3):
+                    tri_idx.extend(first)
+                    tri_idx.extend(face[i:i + 6])
+                if active_mtl and active_mtl not in used_mtls:
+                    used_mtls[active_mtl] = None
+            elif c0 == "m" or c0 == "u":
+                parts = line.split(None, 1)
+                if len(parts) < 2:
+                    continue
+                if parts[0] == "mtllib":
+                    mtl_libs.extend(parts[1].split())
+                elif parts[0] == "usemtl":
+                    active_mtl = parts[1].split()[0]
 
-        # Triangulate and build final list
-        tris = []
-        for poly in faces:
-            for a, b, c in _triangulate(poly):
-                tris.append([a, b, c])
+        # (n, 3) positions, (n, 2) texcoords, (n, 3) normals; only the triangle soup
+        # built from them below is kept on the model (and in the parsed cache)
+        v = _parse_rows(v_rows[:nv], 3)
+        vt = _parse_rows(vt_rows[:nvt], 2)
+        vn = _parse_rows(vn_rows[:nvn], 3)
 
         # Normalize / compute bounds (also record center/scale for overlay normalization)
-        if self.v:
-            xs, ys, zs = zip(*self.v)
-            cx = sum(xs)/len(xs)
-            cy = sum(ys)/len(ys)
-            cz = sum(zs)/len(zs)
-            centered = [(x-cx, y-cy, z-cz) for x,y,z in self.v]
-            max_d = max((x*x+y*y+z*z)**0.5 for x,y,z in centered) or 1.0
-            self.center = (cx, cy, cz)
-            self.scale  = 1.0 / max_d
-            self.v = [(x*self.scale, y*self.scale, z*self.scale) for x,y,z in centered]
+        # Center in place, take one sqrt of the largest squared distance, then scale
+        # straight into the float32 result (the VBO layout)
+        if len(v):
+            center = v.mean(axis=0)
+            v -= center
+            max_d = math.sqrt(float(np.einsum("ij,ij->i", v, v).max())) or 1.0
+            self.center = tuple(float(c) for c in center)
+            self.scale = 1.0 / max_d
             self.bounds_center = (0.0, 0.0, 0.0)
             self.bounds_radius = 1.0
+        v_scaled = np.empty(v.shape, dtype=np.float32)
+        np.multiply(v, self.scale, out=v_scaled, casting="same_kind")
+
+        # Expand indices to the triangle soup; bad/missing indices hit a default row.
+        # tri_idx holds (vi, ti, ni) per corner, -1 = missing
+        idx = np.frombuffer(tri_idx, dtype=np.intc).astype(np.int32).reshape(-1, 3)
+        self.positions = self._gather(v_scaled, idx[:, 0], (0.0, 0.0, 0.0))
+        self.uvs = self._gather(vt.astype(np.float32), idx[:, 1], (0.0, 0.0))
+        self.normals = self._gather(vn.astype(np.float32), idx[:, 2], (0.0, 0.0, 1.0))
+
+        self.mtl_libs = tuple(mtl_libs)
+        self.used_mtls = tuple(used_mtls)
+        self.texture_path = _resolve_texture(base_dir, self.mtl_libs, self.used_mtls)
 
-        # Convert maps to triangles
-        self.triangles = []
-        for tri in tris:
-            out = []
-            for (vi, ti, ni, mname) in tri:
-                vx = self.v[vi] if vi is not None and 0 <= vi < len(self.v) else (0.0, 0.0, 0.0)
-                vt = self.vt[ti] if ti is not None and 0 <= ti < len(self.vt) else (0.0, 0.0)
-                vn = self.vn[ni] if ni is not None and 0 <= ni < len(self.vn) else (0.0, 0.0, 1.0)
-                out.append((vx, vt, vn, mname))
-            self.triangles.append(out)
-
-        # Try to pick a diffuse texture: pick the first map_Kd in the used material set
-        used_mtls = [m for tri in self.triangles for (_,_,_,m) in tri if m]
-        tex = None
-        for m in used_mtls:
-            props = mtl_map.get(m, {})
-            if "map_Kd" in props:
-                tex = os.path.join(base_dir, props["map_Kd"])
-                break
-        self.texture_path = tex if tex and os.path.exists(tex) else None
+    @staticmethod
+    def _gather(table, idx, default):
+        padded = np.vstack([table.reshape(-1, len(default)), np.array([default], dtype=table.dtype)])
+        safe = np.where((idx >= 0) & (idx < len(table)), idx, len(table))
+        return padded[safe]
 
 
 class ObjTexturedGLFrame(OpenGLFrame):
@@ -170,9 +613,15 @@ class ObjTexturedGLFrame(OpenGLFrame):
 
         super().__init__(master, **kwargs)
         self.bg = bg
+        # Parse on a worker thread so big OBJs don't freeze Tk; an empty model stands in meanwhile
         self.model = ObjModel()
-        self.model.load(obj_path)
+        self._loading = True
+        self._load_result = None
+        self._texture_dirty = False
+        threading.Thread(target=self._bg_load, args=(obj_path,), daemon=True).start()
+        self.after(30, self._poll_load)
         self.texture_id = None
+        self._decoded_texture = None  # (key, width, height, RGBA bytes), see _load_texture
         self.fallback_texture = fallback_texture
         self.yaw = 30.0
         self.pitch = -15.0
@@ -185,10 +634,29 @@ class ObjTexturedGLFrame(OpenGLFrame):
         self.swap_uv = False # swap U<->V (rare but some exports do this)
         self.wrap_clamp = False  # False=REPEAT (default), True=CLAMP_TO_EDGE
         self._gl_ready = False # GL context readiness flag
+        # Mesh lives in one static VBO; re-uploaded only when the UV toggles change
+        self._vbo = None
+        self._vbo_count = 0
+        self._vbo_uv_key = None
+        # Beam/exhaust gizmo lines are streamed into their own dynamic VBO each frame
+        self._overlay_vbo = None
+        self._overlay_capacity = 0
+        # Projection/modelview matrices, rebuilt only when their inputs change
+        self._proj_key = None
+        self._proj_matrix = None
+        self._mv_key = None
+        self._mv_matrix = None
+        # UV shader for the textured pass; None means toggles are baked into the VBO instead
+        self._uv_program = None
+        self._uv_program_tried = False
+        self._uv_uniforms = {}
+        self._uv_uniform_key = None
         self.show_beams = True
+        self.show_wire_overlay = False  # faint wire pass over the textured mesh (one extra draw)
         self.show_exhaust = False
         self.overlay_provider = None  # callable returning dict with "beams"/"exhaust"
         self.animate = 1
+        self._redraw_pending = False  # input bursts collapse into one idle redraw
         self.after_idle(self.redraw)
         self.bind("<Enter>", lambda e: self.focus_set()) # Stop animation when widget is destroyed to avoid stray GL calls
         self.bind("<Destroy>", lambda e: self._on_destroy())
@@ -210,6 +678,38 @@ class ObjTexturedGLFrame(OpenGLFrame):
         # Keyboard
         self.bind_all("<Key>", self._on_key)
 
+    # ---- Background loading ----
+    def _bg_load(self, obj_path):
+        """Worker thread: parse (or read the cache) and pre-build picking data. No Tk/GL calls here."""
+        model = ObjModel()
+        try:
+            model.load(obj_path)
+            if model.triangle_count >= _BVH_MIN_TRIS:
+                model.bvh()
+            else:
+                model.triangle_corners()
+            self._load_result = (model, None)
+        except Exception as e:
+            self._load_result = (None, e)
+
+    def _poll_load(self):
+        # Tk is not thread-safe, so the Tk thread polls for the worker's result
+        if not self.winfo_exists():
+            return
+        result = self._load_result
+        if result is None:
+            self.after(30, self._poll_load)
+            return
+        model, error = result
+        self._loading = False
+        if error is not None:
+            messagebox.showerror("Textured 3D", f"Failed to load model:\n{error}", parent=self)
+            return
+        self.model = model
+        self._vbo_uv_key = None      # upload the real mesh on the next redraw
+        self._texture_dirty = True   # the model's own map_Kd may replace the fallback texture
+        self._schedule_redraw()
+
     # ---- Picking API ----
     def set_pick_callback(self, callback):
         """Provide a function (x,y,z)->None to receive picked coords in ORIGINAL OBJ space."""
@@ -278,6 +778,14 @@ class ObjTexturedGLFrame(OpenGLFrame):
         cz1 = -cx0 * sy + cz0 * cy
         ro = (cx1, cy0, cz1)              # ray origin (model space)
         rd = self._normalize((rx3, ry2, rz3))  # ray dir (model space)
+        # Cheap reject: the ray must pass through the mesh's bounding sphere
+        bc = self.model.bounds_center
+        r2 = self.model.bounds_radius ** 2
+        lx, ly, lz = bc[0] - ro[0], bc[1] - ro[1], bc[2] - ro[2]
+        tca = lx*rd[0] + ly*rd[1] + lz*rd[2]
+        l2 = lx*lx + ly*ly + lz*lz
+        if l2 - tca*tca > r2 or (tca < 0.0 and l2 > r2):
+            return None
         return self._raycast(ro, rd)
 
     def _normalize(self, v):
@@ -287,32 +795,32 @@ class ObjTexturedGLFrame(OpenGLFrame):
 
     def _raycast(self, ro, rd):
         """Intersect ray with all model triangles (normalized space). Return nearest hit or None."""
-        hit_t = None
-        hit_p = None
-        # Möller–Trumbore
-        EPS = 1e-8
-        for tri in self.model.triangles:
-            v0 = tri[0][0]; v1 = tri[1][0]; v2 = tri[2][0]
-            e1 = (v1[0]-v0[0], v1[1]-v0[1], v1[2]-v0[2])
-            e2 = (v2[0]-v0[0], v2[1]-v0[1], v2[2]-v0[2])
-            pvec = (rd[1]*e2[2]-rd[2]*e2[1], rd[2]*e2[0]-rd[0]*e2[2], rd[0]*e2[1]-rd[1]*e2[0])
-            det = e1[0]*pvec[0] + e1[1]*pvec[1] + e1[2]*pvec[2]
-            if -EPS < det < EPS:
-                continue
-            invDet = 1.0 / det
-            tvec = (ro[0]-v0[0], ro[1]-v0[1], ro[2]-v0[2])
-            u = (tvec[0]*pvec[0] + tvec[1]*pvec[1] + tvec[2]*pvec[2]) * invDet
-            if u < 0.0 or u > 1.0:
-                continue
-            qvec = (tvec[1]*e1[2]-tvec[2]*e1[1], tvec[2]*e1[0]-tvec[0]*e1[2], tvec[0]*e1[1]-tvec[1]*e1[0])
-            v = (rd[0]*qvec[0] + rd[1]*qvec[1] + rd[2]*qvec[2]) * invDet
-            if v < 0.0 or u + v > 1.0:
-                continue
-            t = (e2[0]*qvec[0] + e2[1]*qvec[1] + e2[2]*qvec[2]) * invDet
-            if t > EPS and (hit_t is None or t < hit_t):
-                hit_t = t
-                hit_p = (ro[0] + rd[0]*t, ro[1] + rd[1]*t, ro[2] + rd[2]*t)
-        return hit_p
+        model = self.model
+        if not model.triangle_count:
+            return None
+        ro = np.asarray(ro, dtype=np.float64)
+        rd = np.asarray(rd, dtype=np.float64)
+        if model.triangle_count < _BVH_MIN_TRIS:
+            # Small meshes: a straight scan beats building/walking the tree
+            v0, v1, v2 = model.triangle_corners()
+            if _raycast_kernel is not None:
+                hit_t, _ = _raycast_kernel(v0, v1, v2, ro, rd)
+                hit = (hit_t, 0) if hit_t >= 0.0 else None
+            else:
+                hit = _raycast_numpy(v0, v1, v2, ro, rd)
+        else:
+            nodes, (v0, v1, v2) = model.bvh()
+            if _bvh_raycast_kernel is not None:
+                bmin, bmax, left, right, start, count, _ = nodes
+                hit_t, _ = _bvh_raycast_kernel(bmin, bmax, left, right, start, count,
+                                               v0, v1, v2, ro, rd, _safe_inverse(rd))
+                hit = (hit_t, 0) if hit_t >= 0.0 else None
+            else:
+                hit = _bvh_raycast_numpy(nodes, v0, v1, v2, ro, rd)
+        if hit is None:
+            return None
+        hit_t = hit[0]
+        return (float(ro[0] + rd[0]*hit_t), float(ro[1] + rd[1]*hit_t), float(ro[2] + rd[2]*hit_t))
 
     def set_overlay_provider(self, provider):
         """Set a callback that returns overlay data.
@@ -335,7 +843,20 @@ class ObjTexturedGLFrame(OpenGLFrame):
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         self._gl_ready = True
 
-        # texture
+        self._apply_texture()
+
+        # pyopengltk re-runs initgl on every resize; the shader only needs building once
+        if not self._uv_program_tried:
+            self._uv_program_tried = True
+            self._uv_program = self._build_uv_program()
+
+        # simple lighting off (flat look). You can enable later if you add normals & lights.
+
+    def _apply_texture(self):
+        """(Re)upload the model's texture, or the fallback; needs a current GL context."""
+        self._texture_dirty = False
+        if self.texture_id is not None:
+            glDeleteTextures([self.texture_id])
         path = self.model.texture_path or self.fallback_texture
         if path and os.path.exists(path):
             self.texture_id = self._load_texture(path)
@@ -348,7 +869,50 @@ class ObjTexturedGLFrame(OpenGLFrame):
             self.texture_id = None
             glDisable(GL_TEXTURE_2D)
 
-        # simple lighting off (flat look). You can enable later if you add normals & lights.
+    def _build_uv_program(self):
+        """Compile the UV toggle shader, or return None if the driver can't (fallback: baked UVs)."""
+        try:
+            program = shaders.compileProgram(
+                shaders.compileShader(_UV_VERTEX_SHADER, GL_VERTEX_SHADER),
+                shaders.compileShader(_UV_FRAGMENT_SHADER, GL_FRAGMENT_SHADER))
+        except Exception as e:
+            print("UV shader unavailable, baking UV toggles into the VBO:", e)
+            return None
+        self._uv_uniforms = {name: glGetUniformLocation(program, name)
+                             for name in ("uSwap", "uFlipU", "uFlipV", "uTex")}
+        glUseProgram(program)
+        glUniform1i(self._uv_uniforms["uTex"], 0)
+        glUseProgram(0)
+        return program
+
+    def _uv_toggles(self):
+        # Textures are uploaded top row first (no flipped copy), so V is inverted once more here
+        return (self.swap_uv, self.flip_u, not self.flip_v)
+
+    def _upload_vbo(self, uv_key):
+        """(Re)build the interleaved vertex buffer from the model, baking in uv_key=(swap, flip_u, flip_v)."""
+        model = self.model
+        self._vbo_count = len(model.positions)
+        self._vbo_uv_key = uv_key
+        if not self._vbo_count:
+            return
+        swap_uv, flip_u, flip_v = uv_key
+        data = np.empty((self._vbo_count, 8), dtype=np.float32)
+        data[:, 0:3] = model.positions
+        uv = model.uvs.astype(np.float32)
+        if swap_uv:
+            uv = uv[:, ::-1]
+        if flip_u:
+            uv[:, 0] = 1.0 - uv[:, 0]
+        if flip_v:
+            uv[:, 1] = 1.0 - uv[:, 1]
+        data[:, 3:5] = uv
+        data[:, 5:8] = model.normals
+        if self._vbo is None:
+            self._vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
     def redraw(self):
         # Guard against redraws without a valid GL context or with tiny sizes
@@ -365,18 +929,26 @@ class ObjTexturedGLFrame(OpenGLFrame):
         except GLError:
             # Context not current (e.g., during teardown / reparent); skip this tick
             return
+        if self._loading:
+            # Background only until the mesh arrives (overlays need its center/scale)
+            return
+        if self._texture_dirty:
+            self._apply_texture()
 
         # Projection
+        if self._proj_key != aspect:
+            self._proj_key = aspect
+            self._proj_matrix = _perspective_matrix(45.0, aspect, 0.05, 100.0)
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45.0, aspect, 0.05, 100.0)
+        glLoadMatrixf(self._proj_matrix)
 
         # ModelView
+        mv_key = (self.yaw, self.pitch, self.zoom)
+        if self._mv_key != mv_key:
+            self._mv_key = mv_key
+            self._mv_matrix = _view_matrix(*mv_key)
         glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        glTranslatef(0, 0, -self.zoom)
-        glRotatef(self.pitch, 1, 0, 0)
-        glRotatef(self.yaw, 0, 1, 0)
+        glLoadMatrixf(self._mv_matrix)
 
         if self.wireframe:
             glDisable(GL_TEXTURE_2D)
@@ -387,37 +959,53 @@ class ObjTexturedGLFrame(OpenGLFrame):
                 glBindTexture(GL_TEXTURE_2D, self.texture_id)
             glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
 
-        # Draw
-        glBegin(GL_TRIANGLES)
-        for tri in self.model.triangles:
-            for (vx, vt, vn, m) in tri:
-                # Compute (u,v) with runtime toggles
-                u, v = vt[0], vt[1]
-                if self.swap_uv:
-                    u, v = v, u
-                if self.flip_u:
-                    u = 1.0 - u
-                if self.flip_v:
-                    v = 1.0 - v
-                glTexCoord2f(u, v)
-                glVertex3f(vx[0], vx[1], vx[2])
-        glEnd()
-
-        # Optional: overlay lines on top for clarity in textured mode
-        if not self.wireframe:
-            glDisable(GL_TEXTURE_2D)
-            glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            glLineWidth(1.0)
-            glColor4f(1,1,1,0.2)
-            glBegin(GL_TRIANGLES)
-            for tri in self.model.triangles:
-                for (vx, vt, vn, m) in tri:
-                    glVertex3f(vx[0], vx[1], vx[2])
-            glEnd()
-            glColor4f(1,1,1,1)
+        # Draw. With the UV shader the VBO holds raw UVs and the toggles are uniforms;
+        # without it they are baked into the VBO, which is rebuilt when they change.
+        toggles = self._uv_toggles()
+        use_shader = self._uv_program is not None and self.texture_id is not None and not self.wireframe
+        baked = (False, False, False) if self._uv_program is not None else toggles
+        if self._vbo_uv_key != baked:
+            self._upload_vbo(baked)
+        if self._vbo_count:
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+            glVertexPointer(3, GL_FLOAT, _VBO_STRIDE, None)
+            glTexCoordPointer(2, GL_FLOAT, _VBO_STRIDE, _VBO_UV_OFFSET)
+            if use_shader:
+                glUseProgram(self._uv_program)
+                if self._uv_uniform_key != toggles:
+                    for name, flag in zip(("uSwap", "uFlipU", "uFlipV"), toggles):
+                        glUniform1i(self._uv_uniforms[name], int(flag))
+                    self._uv_uniform_key = toggles
+            glDrawArrays(GL_TRIANGLES, 0, self._vbo_count)
+            if use_shader:
+                glUseProgram(0)
+            glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+
+            # Optional: overlay lines on top for clarity in textured mode
+            if self.show_wire_overlay and not self.wireframe:
+                glDisable(GL_TEXTURE_2D)
+                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
+                glLineWidth(1.0)
+                glColor4f(1,1,1,0.2)
+                glDrawArrays(GL_TRIANGLES, 0, self._vbo_count)
+                glColor4f(1,1,1,1)
+                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
         self._draw_overlays()
 
     # ---- Input ----
+    def _schedule_redraw(self):
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.redraw()
+
     def _on_drag_start(self, e):
         self._drag_last = (e.x, e.y)
 
@@ -430,7 +1018,7 @@ class ObjTexturedGLFrame(OpenGLFrame):
         self.yaw += dx * 0.5
         self.pitch += dy * 0.5
         self.pitch = max(-89.9, min(89.9, self.pitch))
-        self.after(0, self.redraw)
+        self._schedule_redraw()
 
     def _on_wheel(self, e):
         direction = 1 if e.delta > 0 else -1
@@ -439,7 +1027,7 @@ class ObjTexturedGLFrame(OpenGLFrame):
     def _zoom_dir(self, direction):
         factor = 0.9 if direction > 0 else 1.1
         self.zoom = max(0.5, min(10.0, self.zoom * factor))
-        self.after(0, self.redraw)
+        self._schedule_redraw()
 
     def _on_key(self, e):
         if e.char.lower() == 'w':
@@ -459,7 +1047,7 @@ class ObjTexturedGLFrame(OpenGLFrame):
          #       glBindTexture(GL_TEXTURE_2D, self.texture_id)
          #       glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE if self.wrap_clamp else GL_REPEAT)
          #       glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE if self.wrap_clamp else GL_REPEAT)
-        self.after(0, self.redraw)
+        self._schedule_redraw()
 
     def _on_destroy(self):
         # Prevent any further scheduled redraws from hitting a dead context
@@ -468,10 +1056,13 @@ class ObjTexturedGLFrame(OpenGLFrame):
 
     # ---- Texture helper ----
     def _load_texture(self, path):
-        # Load texture with PIL
-        img = Image.open(path).convert("RGBA")
-        img_data = img.tobytes("raw", "RGBA", 0, -1)
-        width, height = img.size
+        # initgl re-uploads on every resize: keep this viewer's decoded buffer (freed with
+        # the viewer), keyed by mtime/size so an edited file reloads
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        if self._decoded_texture is None or self._decoded_texture[0] != key:
+            self._decoded_texture = (key,) + _decode_texture(path)
+        _, width, height, img_data = self._decoded_texture
 
         tex_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, tex_id)
@@ -493,43 +1084,59 @@ class ObjTexturedGLFrame(OpenGLFrame):
         data = self.overlay_provider() if callable(self.overlay_provider) else None
         if not data:
             return
-        glDisable(GL_TEXTURE_2D)
-        glLineWidth(2.0)
         # Map model-native coords -> normalized viewer space (matches normalized mesh)
-        c = getattr(self.model, "center", (0.0, 0.0, 0.0))
-        s = getattr(self.model, "scale", 1.0)
-        def _norm_pt(pt):
-            x, y, z = pt
-            return ((x - c[0]) * s, (y - c[1]) * s, (z - c[2]) * s)
+        center = np.asarray(getattr(self.model, "center", (0.0, 0.0, 0.0)), dtype=np.float64)
+        scale = getattr(self.model, "scale", 1.0)
+
+        def _segments(gizmos):
+            """(2n, 3) start/end points for n gizmos, normalized in one broadcast."""
+            if not gizmos:
+                return np.zeros((0, 3), dtype=np.float32)
+            P = np.array([g.get("p", (0,0,0)) for g in gizmos], dtype=np.float64)
+            D = np.array([g.get("d", (0,0,1)) for g in gizmos], dtype=np.float64)
+            L = np.array([float(g.get("len", 0.3)) for g in gizmos])
+            start = (P - center) * scale
+            seg = np.empty((len(gizmos), 2, 3), dtype=np.float32)
+            seg[:, 0] = start
+            seg[:, 1] = start + D * L[:, None]
+            return seg.reshape(-1, 3)
+
+        # Beams in green, exhaust in orange: packed into one stream buffer, drawn as two ranges
+        beams = _segments(data.get("beams") if self.show_beams else None)
+        exhaust = _segments(data.get("exhaust") if self.show_exhaust else None)
+        if not len(beams) and not len(exhaust):
+            return
+        self._upload_overlay(np.concatenate((beams, exhaust)))
 
-        # Beams in green
-        if self.show_beams and data.get("beams"):
+        glDisable(GL_TEXTURE_2D)
+        glLineWidth(2.0)
+        glBindBuffer(GL_ARRAY_BUFFER, self._overlay_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        if len(beams):
             glColor4f(0.2, 1.0, 0.2, 1.0)
-            glBegin(GL_LINES)
-            for g in data.get("beams", []):
-                (x,y,z) = g.get("p", (0,0,0))
-                (dx,dy,dz) = g.get("d", (0,0,1))
-                L = float(g.get("len", 0.3))
-                nx, ny, nz = _norm_pt((x, y, z))
-                glVertex3f(nx, ny, nz)
-                glVertex3f(nx + dx*L, ny + dy*L, nz + dz*L)
-            glEnd()
-
-        # Exhaust in orange
-        if self.show_exhaust and data.get("exhaust"):
+            glDrawArrays(GL_LINES, 0, len(beams))
+        if len(exhaust):
             glColor4f(1.0, 0.6, 0.2, 1.0)
-            glBegin(GL_LINES)
-            for g in data.get("exhaust", []):
-                (x,y,z) = g.get("p", (0,0,0))
-                (dx,dy,dz) = g.get("d", (0,0,1))
-                L = float(g.get("len", 0.3))
-                nx, ny, nz = _norm_pt((x, y, z))
-                glVertex3f(nx, ny, nz)
-                glVertex3f(nx + dx*L, ny + dy*L, nz + dz*L)
-            glEnd()
+            glDrawArrays(GL_LINES, len(beams), len(exhaust))
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         glColor4f(1,1,1,1)
 
+    def _upload_overlay(self, points):
+        """Copy this frame's overlay line points into the persistent stream VBO."""
+        if self._overlay_vbo is None:
+            self._overlay_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._overlay_vbo)
+        if points.nbytes > self._overlay_capacity:
+            # Grow (doubling) and orphan the old storage; otherwise just overwrite in place
+            self._overlay_capacity = max(points.nbytes, 2 * self._overlay_capacity,
+                                         _OVERLAY_INITIAL_BYTES)
+            glBufferData(GL_ARRAY_BUFFER, self._overlay_capacity, None, GL_STREAM_DRAW)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, points.nbytes, points)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
 
 # Convenience window to test quickly
 def open_textured_viewer(obj_path, fallback_texture=None, title="Textured 3D Preview", size=(800,600)):
@@ -5,20 +5,35 @@ from PIL import Image, ImageTk
 import os
 import hjson
 import json  # used for strict JSON output
+try:
+    import orjson  # optional: faster strict-JSON read/write
+except ImportError:
+    orjson = None
 from datetime import datetime
+from collections import deque, OrderedDict
 try:
     from zoneinfo import ZoneInfo
 except Exception:
     ZoneInfo = None
 import math
 import re
+import functools
+import logging
+import queue
+import threading
 import subprocess
 import platform
 import sys
-import pyopengltk
+try:
+    import numpy as np
+except ImportError:
+    np = None
 import importlib
 import importlib.util
 
+# Per-beam diagnostics go through logging so the beam dict is only formatted when emitted
+log = logging.getLogger("shipeditor")
+
 # --- Load dialogs and OpenGL viewer from a sibling OrionData/ folder (no package needed) ---
 def _orion_sibling_dir():
     """Return absolute path to OrionData/ next to this script or the PyInstaller .exe."""
@@ -30,49 +45,396 @@ def _orion_sibling_dir():
         return os.path.join(os.getcwd(), "OrionData")
 
 def _load_module_from(path, modname):
+    # Registered in sys.modules like a normal import, so a second load is a dict lookup
+    mod = sys.modules.get(modname)
+    if mod is not None:
+        return mod
     spec = importlib.util.spec_from_file_location(modname, path)
     if spec and spec.loader:
         mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
+        sys.modules[modname] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except BaseException:
+            sys.modules.pop(modname, None)
+            raise
         return mod
     raise ImportError(f"Could not load module at {path}")
 
 _ORION_DIR = _orion_sibling_dir()
+_DLG_PATH, _VIEW_PATH = (os.path.join(_ORION_DIR, name) for name in ("dialogs.py", "obj_view_gl.py"))
 
 # dialogs.py (required)
-_DLG_PATH = os.path.join(_ORION_DIR, "dialogs.py")
 _dlg_mod  = _load_module_from(_DLG_PATH, "orion_dialogs")
 EditTorpedoDialog      = _dlg_mod.EditTorpedoDialog
 EditBeamPortsDialog    = _dlg_mod.EditBeamPortsDialog
 EditExhaustPortsDialog = _dlg_mod.EditExhaustPortsDialog
 NewShipDialog          = _dlg_mod.NewShipDialog
 
-# obj_view_gl.py (optional)
+# obj_view_gl.py (optional), loaded when the viewer is first opened: it pulls in
+# PyOpenGL, NumPy and numba, none of which startup needs
 ObjTexturedGLFrame = None
 OBJ_VIEW_GL_IMPORT_ERROR = None
-try:
-    _VIEW_PATH = os.path.join(_ORION_DIR, "obj_view_gl.py")
-    _view_mod  = _load_module_from(_VIEW_PATH, "orion_obj_view_gl")
-    ObjTexturedGLFrame = _view_mod.ObjTexturedGLFrame
-except Exception as e:
-    OBJ_VIEW_GL_IMPORT_ERROR = str(e)
+_VIEW_LOAD_TRIED = False
 
-    yaml = None
+def _load_obj_viewer():
+    """Return ObjTexturedGLFrame, loading obj_view_gl.py on first call (None if unavailable)."""
+    global ObjTexturedGLFrame, OBJ_VIEW_GL_IMPORT_ERROR, _VIEW_LOAD_TRIED
+    if not _VIEW_LOAD_TRIED:
+        _VIEW_LOAD_TRIED = True
+        try:
+            import pyopengltk  # also keeps it bundled in frozen builds
+            _view_mod  = _load_module_from(_VIEW_PATH, "orion_obj_view_gl")
+            ObjTexturedGLFrame = _view_mod.ObjTexturedGLFrame
+        except Exception as e:
+            OBJ_VIEW_GL_IMPORT_ERROR = str(e)
+    return ObjTexturedGLFrame
 
+# PyYAML (optional): the libyaml-backed loader reads YAML ship files for the UI;
+# ruamel round-trip parsing is deferred until the first save.
 try:
-    from ruamel.yaml import YAML
-    from ruamel.yaml.scalarstring import (
-        SingleQuotedScalarString as SQS,
-        DoubleQuotedScalarString as DQS,
-        PlainScalarString  as PSS,
-    )
+    import yaml
+    _YAML_FAST_LOADER = getattr(yaml, "CSafeLoader", None)
 except Exception:
-    YAML = None
-    SQS = DQS = PSS = str
+    yaml = None
+    _YAML_FAST_LOADER = None
+
+# ruamel.yaml (optional), imported on first round-trip use via _get_ruamel()
+YAML = None
+SQS = DQS = PSS = str
+_RUAMEL_TRIED = False
+
+def _get_ruamel():
+    """Return ruamel's YAML class (or None), importing it and the scalar-string types on first call."""
+    global YAML, SQS, DQS, PSS, _RUAMEL_TRIED
+    if not _RUAMEL_TRIED:
+        try:
+            from ruamel.yaml import YAML as _YAML
+            from ruamel.yaml.scalarstring import (
+                SingleQuotedScalarString as _SQS,
+                DoubleQuotedScalarString as _DQS,
+                PlainScalarString  as _PSS,
+            )
+            SQS, DQS, PSS = _SQS, _DQS, _PSS
+            YAML = _YAML
+        except Exception:
+            pass
+        # Set last: the load worker and the Tk thread may both get here
+        _RUAMEL_TRIED = True
+    return YAML
 
 # Try both package and top-level imports for the 3D viewer.
 # This avoids "unresolved reference" when the file lives under the shipEditor/ package.
 
+def _loads_hjson(text):
+    """Parse HJSON text, trying a strict (fast) JSON parser first; most files we write are plain JSON."""
+    try:
+        return orjson.loads(text) if orjson is not None else json.loads(text)
+    except ValueError:
+        return hjson.loads(text, object_pairs_hook=dict)
+
+def _dump_json_file(path, data):
+    """Write data as indented JSON (valid HJSON, so our own reads take the fast path)."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+def _write_text_file(path, text):
+    """
+    Write text as UTF-8 with a single os.write of the pre-encoded bytes, translating
+    newlines the way a text-mode open() would. The bytes go to a sibling .tmp file that
+    then replaces path, so an interrupted save never leaves a half-written ship file.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    data = memoryview(text.encode("utf-8"))
+    try:
+        mode = os.stat(path).st_mode & 0o777  # keep the existing file's permissions
+    except OSError:
+        mode = 0o644
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), mode)
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def _expand_leading_tabs(text):
+    """
+    Replace leading tabs with two spaces each (YAML forbids tab indentation).
+    Returns (fixed_text, had_tabs) from a single pass over the lines.
+    """
+    lines = text.split("\n")
+    had_tabs = False
+    for i, line in enumerate(lines):
+        if line[:1] == "\t":
+            body = line.lstrip("\t")
+            lines[i] = "  " * (len(line) - len(body)) + body
+            had_tabs = True
+    return "\n".join(lines), had_tabs
+
+# --- Surgical-save patterns: built once per key tuple instead of on every patch ---
+_COMMENT_RX = r'(?:\s*(?://[^\n]*|#[^\n]*|/\*.*?\*/))*'
+# Value token can be:
+#   - double-quoted string with escapes: " ... "
+#   - single-quoted string with escapes: ' ... '
+#   - bare token up to comma/brace/newline/bracket
+_VALUE_TOK_RX = r'(?:"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'+|[^,\r\n}\]]+)'
+
+def _key_alt(key_names):
+    return "|".join(re.escape(k) for k in key_names)
+
+@functools.lru_cache(maxsize=64)
+def _scalar_patch_rx(key_names):
+    """group(1): key + colon + comments/space; group(2): complete scalar token."""
+    key_alt = _key_alt(key_names)
+    return re.compile(rf'((?:"(?:{key_alt})"|(?:{key_alt}))\s*:\s*{_COMMENT_RX})({_VALUE_TOK_RX})',
+                      flags=re.M | re.S)
+
+@functools.lru_cache(maxsize=64)
+def _list_head_rx(key_names):
+    """Match the key and land just after colon+comments."""
+    key_alt = _key_alt(key_names)
+    return re.compile(rf'(?:"(?:{key_alt})"|(?:{key_alt}))\s*:\s*{_COMMENT_RX}', flags=re.M | re.S)
+
+# Bare ship-key token accepted by the surgical key scanner (letters/digits/_-.)
+_BARE_KEY_RX = re.compile(r'[A-Za-z0-9_\-.]*')
+_WS_RX = re.compile(r'\s*')
+_LINE_OPEN_BRACE_RX = re.compile(r'^\s*\{', flags=re.M)
+_BANNER_LINE_RX = re.compile(r'^(?P<indent>[ \t]*)"?#OrionShipEditor"\s*:\s*"(?:\\.|[^"\\])*"\s*,?\s*$',
+                             flags=re.M)
+# YAML-mode post-processing and key normalisation
+_SHIP_LIST_HEAD_RX = re.compile(r'(#ship-list|ship-list)\s*:\s*\[\s*')
+# Quoted string (unterminated runs to the end), bracket/comma, or a run of anything else
+_PP_TOKEN_RX = re.compile(r'"(?:\\.|[^"\\])*"?|\'(?:\\.|[^\'\\])*\'?|[{}\[\],]|[^"\'{}\[\],]+', re.S)
+_NON_IDENT_RX = re.compile(r'[^A-Za-z0-9_]')
+
+# One match per bracket: the regex engine (C) runs over plain text, complete strings and
+# comments, then captures the next bracket. A quote or '/*' that could not be closed, or
+# the end of the range, is captured instead and ends the scan.
+_SCAN_BRACKET_RX = re.compile(
+    r'[^"\'{}\[\]#/]*'
+    r'(?:(?:"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|//[^\n]*|#[^\n]*|/\*.*?\*/|/(?![/*]))[^"\'{}\[\]#/]*)*'
+    r'([{}\[\]]|["\']|/\*|\Z)',
+    flags=re.S)
+_BRACKETS = frozenset("{}[]")
+
+def _skip_ws_and_comments(text, i):
+    """
+    Index of the first character at or after i that is neither whitespace nor part of a
+    //, # or /* */ comment (len(text) if there is none). Jumps with regex/str.find.
+    """
+    n = len(text)
+    match_ws = _WS_RX.match
+    while True:
+        i = match_ws(text, i).end()
+        if i >= n:
+            return n
+        if text[i] == "#" or text.startswith("//", i):
+            nl = text.find("\n", i)
+            if nl == -1:
+                return n
+            i = nl + 1
+        elif text.startswith("/*", i):
+            close = text.find("*/", i + 2)
+            if close == -1:
+                return n
+            i = close + 2
+        else:
+            return i
+
+def _find_string_end(text, i, end):
+    """Index of the quote closing the string that opens at text[i], or -1 if unterminated."""
+    q = text[i]
+    j = i + 1
+    while True:
+        j = text.find(q, j, end)
+        if j == -1:
+            return -1
+        # an odd run of backslashes escapes the quote
+        k = j - 1
+        while text[k] == "\\":
+            k -= 1
+        if (j - 1 - k) % 2 == 0:
+            return j
+        j += 1
+
+def _scan_tokens(text, start=0, end=None):
+    """
+    Yield (pos, ch) for each bracket ({ } [ ]) in text[start:end], skipping quoted
+    strings and //, # and /* */ comments. An unterminated string or block comment ends
+    the scan.
+    """
+    if end is None:
+        end = len(text)
+    for m in _SCAN_BRACKET_RX.finditer(text, start, end):
+        ch = m.group(1)
+        if ch not in _BRACKETS:
+            return
+        yield m.start(1), ch
+
+# Backslash/quote escaping for text written inside "..." (one C-level pass)
+_JSON_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+def _quote_hjson_str(s):
+    return '"' + s.translate(_JSON_ESCAPE) + '"'
+
+# Scalar rendering for the surgical patcher: exact-type dispatch for the common leaves
+_SCALAR_REPR = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,  # keep floats as floats (avoid integerization surprises)
+    str: _quote_hjson_str,
+}
+
+# Top-level fields the ship-list index needs: identifier, side clustering, key casing
+_INDEX_FIELDS = frozenset(("Key", "key", "name", "Name", "side", "Side", "artfileroot", "Artfileroot"))
+_BLOCK_TOKEN_RX = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|//[^\n]*|#[^\n]*|/\*.*?\*/|[{}\[\]:,]',
+                             flags=re.S)
+
+def _decode_quoted(tok):
+    """Value of a quoted token, or None for escapes we leave to hjson."""
+    if "\\" not in tok:
+        return tok[1:-1]
+    if tok[0] != '"':
+        return None
+    try:
+        return json.loads(tok)
+    except ValueError:
+        return None
+
+def _extract_identifier_fast(block):
+    """
+    Read the top-level Key/name/side (and casing) fields of one { ... } ship block without
+    a full hjson parse. Returns a dict of the fields found, or None when one of them is not
+    a plain quoted string or no identifier is present, so the caller falls back to hjson.
+    """
+    if "'''" in block:
+        return None  # hjson multiline strings
+    fields = {}
+    depth = 0
+    last_end = 0       # end of the previous token, comments included
+    last_tok = None    # previous non-comment token
+    pending = None     # wanted key whose value comes next
+    expect_value = False
+    for m in _BLOCK_TOKEN_RX.finditer(block):
+        tok = m.group()
+        c = tok[0]
+        if c == "#" or c == "/":
+            last_end = m.end()
+            continue
+        if depth == 1:
+            between = block[last_end:m.start()]
+            if expect_value:
+                expect_value = False
+                bare = between.strip()
+                if bare:
+                    # Numbers/true/false/null end at the token; quoteless strings run to
+                    # end of line in hjson, which we leave to the real parser.
+                    try:
+                        json.loads(bare)
+                    except ValueError:
+                        return None
+                if pending is not None:
+                    if bare or (c != '"' and c != "'"):
+                        return None  # bare, numeric or structured value
+                    value = _decode_quoted(tok)
+                    if value is None:
+                        return None
+                    fields[pending] = value
+                    pending = None
+            if c == ":":
+                if last_tok is not None and last_tok[0] in "\"'" and not between.strip():
+                    key = _decode_quoted(last_tok)
+                else:
+                    key = between.rsplit("\n", 1)[-1].strip()
+                if key in _INDEX_FIELDS:
+                    pending = key
+                expect_value = True
+        if c == "{" or c == "[":
+            depth += 1
+        elif c == "}" or c == "]":
+            depth -= 1
+        last_end = m.end()
+        last_tok = tok
+    if pending is not None or not (fields.get("Key") or fields.get("key") or fields.get("name")):
+        return None
+    return fields
+
+_MISSING = object()
+
+def _first_value_for(obj, names):
+    """
+    Value of the first key in names met in document order (depth first, so a nested
+    key counts where it sits in the text), matching what the block patchers would hit.
+    Returns _MISSING when no such key exists.
+    """
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if k in names:
+                return v
+            found = _first_value_for(v, names)
+            if found is not _MISSING:
+                return found
+    elif isinstance(obj, list):
+        for v in obj:
+            found = _first_value_for(v, names)
+            if found is not _MISSING:
+                return found
+    return _MISSING
+
+def _same_json_value(a, b):
+    """Deep equality that also requires matching scalar types (1, 1.0 and True differ)."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same_json_value(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same_json_value(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+# Spellings of the ship-list key, in the order the surgical helpers prefer them
+_SHIP_LIST_KEYS = ('"#ship-list"', "'#ship-list'", '#ship-list',
+                   '"ship-list"',  "'ship-list'",  'ship-list')
+
+def _iter_ship_list_keys(text):
+    """
+    Yield (pos, key) for each spelling in _SHIP_LIST_KEYS that occurs in text, in that
+    order, pos being its first occurrence (what text.find(key) returns). Every spelling
+    contains 'ship-list', so one forward walk over those occurrences serves all six, and
+    it only goes as far as the spelling being asked for needs.
+    """
+    first = {}
+    scan = 0
+    for key in _SHIP_LIST_KEYS:
+        while key not in first and scan != -1:
+            p = text.find("ship-list", scan)
+            if p == -1:
+                scan = -1
+                break
+            scan = p + 9
+            first.setdefault("ship-list", p)
+            start = p
+            if p > 0 and text[p-1] == "#":
+                start = p - 1
+                first.setdefault("#ship-list", start)
+            q = text[scan:scan+1]
+            if start > 0 and q in ("'", '"') and text[start-1] == q:
+                first.setdefault(text[start-1:scan+1], start - 1)
+        if key in first:
+            yield first[key], key
+
 def _app_base_dir():
     """Best-guess base dir for this app (works for script and PyInstaller)."""
     try:
@@ -82,6 +444,9 @@ def _app_base_dir():
     except Exception:
         return os.getcwd()
 
+# Resolved once; the script/executable location doesn't change while running
+_APP_DIR = _app_base_dir()
+
 
 EDITOR_VERSION = "0.9.5"
 GAME_VERSION = "Artemis Cosmos v1.2.1"
@@ -89,6 +454,11 @@ HJSON_PATH = "shipData.json"
 YAML_PATH = "shipData.yaml"
 IMAGE_FOLDER = "graphics/ships/"
 IMAGE_SUFFIX = "256.png"
+THUMB_CACHE_SIZE = 32  # ship images kept decoded (each up to ~80% of the canvas, RGBA)
+try:
+    LOGO_RESAMPLE = Image.Resampling.LANCZOS  # Pillow v10+
+except AttributeError:
+    LOGO_RESAMPLE = Image.ANTIALIAS
 
     # NOTE: All reads/writes should go through _resolve_data_path so we can work inside
     # a user-chosen Cosmos *root* (folder with the game executable). Data lives in <root>/data/.
@@ -96,43 +466,98 @@ IMAGE_SUFFIX = "256.png"
 def normalize_angle(angle):
     return ((angle + 180) % 360) - 180
 
-def beam_overlaps_sector(barrel_angle, arc_width, sector_start, sector_end):
+def _angle_in_arc(angle, start, end):
+    """Is a normalized angle inside the normalized interval start..end on the circle?"""
+    if start <= end:
+        return start <= angle <= end
+    # Interval crosses the -180/180 boundary.
+    return angle >= start or angle <= end
 
-    # Normalize the beam's center
+def _beam_arc_points(barrel_angle, arc_width):
+    """Normalized (start, end, mid) of a beam's arc."""
     ba = normalize_angle(barrel_angle)
     half_width = arc_width / 2.0
-    # Compute the beam arc endpoints (normalize them)
-    beam_start = normalize_angle(ba - half_width)
-    beam_end = normalize_angle(ba + half_width)
-    
-    # Define a helper that tests if a given angle is within an interval on the circle.
-    def is_between(angle, start, end):
-        angle = normalize_angle(angle)
-        start = normalize_angle(start)
-        end = normalize_angle(end)
+    return (normalize_angle(ba - half_width), normalize_angle(ba + half_width), ba)
+
+def _arc_points_in_sector(points, sector_start, sector_end):
+    # For simplicity, we check if either endpoint or the midpoint of the beam is in the sector.
+    for angle in points:
+        if _angle_in_arc(angle, sector_start, sector_end):
+            return True
+    return False
+
+def beam_overlaps_sector(barrel_angle, arc_width, sector_start, sector_end):
+    return _arc_points_in_sector(_beam_arc_points(barrel_angle, arc_width),
+                                 normalize_angle(sector_start), normalize_angle(sector_end))
+
+# Forward/rear damage sectors, normalized once
+_FORWARD_SECTOR = (normalize_angle(-55), normalize_angle(55))
+_REAR_SECTOR = (normalize_angle(125), normalize_angle(235))
+
+
+# Below this many beams the plain loop beats building arrays
+_VECTOR_MIN_BEAMS = 32
+
+def _sector_mask(points, sector):
+    """Vectorized _arc_points_in_sector over arrays of normalized angles."""
+    start, end = sector
+    hit = np.zeros(len(points[0]), dtype=bool)
+    for angle in points:
         if start <= end:
-            return start <= angle <= end
+            hit |= (angle >= start) & (angle <= end)
         else:
-            # Interval crosses the -180/180 boundary.
-            return angle >= start or angle <= end
-    
-    # For simplicity, we check if either endpoint or the midpoint of the beam is in the sector.
-    beam_mid = normalize_angle(ba)
-    return (is_between(beam_start, sector_start, sector_end) or
-            is_between(beam_end, sector_start, sector_end) or
-            is_between(beam_mid, sector_start, sector_end))
+            hit |= (angle >= start) | (angle <= end)
+    return hit
 
+def _damage_statistics_numpy(beam_ports):
+    rows = []
+    for beam in beam_ports:
+        try:
+            cycle_time = float(beam.get("cycle_time", 0))
+            if cycle_time <= 0:
+                log.warning("Warning: cycle_time is 0 or negative in beam: %r", beam)
+            damage_coeff = float(beam.get("damage_coeff", 0))
+        except Exception as e:
+            log.warning("Error computing damage statistics for a beam port: %s", e)
+            continue
+        try:
+            barrel_angle = float(beam.get("barrel_angle", 0))
+            arc_width = float(beam.get("arcwidth", 0))
+        except Exception as e:
+            # Still counts toward the total, but not toward either sector (NaN never matches)
+            log.warning("Error computing damage statistics for a beam port: %s", e)
+            barrel_angle = arc_width = float("nan")
+        rows.append((cycle_time, damage_coeff, barrel_angle, arc_width))
+    if not rows:
+        return {"total_dpm": 0, "forward_dpm": 0, "rear_dpm": 0}
+    ct, dc, ba, aw = np.array(rows, dtype=np.float64).T
+    # Same rule as the scalar loop: no shots unless cycle_time > 0 (NaN included)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spm = np.where(ct > 0, np.floor(60.0 / ct), 0.0)
+    dpm = spm * dc
+    ba = (ba + 180.0) % 360.0 - 180.0
+    half_width = aw / 2.0
+    points = ((ba - half_width + 180.0) % 360.0 - 180.0,
+              (ba + half_width + 180.0) % 360.0 - 180.0,
+              ba)
+    return {
+        "total_dpm": float(dpm.sum()),
+        "forward_dpm": float(dpm[_sector_mask(points, _FORWARD_SECTOR)].sum()),
+        "rear_dpm": float(dpm[_sector_mask(points, _REAR_SECTOR)].sum())
+    }
 
 def calculate_damage_statistics(ship):
     total_dpm = 0
     forward_dpm = 0
     rear_dpm = 0
     beam_ports = ship.get("hull_port_sets", {}).get("beam Primary Beams", [])
+    if np is not None and len(beam_ports) >= _VECTOR_MIN_BEAMS:
+        return _damage_statistics_numpy(beam_ports)
     for beam in beam_ports:
         try:
             cycle_time = float(beam.get("cycle_time", 0))
             if cycle_time <= 0:
-                print("Warning: cycle_time is 0 or negative in beam:", beam)
+                log.warning("Warning: cycle_time is 0 or negative in beam: %r", beam)
             damage_coeff = float(beam.get("damage_coeff", 0))
             shots_per_minute = math.floor(60 / cycle_time) if cycle_time > 0 else 0
             beam_dpm = shots_per_minute * damage_coeff
@@ -140,18 +565,76 @@ def calculate_damage_statistics(ship):
 
             barrel_angle = float(beam.get("barrel_angle", 0))
             arc_width = float(beam.get("arcwidth", 0))
-            if beam_overlaps_sector(barrel_angle, arc_width, -55, 55):
+            points = _beam_arc_points(barrel_angle, arc_width)
+            if _arc_points_in_sector(points, *_FORWARD_SECTOR):
                 forward_dpm += beam_dpm
-            if beam_overlaps_sector(barrel_angle, arc_width, 125, 235):
+            if _arc_points_in_sector(points, *_REAR_SECTOR):
                 rear_dpm += beam_dpm
         except Exception as e:
-            print("Error computing damage statistics for a beam port:", e)
+            log.warning("Error computing damage statistics for a beam port: %s", e)
     return {
         "total_dpm": total_dpm,
         "forward_dpm": forward_dpm,
         "rear_dpm": rear_dpm
     }
 
+def _beam_overlay_numpy(rows):
+    """Vectorized tail of beam_overlay_geometry: every ray direction from one cos/sin call."""
+    colors, ranges, centers, widths = zip(*rows)
+    center = np.array(centers, dtype=np.float64)
+    width = np.array(widths, dtype=np.float64)
+    full = width >= 360
+    start = center - width / 2
+    # Full circles get a single ray at the centre angle; arcs get one along each edge
+    first = np.deg2rad(np.where(full, center, start))
+    second = np.deg2rad(start + width)
+    c1, s1 = np.cos(first).tolist(), np.sin(first).tolist()
+    c2, s2 = np.cos(second).tolist(), np.sin(second).tolist()
+    shapes = []
+    for i, (is_full, start_angle) in enumerate(zip(full.tolist(), start.tolist())):
+        if is_full:
+            shapes.append((colors[i], ranges[i], None, None, ((c1[i], s1[i]),)))
+        else:
+            shapes.append((colors[i], ranges[i], start_angle, widths[i],
+                           ((c1[i], s1[i]), (c2[i], s2[i]))))
+    return shapes
+
+def beam_overlay_geometry(ship):
+    """
+    Canvas-independent drawing data for the beam-field overlay, one tuple per beam:
+    (color, range, start_angle, extent, rays). Angles are Tk degrees (counter-clockwise
+    from east), extent is None for a full circle, and rays holds the (cos, sin) directions
+    of the lines drawn out from the ship's centre.
+    """
+    rows = []
+    beam_ports = ship.get("hull_port_sets", {}).get("beam Primary Beams", [])
+    for beam in beam_ports:
+        try:
+            barrel_angle = float(beam.get("barrel_angle", 0))
+            arc_width = float(beam.get("arcwidth", 0))
+            port_range = float(beam.get("range", 0))
+        except Exception as e:
+            log.warning("Error converting beam port values: %s", e)
+            continue
+        rows.append((beam.get("arccolor", "red"), port_range, 90 - barrel_angle, arc_width))
+    if np is not None and len(rows) >= _VECTOR_MIN_BEAMS:
+        return _beam_overlay_numpy(rows)
+
+    shapes = []
+    for arc_color, port_range, center_angle, arc_width in rows:
+        if arc_width >= 360:
+            angle_rad = math.radians(center_angle)
+            rays = ((math.cos(angle_rad), math.sin(angle_rad)),)
+            shapes.append((arc_color, port_range, None, None, rays))
+        else:
+            start_angle = center_angle - (arc_width / 2)
+            start_rad = math.radians(start_angle)
+            end_rad = math.radians(start_angle + arc_width)
+            rays = ((math.cos(start_rad), math.sin(start_rad)),
+                    (math.cos(end_rad), math.sin(end_rad)))
+            shapes.append((arc_color, port_range, start_angle, arc_width, rays))
+    return shapes
+
 
 class CreateToolTip(object):
     def __init__(self, widget, text='widget info'):
@@ -181,18 +664,28 @@ class CreateToolTip(object):
         x, y, cx, cy = self.widget.bbox("insert")
         x = x + self.widget.winfo_rootx() + 27
         y = y + self.widget.winfo_rooty() + cy + 27
-        self.tw = tk.Toplevel(self.widget)
-        self.tw.wm_overrideredirect(True)
+        if self.tw is None:
+            # Built on first hover, then only shown/hidden
+            self.tw = tk.Toplevel(self.widget)
+            self.tw.wm_overrideredirect(True)
+            label = tk.Label(self.tw, text=self.text, justify='left',
+                             background="#ffffe0", relief='solid', borderwidth=1,
+                             wraplength = self.wraplength)
+            label.pack(ipadx=1)
+            self.widget.bind("<Destroy>", self._on_widget_destroy, add="+")
         self.tw.wm_geometry("+%d+%d" % (x, y))
-        label = tk.Label(self.tw, text=self.text, justify='left',
-                         background="#ffffe0", relief='solid', borderwidth=1,
-                         wraplength = self.wraplength)
-        label.pack(ipadx=1)
+        self.tw.deiconify()
     def hidetip(self):
+        if self.tw is not None:
+            self.tw.withdraw()
+    def _on_widget_destroy(self, event=None):
         tw = self.tw
         self.tw = None
-        if tw:
-            tw.destroy()
+        if tw is not None:
+            try:
+                tw.destroy()
+            except tk.TclError:
+                pass
 
 # Dictionary mapping field keys to help tips.
 help_texts = {
@@ -229,16 +722,25 @@ help_texts = {
 
 # --- Main Ship Editor ---
 class ShipEditor:
+    _logo_photos = {}  # (path, size) -> PhotoImage; logos and sprites are resized once per session
+
+    @classmethod
+    def _load_logo(cls, path, size):
+        """
+        PhotoImage of the image at path resized to size (w, h). Decoded and resampled on
+        first use only; raises like Image.open when the file can't be read.
+        """
+        key = (path, size)
+        photo = cls._logo_photos.get(key)
+        if photo is None:
+            img = Image.open(path).resize(size, LOGO_RESAMPLE)
+            photo = cls._logo_photos[key] = ImageTk.PhotoImage(img)
+        return photo
 
     # -------------------- path helpers & Orion picker --------------------
     def _get_app_dir(self):
         """Directory of the running executable (PyInstaller) or this script."""
-        try:
-            if getattr(sys, "frozen", False):
-                return os.path.dirname(sys.executable)
-            return os.path.dirname(os.path.abspath(__file__))
-        except Exception:
-            return os.getcwd()
+        return _APP_DIR
 
     def _get_data_dir(self):
         """Return <cosmos_root>/data if a root is known; else CWD."""
@@ -268,6 +770,7 @@ class ShipEditor:
         Look for OrionData/Orion.hjson next to the editor executable.
         Return (orion_file_path, ordered list of (label, path)) or (None, []).
         """
+        self._orion_data = None  # parsed Orion.hjson, amended in memory by the picker
         base = self._get_app_dir()
         orion_dir = os.path.join(base, "OrionData")
         orion_file = os.path.join(orion_dir, "Orion.hjson")
@@ -275,12 +778,15 @@ class ShipEditor:
             return None, []
         try:
             with open(orion_file, "r", encoding="utf-8") as f:
-                data = hjson.load(f, object_pairs_hook=dict)
+                data = _loads_hjson(f.read())
+            if not isinstance(data, dict):
+                raise ValueError("top level is not a mapping")
         except Exception as e:
             # Don't block startup on a malformed Orion.hjson — we can still let the user browse.
             print(f"Warning: failed to parse Orion.hjson: {e}")
             return orion_file, []
 
+        self._orion_data = data
         paths = []
         pf = data.get("Pathfiles")
         # Accept both: Pathfiles: [{ Name: "C:/path", Name2: "D:/path" }, ...]
@@ -326,8 +832,7 @@ class ShipEditor:
                         if label:
                             os.makedirs(orion_dir, exist_ok=True)
                             data = {"Pathfiles": [{label: picked}]}
-                            with open(orion_path, "w", encoding="utf-8") as f:
-                                hjson.dump(data, f, ensure_ascii=False, indent=2)
+                            _dump_json_file(orion_path, data)
                             print(f"Created Orion.hjson at {orion_path} with entry '{label}': {picked}")
                 except Exception as e:
                     # Non-fatal: we still proceed with the chosen directory for this session.
@@ -351,10 +856,11 @@ class ShipEditor:
         sb.pack(side="right", fill="y")
         listbox.config(yscrollcommand=sb.set)
 
-        for label, pth in options:
-            listbox.insert(tk.END, f"{label} — {pth}")
+        # One variadic insert instead of a Tcl call per entry
+        listbox.insert(tk.END, *[f"{label} — {pth}" for label, pth in options])
 
         chosen = {"value": None}
+        orion_dirty = {"value": False}  # Orion.hjson is written once, after the picker closes
 
         def use_selected():
             sel = listbox.curselection()
@@ -371,27 +877,17 @@ class ShipEditor:
                 return
             # Offer to save this into Orion.hjson (only if we successfully read it).
             label = simpledialog.askstring("Name this path", "Give this install a name (e.g., 'Cosmos Main'):", parent=win)
-            save_ok = False
             if label:
-                try:
-                    with open(orion_file, "r", encoding="utf-8") as f:
-                        data = hjson.load(f, object_pairs_hook=dict)
-                    if not isinstance(data.get("Pathfiles"), list):
-                        data["Pathfiles"] = []
-                    # Append to the first mapping object if present, else create one.
-                    if data["Pathfiles"] and isinstance(data["Pathfiles"][0], dict):
-                        data["Pathfiles"][0][label] = directory
-                    else:
-                        data["Pathfiles"].append({label: directory})
-                    with open(orion_file, "w", encoding="utf-8") as f:
-                        hjson.dump(data, f, ensure_ascii=False, indent=2)
-                    # Update the UI list
-                    options.append((label, os.path.normpath(directory)))
-                    listbox.insert(tk.END, f"{label} — {os.path.normpath(directory)}")
-                    save_ok = True
-                except Exception as e:
-                    print(f"Note: could not update Orion.hjson: {e}")
-            if not save_ok:
+                data = self._orion_data
+                if not isinstance(data.get("Pathfiles"), list):
+                    data["Pathfiles"] = []
+                # Append to the first mapping object if present, else create one.
+                if data["Pathfiles"] and isinstance(data["Pathfiles"][0], dict):
+                    data["Pathfiles"][0][label] = directory
+                else:
+                    data["Pathfiles"].append({label: directory})
+                orion_dirty["value"] = True
+            else:
                 messagebox.showinfo("Using selection", "We'll use this folder for this session.")
             chosen["value"] = os.path.normpath(directory)
             win.destroy()
@@ -404,25 +900,31 @@ class ShipEditor:
 
         listbox.bind("<Double-1>", lambda _e: use_selected())
         win.wait_window()
+        if orion_dirty["value"]:
+            try:
+                _dump_json_file(orion_file, self._orion_data)
+            except Exception as e:
+                print(f"Note: could not update Orion.hjson: {e}")
+                messagebox.showinfo("Using selection", "We'll use this folder for this session.")
         return chosen["value"]
 
 
     def setup_easter_egg(self):
-        # Maintain a list to record key presses
-        self.easter_keys = []
         # Define your secret code sequence, e.g., Up Up Down Down Left Right Left Right B A
         self.secret_sequence = ["Up", "Up", "Down", "Down"]
+        self._secret_tuple = tuple(self.secret_sequence)
+        # Record the last few key presses; the deque drops the oldest in O(1)
+        self.easter_keys = deque(maxlen=len(self.secret_sequence))
         self.master.bind("<Key>", self.check_key_sequence)
 
     # Moved check_key_sequence out of setup_easter_egg
     def check_key_sequence(self, event):
         self.easter_keys.append(event.keysym)
-        if len(self.easter_keys) > len(self.secret_sequence):
-            self.easter_keys.pop(0)
-        if self.easter_keys == self.secret_sequence:
+        # Only a press of the final key can complete the sequence
+        if event.keysym == self._secret_tuple[-1] and tuple(self.easter_keys) == self._secret_tuple:
             messagebox.showinfo("Easter Egg!", "You have discovered the secret spaceship cache!")
             self.activate_easter_egg_mode()
-            self.easter_keys = []
+            self.easter_keys.clear()
 
     def activate_easter_egg_mode(self):
         import random
@@ -443,20 +945,12 @@ class ShipEditor:
         canvas_height = canvas.winfo_height() or h
 
         try:
-            try:
-                resample_mode = Image.Resampling.LANCZOS
-            except AttributeError:
-                resample_mode = Image.ANTIALIAS
-            fish_img = Image.open("OrionData/Fish.png")
-            fish_img = fish_img.resize((50, 50), resample_mode)
-            fish_photo = ImageTk.PhotoImage(fish_img)
+            fish_photo = self._load_logo("OrionData/Fish.png", (50, 50))
         except Exception as e:
             messagebox.showerror("Error", f"Error loading fish image: {e}")
             egg_window.destroy()
             return
 
-        egg_window.fish_photo = fish_photo
-
         num_fish = 10
         fish_objects = []
         for _ in range(num_fish):
@@ -465,180 +959,292 @@ class ShipEditor:
             dx = random.choice([-3, -2, -1, 1, 2, 3])
             dy = random.choice([-3, -2, -1, 1, 2, 3])
             fish_id = canvas.create_image(x, y, image=fish_photo)
-            fish_objects.append({"id": fish_id, "dx": dx, "dy": dy})
+            fish_objects.append({"id": fish_id, "x": x, "y": y, "dx": dx, "dy": dy})
 
         def animate():
+            if not egg_window.winfo_exists():
+                return
+            # Positions are tracked here, so each fish costs one canvas call per frame
             for obj in fish_objects:
-                coords = canvas.coords(obj["id"])
-                if not coords:
-                    continue
-                x, y = coords
-                new_x = x + obj["dx"]
-                new_y = y + obj["dy"]
+                new_x = obj["x"] + obj["dx"]
+                new_y = obj["y"] + obj["dy"]
+                wrapped = False
                 if new_x < 0:
-                    new_x = canvas_width
+                    new_x, wrapped = canvas_width, True
                 elif new_x > canvas_width:
-                    new_x = 0
+                    new_x, wrapped = 0, True
                 if new_y < 0:
-                    new_y = canvas_height
+                    new_y, wrapped = canvas_height, True
                 elif new_y > canvas_height:
-                    new_y = 0
-                canvas.coords(obj["id"], new_x, new_y)
-            egg_window.after(50, animate)
+                    new_y, wrapped = 0, True
+                if wrapped:
+                    canvas.coords(obj["id"], new_x, new_y)
+                else:
+                    canvas.move(obj["id"], obj["dx"], obj["dy"])
+                obj["x"], obj["y"] = new_x, new_y
+            # Wait 50 ms, then step once Tk is idle so a frame never cuts in front of input/redraws
+            egg_window.after(50, egg_window.after_idle, animate)
         animate()
         egg_window.after(30000, egg_window.destroy)
 
-    def load_data(self):
+    def load_data(self, on_loaded=None):
         """Load ship data from YAML (comment-preserving) if available, else legacy HJSON.
         If neither exists locally, fall back to OrionData/Orion.hjson → Pathfiles picker to locate a Cosmos *root*.
         When a root is chosen, ship files and graphics are looked up under <root>/data.
+
+        The file is located here (the folder picker needs the Tk thread), then read and parsed on a
+        worker thread so the window stays responsive; on_loaded() runs once the data is applied.
         """
         try:
             self._cosmos_root = None  # reset any previous root
+            add_default_ship = False
             # First try current working directory (legacy behavior for dev)
             local_yaml = os.path.join(os.getcwd(), YAML_PATH)
             local_hjson = os.path.join(os.getcwd(), HJSON_PATH)
             if os.path.exists(local_yaml):
-                # --- YAML/HJSON path ---
                 self.data_path = local_yaml
-                with open(local_yaml, "r", encoding="utf-8") as f:
-                    ytext = f.read()
-                self._raw_text = ytext  # keep original text for surgical mode
-                self._yaml_tab_fix_applied = False
-
-                if self._looks_hjsonish(ytext):
-                    # Surgical path: parse with hjson for UI data, but keep raw text for saves
-                    try:
-                        parsed = hjson.loads(ytext, object_pairs_hook=dict)
-                    except Exception as e:
-                        raise RuntimeError(f"HJSON-style parse failed: {e}")
-                    self._save_mode = "surgical"
-                    ship_list_key = "#ship-list" if "#ship-list" in parsed else "ship-list"
-                    self.ships_data = list(parsed.get(ship_list_key, []))
-                    self.header_data = {k: v for k, v in parsed.items() if k != ship_list_key}
-                else:
-                    # True YAML: ruamel round-trip
-                    if YAML is None:
-                        raise RuntimeError("ruamel.yaml is required for round-trip YAML. Install with: pip install ruamel.yaml")
-                    y = YAML(typ="rt")
-                    self._configure_yaml_emitter(y)
-                    try:
-                        doc = y.load(ytext) or {}
-                    except Exception:
-                        if "\t" in ytext:
-                            fixed = re.sub(r"^(?P<t>\t+)", lambda m: "  " * len(m.group("t")), ytext, flags=re.M)
-                            doc = y.load(fixed) or {}
-                            self._yaml_tab_fix_applied = True
-                        else:
-                            raise
-                    self._save_mode = "yaml"
-                    self._yaml_rt = y
-                    self._yaml_doc = doc
-                    ship_list_key = "#ship-list" if "#ship-list" in doc else "ship-list"
-                    if ship_list_key not in doc or doc.get(ship_list_key) is None:
-                        from ruamel.yaml.comments import CommentedSeq, CommentedMap
-                        if not isinstance(doc, dict):
-                            doc = CommentedMap(); self._yaml_doc = doc
-                        doc[ship_list_key] = CommentedSeq()
-                    self.ships_data = self._yaml_doc[ship_list_key]
-                    self.header_data = {k: v for k, v in self._yaml_doc.items() if k != ship_list_key}
-
             else:
                 # Nothing found locally — consult Orion.hjson
                 cosmos_dir = self._choose_cosmos_dir()
                 if not cosmos_dir:
                     raise FileNotFoundError(
                         "Could not find required data files and no Cosmos folder was selected.\n"
-                        f"Checked:\n  {self._abs(local_yaml)}\n  {self._abs(local_hjson)}"
+                        f"Checked:\n  {local_yaml}\n  {local_hjson}"
                     )
                 # From now on, resolve data files under <cosmos_root>/data
                 self._cosmos_root = cosmos_dir
-                data_dir = os.path.join(self._cosmos_root, "data")
+                data_dir = os.path.join(os.path.abspath(cosmos_dir), "data")
                 chosen_yaml = os.path.join(data_dir, YAML_PATH)
                 chosen_hjson = os.path.join(data_dir, HJSON_PATH)
                 if os.path.exists(chosen_yaml):
                     self.data_path = chosen_yaml
-
-                    with open(chosen_yaml, "r", encoding="utf-8") as f:
-                        ytext = f.read()
-                    self._raw_text = ytext
-                    self._yaml_tab_fix_applied = False
-
-                    if self._looks_hjsonish(ytext):
-                        # Surgical path for found file
-                        try:
-                            parsed = hjson.loads(ytext, object_pairs_hook=dict)
-                        except Exception as e:
-                            raise RuntimeError(f"HJSON-style parse failed: {e}")
-                        self._save_mode = "surgical"
-                        ship_list_key = "#ship-list" if "#ship-list" in parsed else "ship-list"
-                        self.ships_data = list(parsed.get(ship_list_key, []))
-                        self.header_data = {k: v for k, v in parsed.items() if k != ship_list_key}
-                    else:
-                        if YAML is None:
-                            raise RuntimeError("ruamel.yaml is required for round-trip YAML. Install with: pip install ruamel.yaml")
-                        y = YAML(typ="rt")
-                        self._configure_yaml_emitter(y)
-                        try:
-                            doc = y.load(ytext) or {}
-                        except Exception:
-                            if "\t" in ytext:
-                                fixed = re.sub(r"^(?P<t>\t+)", lambda m: "  " * len(m.group("t")), ytext, flags=re.M)
-                                doc = y.load(fixed) or {}
-                                self._yaml_tab_fix_applied = True
-                            else:
-                                raise
-                        self._save_mode = "yaml"
-                        self._yaml_rt = y
-                        self._yaml_doc = doc
-                        ship_list_key = "#ship-list" if "#ship-list" in doc else "ship-list"
-                        if ship_list_key not in doc or doc.get(ship_list_key) is None:
-                            from ruamel.yaml.comments import CommentedSeq, CommentedMap
-                            if not isinstance(doc, dict):
-                                doc = CommentedMap(); self._yaml_doc = doc
-                            doc[ship_list_key] = CommentedSeq()
-                        self.ships_data = self._yaml_doc[ship_list_key]
-                        self.header_data = {k: v for k, v in self._yaml_doc.items() if k != ship_list_key}
-
+                    # Ensure at least one ship exists (optional convenience)
+                    add_default_ship = True
                 elif os.path.exists(chosen_hjson):
                     raise FileNotFoundError(
                         "Found shipData.json but HJSON is no longer supported for ship data. "
                         "Please convert your data to shipData.yaml backed by ruamel-compatible YAML."
                     )
-
                 else:
                     raise FileNotFoundError(
                         "Could not find required data files inside the selected folder.\n"
-                        f"Selected folder (game root): {self._abs(cosmos_dir)}\n"
-                        f"Checked in data dir:\n  {self._abs(chosen_yaml)}\n  {self._abs(chosen_hjson)}"
+                        f"Selected folder (game root): {os.path.dirname(data_dir)}\n"
+                        f"Checked in data dir:\n  {chosen_yaml}\n  {chosen_hjson}"
                      )
-                # Ensure at least one ship exists (optional convenience)
-                if not self.ships_data:
-                    default_ship = {
-                        "name": "Unnamed Ship",
-                        "key": "unnamed",
-                        "side": "Independent",
-                        "artfileroot": "unknown",
-                        "meshscale": 1.0,
-                        "radarscale": 1.0,
-                        "exclusionradius": 0,
-                    }
-                    self.ships_data.append(default_ship)
-
-            # Set an env var so dialogs can resolve images under <root>/data, too.
-            try:
-                os.environ["COSMOS_DATA_DIR"] = os.path.abspath(self._get_data_dir())
-            except Exception:
-                pass
-            mode = "surgical" if self._save_mode == "surgical" else "YAML"
-            print(f"Loaded {len(self.ships_data)} ships from {self.data_path} ({mode}).")
         except Exception as e:
-            where = getattr(self, "data_path", self._resolve_data_path(HJSON_PATH))
-            awhere = self._abs(where)
-            print(f"Error loading data from {awhere}: {e}")
-            messagebox.showerror("Error", f"Failed to load data from:\n{awhere}\n\n{e}")
+            self._report_load_error(e)
             return
 
+        load_queue = queue.Queue()
+        self._data_loading = True
+        self._title_before_load = self.master.title()
+        self.master.title(f"{self._title_before_load} - Loading...")
+        self.master.config(cursor="watch")
+        threading.Thread(target=self._load_data_worker,
+                         args=(self.data_path, add_default_ship, load_queue), daemon=True).start()
+        self.master.after(50, self._poll_load_queue, load_queue, on_loaded)
+
+    def _load_data_worker(self, path, add_default_ship, load_queue):
+        """Worker thread: read and parse the ship file. No Tk calls here; the result goes on load_queue."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                ytext = f.read()
+            result = {"raw_text": ytext, "tab_fix": False,  # keep original text for surgical mode
+                      "line_break": "\r\n" if "\r\n" in ytext else "\n"}
+
+            if self._looks_hjsonish(ytext):
+                # Surgical path: parse with hjson for UI data, but keep raw text for saves
+                try:
+                    parsed = _loads_hjson(ytext)
+                except Exception as e:
+                    raise RuntimeError(f"HJSON-style parse failed: {e}")
+                ship_list_key = "#ship-list" if "#ship-list" in parsed else "ship-list"
+                result["save_mode"] = "surgical"
+                result["ship_list_key"] = ship_list_key
+                result["ships"] = list(parsed.get(ship_list_key, []))
+                result["root"] = parsed
+            elif _YAML_FAST_LOADER is not None:
+                # True YAML, read with libyaml; the ruamel round-trip doc is built on first save
+                try:
+                    doc = yaml.load(ytext, Loader=_YAML_FAST_LOADER) or {}
+                except Exception:
+                    fixed, had_tabs = _expand_leading_tabs(ytext)
+                    if not had_tabs:
+                        raise
+                    doc = yaml.load(fixed, Loader=_YAML_FAST_LOADER) or {}
+                    result["tab_fix"] = True
+                if not isinstance(doc, dict):
+                    doc = {}
+                ship_list_key = "#ship-list" if "#ship-list" in doc else "ship-list"
+                ships = doc.get(ship_list_key)
+                if not isinstance(ships, list):
+                    ships = []
+                result["save_mode"] = "yaml"
+                result["ship_list_key"] = ship_list_key
+                result["yaml_rt"] = None
+                result["yaml_doc"] = None
+                result["loaded_ships"] = list(ships)
+                result["ships"] = ships
+                result["root"] = doc
+            else:
+                # True YAML without libyaml: ruamel round-trip up front
+                if _get_ruamel() is None:
+                    raise RuntimeError("ruamel.yaml is required for round-trip YAML. Install with: pip install ruamel.yaml")
+                y = YAML(typ="rt")
+                self._configure_yaml_emitter(y)
+                try:
+                    doc = y.load(ytext) or {}
+                except Exception:
+                    fixed, had_tabs = _expand_leading_tabs(ytext)
+                    if not had_tabs:
+                        raise
+                    doc = y.load(fixed) or {}
+                    result["tab_fix"] = True
+                ship_list_key = "#ship-list" if "#ship-list" in doc else "ship-list"
+                if ship_list_key not in doc or doc.get(ship_list_key) is None:
+                    from ruamel.yaml.comments import CommentedSeq, CommentedMap
+                    if not isinstance(doc, dict):
+                        doc = CommentedMap()
+                    doc[ship_list_key] = CommentedSeq()
+                result["save_mode"] = "yaml"
+                result["ship_list_key"] = ship_list_key
+                result["yaml_rt"] = y
+                result["yaml_doc"] = doc
+                result["ships"] = doc[ship_list_key]
+                result["root"] = doc
+
+            if add_default_ship and not result["ships"]:
+                result["ships"].append({
+                    "name": "Unnamed Ship",
+                    "key": "unnamed",
+                    "side": "Independent",
+                    "artfileroot": "unknown",
+                    "meshscale": 1.0,
+                    "radarscale": 1.0,
+                    "exclusionradius": 0,
+                })
+            load_queue.put((True, result))
+        except Exception as e:
+            load_queue.put((False, e))
+
+    def _poll_load_queue(self, load_queue, on_loaded):
+        """Tk thread: wait for the worker, then apply its result (or report its error)."""
+        try:
+            ok, payload = load_queue.get_nowait()
+        except queue.Empty:
+            self.master.after(50, self._poll_load_queue, load_queue, on_loaded)
+            return
+        self._data_loading = False
+        self.master.title(self._title_before_load)
+        self.master.config(cursor="")
+        if not ok:
+            self._report_load_error(payload)
+            return
+        self._apply_loaded_data(payload)
+        if on_loaded is not None:
+            try:
+                on_loaded()
+            except Exception as e:
+                print(f"Error after loading data: {e}")
+                messagebox.showerror("Error", f"An error occurred while showing the loaded data: {e}")
+
+    def _apply_loaded_data(self, result):
+        """Install a parsed result from _load_data_worker on the editor (Tk thread)."""
+        self._raw_text = result["raw_text"]
+        # Edits keep the file's newline style, so this holds for every later _raw_text
+        self._raw_line_break = self._yaml_line_break = result["line_break"]
+        self._yaml_tab_fix_applied = result["tab_fix"]
+        self._save_mode = result["save_mode"]
+        if self._save_mode == "yaml":
+            self._yaml_rt = result["yaml_rt"]
+            self._yaml_doc = result["yaml_doc"]
+            self._loaded_ships = result.get("loaded_ships")
+        self.ships_data = result["ships"]
+        self._data_root = result["root"]
+        self._ship_list_key = result["ship_list_key"]
+        self._beam_cache.clear()
+
+        # Set an env var so dialogs can resolve images under <root>/data, too.
+        try:
+            os.environ["COSMOS_DATA_DIR"] = os.path.abspath(self._get_data_dir())
+        except Exception:
+            pass
+        mode = "surgical" if self._save_mode == "surgical" else "YAML"
+        print(f"Loaded {len(self.ships_data)} ships from {self.data_path} ({mode}).")
+
+    def _report_load_error(self, e):
+        where = getattr(self, "data_path", self._resolve_data_path(HJSON_PATH))
+        awhere = self._abs(where)
+        print(f"Error loading data from {awhere}: {e}")
+        messagebox.showerror("Error", f"Failed to load data from:\n{awhere}\n\n{e}")
+
+    @property
+    def header_data(self):
+        """Top-level entries other than the ship list, read from the parsed document on demand."""
+        return {k: v for k, v in self._data_root.items() if k != self._ship_list_key}
+
+    def _ensure_rt_doc(self):
+        """
+        YAML files are read with libyaml into plain dicts; saving needs the ruamel round-trip doc.
+        On first use, parse it from the raw text, fold the edits made since loading into its ship
+        nodes (only fields that differ from the file), then hand the nodes to the UI so later
+        edits go straight to the round-trip doc as before.
+        """
+        if self._save_mode != "yaml" or getattr(self, "_yaml_doc", None) is not None:
+            return
+        if _get_ruamel() is None:
+            raise RuntimeError("ruamel.yaml is required for round-trip YAML. Install with: pip install ruamel.yaml")
+        text = self._raw_text or ""
+        if self._yaml_tab_fix_applied:
+            text, _ = _expand_leading_tabs(text)
+        y = YAML(typ="rt")
+        self._configure_yaml_emitter(y)
+        doc = y.load(text) or {}
+        ship_list_key = "#ship-list" if "#ship-list" in doc else "ship-list"
+        if ship_list_key not in doc or doc.get(ship_list_key) is None:
+            from ruamel.yaml.comments import CommentedSeq, CommentedMap
+            if not isinstance(doc, dict):
+                doc = CommentedMap()
+            doc[ship_list_key] = CommentedSeq()
+        seq = doc[ship_list_key]
+
+        # Pristine values from the same loader as the UI, so unchanged fields compare equal
+        pristine = (yaml.load(text, Loader=_YAML_FAST_LOADER) or {}).get(ship_list_key) or []
+        loaded = self._loaded_ships or []
+        if not (len(loaded) == len(pristine) == len(seq)):
+            raise RuntimeError("Ship list changed shape between fast and round-trip YAML parsing.")
+        nodes = {}
+        for plain, orig, node in zip(loaded, pristine, seq):
+            changed = {k: v for k, v in plain.items() if k not in orig or orig[k] != v}
+            if changed:
+                self._rt_update_preserve(node, changed)
+            for k in orig:
+                if k not in plain:
+                    node.pop(k, None)
+            nodes[id(plain)] = node
+
+        # Ships deleted since loading leave the doc; new ones are appended as plain dicts
+        current = [nodes.get(id(ship), ship) for ship in self.ships_data]
+        keep = {id(node) for node in current}
+        for i in reversed(range(len(seq))):
+            if id(seq[i]) not in keep:
+                del seq[i]
+        in_seq = {id(node) for node in seq}
+        for ship in current:
+            if id(ship) not in in_seq:
+                seq.append(ship)
+
+        # Point the UI at the round-trip nodes
+        self.ships_data = seq
+        for group in self._side_groups.values():
+            group["ships"] = [nodes.get(id(ship), ship) for ship in group["ships"]]
+        self._ship_list_order = [nodes.get(id(ship), ship) for ship in self._ship_list_order]
+        self._data_root = doc
+        self._ship_list_key = ship_list_key
+        self._yaml_rt = y
+        self._yaml_doc = doc
+        self._loaded_ships = None
+
     # --- YAML emitter config (minimal): preserve quotes only ---
     def _configure_yaml_emitter(self, y):
         """
@@ -674,43 +1280,47 @@ class ShipEditor:
 
 
     # -------------------- HJSON-ish detection & surgical save helpers --------------------
+    # The ship-list key sits near the top of real files, so the sniff reads this much first
+    _SNIFF_HEAD = 4096
+
     def _looks_hjsonish(self, text: str) -> bool:
         """
         Treat file as HJSON/JSON only when the ship list uses a bracketed array
-        (…: [ … ]). Avoid regex: scan after the key to the first significant char.
+        (…: [ … ]). Decide from the head of the file when possible; scan it all only if
+        the head is inconclusive.
+        """
+        if len(text) > self._SNIFF_HEAD:
+            verdict = self._sniff_ship_list_bracket(text[:self._SNIFF_HEAD], partial=True)
+            if verdict is not None:
+                return verdict
+        return bool(self._sniff_ship_list_bracket(text, partial=False))
+
+    def _sniff_ship_list_bracket(self, text: str, partial: bool):
+        """
+        Avoid regex: scan after the key to the first significant char.
+        Returns True/False, or None when undecided (partial: text may be cut short).
         """
-        keys = ('"#ship-list"', "'#ship-list'", '#ship-list',
-                '"ship-list"',  "'ship-list'",  'ship-list')
         n = len(text)
-        for k in keys:
-            p = text.find(k)
-            if p == -1:
-                continue
+        for p, k in _iter_ship_list_keys(text):
             c = text.find(':', p + len(k))
             if c == -1:
+                if partial:
+                    return None
                 continue
-            i = c + 1
-            while i < n:
-                ch = text[i]
-                # whitespace
-                if ch.isspace():
-                    i += 1; continue
-                # // or # line comments
-                if text.startswith('//', i) or ch == '#':
-                    nl = text.find('\n', i)
-                    i = n if nl == -1 else nl + 1
-                    continue
-                # /* block comments */
-                if text.startswith('/*', i):
-                    end = text.find('*/', i + 2)
-                    i = n if end == -1 else end + 2
-                    continue
-                # first significant char
-                return ch == '['
-        return False
+            # first significant char after whitespace and comments
+            i = _skip_ws_and_comments(text, c + 1)
+            if i < n:
+                return text[i] == '['
+            if partial:
+                return None
+        return None if partial else False
 
     def _repr_hjson_scalar(self, v):
         """Conservative JSON/HJSON scalar repr without changing surrounding whitespace."""
+        fn = _SCALAR_REPR.get(type(v))
+        if fn is not None:
+            return fn(v)
+        # subclasses (ruamel scalar types, enums, ...) and everything else
         if isinstance(v, dict) or isinstance(v, list):
             # Handled by pretty printers (use wrappers below)
             raise TypeError("_repr_hjson_scalar received non-scalar")
@@ -720,8 +1330,7 @@ class ShipEditor:
             # Keep floats as floats (avoid integerization surprises)
             return str(v)
         # strings/other → JSON-quoted
-        s = str(v).replace("\\", "\\\\").replace('"', '\\"')
-        return f'"{s}"'
+        return _quote_hjson_str(str(v))
 
     # ---------- JSON/HJSON pretty printers (respect nesting) ----------
     def _repr_hjson_value_pretty(self, v, indent: str, step: str = "  ") -> str:
@@ -739,42 +1348,55 @@ class ShipEditor:
 
     def _repr_hjson_map_pretty(self, d: dict, indent: str, step: str = "  ") -> str:
         """Multi-line pretty map with keys as JSON strings."""
-        lines = ["{"]
-        inner = indent + step
-        for i, (k, val) in enumerate(d.items()):
-            key_str = '"' + str(k).replace('"', '\\"') + '"'
-            val_str = self._repr_hjson_value_pretty(val, inner, step)
-            # If value is multi-line, keep as-is; just prefix first line
-            if "\n" in val_str:
-                first, *rest = val_str.splitlines()
-                lines.append(f"{inner}{key_str}: {first}")
-                for r in rest:
-                    lines.append(f"{inner}{r}")
-                lines[-1] += ","  # comma after the block value
-            else:
-                lines.append(f"{inner}{key_str}: {val_str},")
-        # Remove trailing comma if we actually added any lines
-        if len(lines) > 1 and lines[-1].endswith(","):
-            lines[-1] = lines[-1][:-1]
-        lines.append(indent + "}")
-        return "\n".join(lines)
+        out = []
+        self._emit_hjson_map(d, indent, step, out, "")
+        return "".join(out)
 
     def _repr_hjson_list_pretty(self, arr: list, indent: str, step: str = "  ") -> str:
         """Multi-line pretty list; every element ends with a comma."""
-        lines = ["["]
+        out = []
+        self._emit_hjson_list(arr, indent, step, out, "")
+        return "".join(out)
+
+    # The emitters append pieces to one shared buffer. `lead` is the prefix the enclosing
+    # containers put in front of every continuation line, so nested values come out exactly
+    # as if rendered on their own and re-indented line by line.
+    def _emit_hjson_value(self, v, indent: str, step: str, out: list, lead: str) -> None:
+        # Plain leaves (the bulk of a ship) go straight through the scalar table
+        fn = _SCALAR_REPR.get(type(v))
+        if fn is None and isinstance(v, dict):
+            self._emit_hjson_map(v, indent, step, out, lead)
+        elif fn is None and isinstance(v, list):
+            self._emit_hjson_list(v, indent, step, out, lead)
+        else:
+            s = fn(v) if fn is not None else self._repr_hjson_value_pretty(v, indent, step)
+            # a line break inside a nested scalar is re-indented like any other line
+            if "\n" in s:
+                s = ("\n" + lead).join(s.splitlines())
+            out.append(s)
+
+    def _emit_hjson_map(self, d: dict, indent: str, step: str, out: list, lead: str) -> None:
+        out.append("{")
         inner = indent + step
+        child_lead = lead + inner
+        sep = "\n" + child_lead
+        for i, (k, val) in enumerate(d.items()):
+            key_str = _quote_hjson_str(str(k))
+            # comma after every entry but the last
+            out.append(("," if i else "") + sep + key_str + ": ")
+            self._emit_hjson_value(val, inner, step, out, child_lead)
+        out.append("\n" + lead + indent + "}")
+
+    def _emit_hjson_list(self, arr: list, indent: str, step: str, out: list, lead: str) -> None:
+        out.append("[")
+        inner = indent + step
+        child_lead = lead + inner
+        sep = "\n" + child_lead
         for v in arr:
-            v_str = self._repr_hjson_value_pretty(v, inner, step)
-            if "\n" in v_str:
-                first, *rest = v_str.splitlines()
-                lines.append(f"{inner}{first}")
-                for r in rest:
-                    lines.append(f"{inner}{r}")
-                lines[-1] += ","
-            else:
-                lines.append(f"{inner}{v_str},")
-        lines.append(indent + "]")
-        return "\n".join(lines)
+            out.append(sep)
+            self._emit_hjson_value(v, inner, step, out, child_lead)
+            out.append(",")
+        out.append("\n" + lead + indent + "]")
 
 
     def _repr_hjson_list(self, arr):
@@ -788,11 +1410,7 @@ class ShipEditor:
     # -------- Orion banner: replace-or-insert after the first '{' --------
     def _format_editor_banner_value(self) -> str:
         """Return the text that goes inside the quotes for #OrionShipEditor."""
-        try:
-            tz = ZoneInfo("Europe/London") if ZoneInfo else None
-        except Exception:
-            tz = None
-        ts = datetime.now(tz).strftime("%Y-%m-%d %H:%M:%S")
+        ts = datetime.now(self._banner_tz).strftime("%Y-%m-%d %H:%M:%S")
         return f" This file edited on {ts} by the Orion Ship Editor Program Version  {EDITOR_VERSION} for {GAME_VERSION}"
 
     def _upsert_editor_banner_simple(self, text: str) -> str:
@@ -800,154 +1418,153 @@ class ShipEditor:
         Replace existing "#OrionShipEditor": "..." line (anywhere), else insert a new one
         immediately after the first '{' in the file. Keeps the file's newline style.
         """
-        import re
-        lb = "\r\n" if "\r\n" in text else "\n"
-        banner = self._format_editor_banner_value().replace("\\", "\\\\").replace('"', '\\"')
+        edit = self._editor_banner_edit(text)
+        if edit is None:
+            return text  # not a JSON/HJSON-ish file; leave untouched
+        start, end, repl = edit
+        return text[:start] + repl + text[end:]
+
+    def _line_break_of(self, text: str) -> str:
+        """Line break (CRLF or LF) used by text; for the raw file it was decided at load."""
+        if text is self._raw_text and self._raw_line_break is not None:
+            return self._raw_line_break
+        return "\r\n" if "\r\n" in text else "\n"
+
+    def _editor_banner_edit(self, text: str):
+        """
+        The (start, end, replacement) edit _upsert_editor_banner_simple would make to text,
+        or None when there is no '{' to anchor a new banner to.
+        """
+        lb = self._line_break_of(text)
+        banner = self._format_editor_banner_value().translate(_JSON_ESCAPE)
         # 1) Replace existing line if present (preserve indentation)
-        rx = re.compile(r'^(?P<indent>[ \t]*)"?#OrionShipEditor"\s*:\s*"(?:\\.|[^"\\])*"\s*,?\s*$',
-                        flags=re.M)
-        if rx.search(text):
-            return rx.sub(lambda m: f'{m.group("indent")}"#OrionShipEditor": "{banner}",', text, count=1)
+        m = _BANNER_LINE_RX.search(text)
+        if m:
+            return (m.start(), m.end(), f'{m.group("indent")}"#OrionShipEditor": "{banner}",')
         # 2) Insert after the first '{'
         brace = text.find("{")
         if brace == -1:
-            return text  # not a JSON/HJSON-ish file; leave untouched
-        insert = f'{lb}  "#OrionShipEditor": "{banner}",'
-        return text[:brace+1] + insert + text[brace+1:]
+            return None
+        return (brace + 1, brace + 1, f'{lb}  "#OrionShipEditor": "{banner}",')
+
+    def _apply_edits(self, edits) -> None:
+        """
+        Apply (start, end, replacement) edits, all against the current self._raw_text, in a
+        single pass: the untouched slices and replacements are joined once instead of
+        copying the whole file per edit. Edits must not overlap.
+        """
+        edits = sorted(edits, key=lambda e: (e[0], e[1]))
+        text = self._raw_text
+        pieces = []
+        pos = 0
+        for start, end, repl in edits:
+            if start < pos:
+                raise ValueError(f"Overlapping raw-text edits at offset {start}.")
+            pieces.append(text[pos:start])
+            pieces.append(repl)
+            pos = end
+        pieces.append(text[pos:])
+        self._raw_text = "".join(pieces)
+        self._ship_span_index = None
+        self._key_span_index_cache = None
+
+    def _apply_edits_with_banner(self, edits) -> None:
+        """Apply edits together with the banner stamp, falling back to two passes if they collide."""
+        banner = self._editor_banner_edit(self._raw_text)
+        if banner is not None and any(s < banner[1] and banner[0] < e for s, e, _ in edits):
+            self._apply_edits(edits)
+            banner = self._editor_banner_edit(self._raw_text)
+            edits = []
+        self._apply_edits(list(edits) + [banner] if banner is not None else edits)
 
     def _find_ship_block_span(self, text: str, id_value: str):
         """
         Robustly find the { ... } block inside the ship list whose Key or name equals id_value.
         Strategy: narrow to the ship-list array, iterate top-level {…} entries by scanning braces
-        (quote-aware), parse each block with hjson to compare identifiers, return exact (start,end).
+        (quote-aware), read each block's identifier to compare, return exact (start,end).
+        The blocks are indexed once per raw text (see _ship_block_index).
+        """
+        _, by_ident = self._ship_block_index(text)
+        return by_ident.get(str(id_value))
+
+    def _ship_block_index(self, text: str):
+        """
+        Return (blocks, by_ident) for the ship list in text, where blocks is a list of
+        (b_start, b_end, data) with data the block's Key/name/side fields (the full hjson
+        parse when the fast reader gives up, None if unparseable) and by_ident
+        maps Key/key/name to the first matching (b_start, b_end).
+        Cached until the raw text object changes; insert/delete also drop it explicitly.
         """
+        if self._ship_span_index is not None and self._ship_span_index_text is text:
+            return self._ship_span_index
+        blocks = []
+        by_ident = {}
         region = self._extract_ship_list_region(text)
-        if not region:
-            return None
-        arr_start, arr_end = region
-        for b_start, b_end in self._iter_top_level_flow_maps(text, arr_start, arr_end):
-            block = text[b_start:b_end]
-            try:
-                data = hjson.loads(block, object_pairs_hook=dict)
-            except Exception:
-                # Skip blocks we can’t parse; they might be comments or malformed entries
-                continue
-            ident = str(data.get("Key") or data.get("key") or data.get("name") or "")
-            if ident == str(id_value):
-                return (b_start, b_end)
-        return None
+        if region:
+            arr_start, arr_end = region
+            for b_start, b_end in self._iter_top_level_flow_maps(text, arr_start, arr_end):
+                data = _extract_identifier_fast(text[b_start:b_end])
+                if data is None:
+                    try:
+                        data = _loads_hjson(text[b_start:b_end])
+                    except Exception:
+                        # Blocks we can’t parse might be comments or malformed entries
+                        blocks.append((b_start, b_end, None))
+                        continue
+                blocks.append((b_start, b_end, data))
+                ident = str(data.get("Key") or data.get("key") or data.get("name") or "")
+                by_ident.setdefault(ident, (b_start, b_end))
+        self._ship_span_index = (blocks, by_ident)
+        self._ship_span_index_text = text
+        return self._ship_span_index
 
     def _extract_ship_list_region(self, text: str):
         """
         Return (start,end) of the '#ship-list' / 'ship-list' array *including* brackets.
         Robust to quoted keys, comments, and newlines between ':' and '[' — no regex.
         """
-        keys = ('"#ship-list"', "'#ship-list'", '#ship-list',
-                '"ship-list"',  "'ship-list'",  'ship-list')
         n = len(text)
-        key_pos = -1
-        key_len = 0
-        for k in keys:
-            p = text.find(k)
-            if p != -1:
-                key_pos = p
-                key_len = len(k)
-                break
-        if key_pos == -1:
+        found = next(_iter_ship_list_keys(text), None)
+        if found is None:
             return None
+        key_pos, k = found
+        key_len = len(k)
         colon = text.find(':', key_pos + key_len)
         if colon == -1:
             return None
         # advance to first significant token after the colon
-        i = colon + 1
-        def skip_line_comment(j: int) -> int:
-            nl = text.find('\n', j)
-            return n if nl == -1 else nl + 1
-        def skip_block_comment(j: int) -> int:
-            end = text.find('*/', j + 2)
-            return n if end == -1 else end + 2
-        while i < n:
-            ch = text[i]
-            if ch.isspace():
-                i += 1; continue
-            if text.startswith('//', i) or ch == '#':
-                i = skip_line_comment(i); continue
-            if text.startswith('/*', i):
-                i = skip_block_comment(i); continue
-            if ch == '[':
-                break
-            # unexpected token
-            return None
+        i = _skip_ws_and_comments(text, colon + 1)
         if i >= n or text[i] != "[":
             return None
         # Balance brackets to find matching ']'
         arr_start = i
         depth = 0
-        in_dq = False
-        in_sq = False
-        esc = False
-        k = i
-        end = None
-        while k < n:
-            ch = text[k]
-            if not (in_dq or in_sq):
-                if text[k:k+2] == "//" or text[k] == "#":
-                    k = skip_line_comment(k); continue
-                if text[k:k+2] == "/*":
-                    k = skip_block_comment(k); continue
-            if in_dq or in_sq:
-                if esc:
-                    esc = False
-                elif ch == '\\\\':
-                    esc = True
-                elif in_dq and ch == '"':
-                    in_dq = False
-                elif in_sq and ch == "'":
-                    in_sq = False
-            else:
-                if ch == '"':
-                    in_dq = True
-                elif ch == "'":
-                    in_sq = True
-                elif ch == '[':
-                    depth += 1
-                elif ch == ']':
-                    depth -= 1
-                    if depth == 0:
-                        end = k + 1
-                        break
-            k += 1
-        if end is None:
-            return None
-        return (arr_start, end)
+        for p, ch in _scan_tokens(text, arr_start):
+            if ch == '[':
+                depth += 1
+            elif ch == ']':
+                depth -= 1
+                if depth == 0:
+                    return (arr_start, p + 1)
+        return None
 
     def _iter_top_level_flow_maps(self, text: str, start: int, end: int):
         """
         Yield (b_start,b_end) for each top-level '{...}' directly inside [start,end) range.
-        Quote-aware; ignores nested braces until balanced.
+        Quote- and comment-aware; ignores nested braces until balanced.
         """
-        i = start
-        in_q = None
         depth = 0
         b_start = None
-        while i < end:
-            ch = text[i]
-            if in_q:
-                if ch == in_q and text[i-1] != '\\':
-                    in_q = None
-            else:
-                if ch in ('"', "'"):
-                    in_q = ch
-                elif ch == '{':
-                    if depth == 0:
-                        b_start = i
-                    depth += 1
-                elif ch == '}':
-                    depth -= 1
-                    if depth == 0 and b_start is not None:
-                        yield (b_start, i + 1)
-                        b_start = None
-            i += 1
+        for i, ch in _scan_tokens(text, start, end):
+            if ch == '{':
+                if depth == 0:
+                    b_start = i
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0 and b_start is not None:
+                    yield (b_start, i + 1)
+                    b_start = None
 
     # ---------- Robust object finder: scan whole file for key=<value> and return the { ... } span ----------
     def _iter_object_spans_for_key(self, raw: str, wanted: str):
@@ -955,150 +1572,141 @@ class ShipEditor:
         Yield (start, end) offsets of top-level {...} objects that contain:
             key/Key : "wanted"  OR  'wanted'  OR  bare wanted
         Tolerates whitespace and //, #, and /* */ comments between ':' and the value.
-        Balances braces and respects strings.
-        """
-        import re
-
-        # Allow comments after colon
-        comment = r'(?:\s*(?://[^\n]*|#[^\n]*|/\*.*?\*/))*'
-        # Value can be "double-quoted", 'single-quoted', or a bare token (letters/digits/_-.)
-        val_alt = r'(?:"(?P<dval>[^"\\]*(?:\\.[^"\\]*)*)"|\'(?P<sval>[^\'\\]*(?:\\.[^\'\\]*)*)\'|(?P<bval>[A-Za-z0-9_\-\.]+))'
-        # Key name: key/Key, possibly quoted.  IMPORTANT: no prefix constraint.
-        # This lets us match keys even if they appear after comments, weird spacing, etc.
-        key_pat = re.compile(
-            rf'(?:"?[Kk]ey"?)\s*:\s*{comment}(?P<val>{val_alt})',
-            flags=re.DOTALL | re.MULTILINE,
-        )
+        Balances braces and respects strings. Only the #ship-list array is searched when
+        it can be located (the whole file otherwise). Served from _key_span_index.
+        """
+        spans = self._key_span_index(raw).get(wanted, ())
+        if self._debug_surgical:
+            print(f"[surgical] key='{wanted}' -> object bounds {spans}")
+        yield from spans
 
-        def skip_comment(i):
-            n = len(raw)
-            if raw[i:i+2] == "//" or raw[i] == "#":
-                while i < n and raw[i] != "\n":
-                    i += 1
-            return i
+    def _first_object_span_for_key(self, raw: str, wanted: str):
+        """First (start, end) _iter_object_spans_for_key would yield, or None."""
+        return next(self._iter_object_spans_for_key(raw, wanted), None)
 
-        def find_object_bounds(anchor: int):
+    def _key_span_index(self, raw: str):
+        """
+        Return {value: [(start, end), ...]} mapping every key/Key value in the ship list to
+        the { ... } objects holding it, in text order. One forward token scan pairs each
+        key with its innermost open brace; cached until the raw text object changes.
+        """
+        if self._key_span_index_cache is not None and self._key_span_index_text is raw:
+            return self._key_span_index_cache
+        n = len(raw)
+        lo, hi = self._extract_ship_list_region(raw) or (0, n)
+
+        def read_key_value(p: int):
             """
-            Find the { ... } bounds containing 'anchor'.
-            1) Try precise backward brace-walk to the opening '{.
-            2) If that fails, FALL BACK to nearest line-anchored.
-            Then do a robust forward balance with comment/string handling.
+            Parse `Key"? : <comments> value` starting at the 'Key'/'key' literal at p.
+            Returns (value, end) or None when no scalar value follows.
+            Key name: no prefix constraint, so keys are found even after comments,
+            weird spacing, etc.
             """
-            n = len(raw)
-            # ---------------- Backward precise walk ----------------
-            i = anchor
-            depth = 0
-            in_str = False
-            in_dq = False
-            in_sq = False
-            esc = False
-            start = None
-            while i >= 0:
-                ch = raw[i]
-                if in_dq or in_sq:
-                    if esc:
-                        esc = False
-                    elif ch == '\\':
-                        esc = True
-                    elif in_dq and ch == '"':
-                        in_dq = False
-                    elif in_sq and ch == "'":
-                        in_sq = False
+            j = p + 3
+            if j < n and raw[j] == '"':
+                j += 1
+            j = _WS_RX.match(raw, j).end()
+            if j >= n or raw[j] != ':':
+                return None
+            # Allow whitespace and comments after colon
+            j = _skip_ws_and_comments(raw, j + 1)
+            if j >= n:
+                return None
+            # Value can be "double-quoted", 'single-quoted', or a bare token
+            q = raw[j]
+            if q == '"' or q == "'":
+                k = _find_string_end(raw, j, n)
+                if k == -1:
+                    return None
+                return raw[j+1:k], k + 1
+            k = _BARE_KEY_RX.match(raw, j).end()
+            if k == j:
+                return None
+            return raw[j:k], k
+
+        def iter_key_values():
+            """Yield (start, end, value) for each key/Key anchor, found by literal search."""
+            pos = lo
+            next_upper = raw.find('Key', lo, hi)
+            next_lower = raw.find('key', lo, hi)
+            while next_upper != -1 or next_lower != -1:
+                if next_lower == -1 or (next_upper != -1 and next_upper < next_lower):
+                    p = next_upper
                 else:
-                    if ch == '"':
-                        in_dq = True
-                    elif ch == "'":
-                        in_sq = True
-                    elif ch == '}':
-                        depth += 1
-                    elif ch == '{':
-                        if depth == 0:
-                            start = i
-                            break
-                        depth -= 1
-                i -= 1
-            # ---------------- Fallback to nearest line-anchored '{' ----------------
-            if start is None:
-                # Find the nearest "{” that starts a line (ignores bracket noise in comments above)
-                import re
-                up_to = raw[:anchor]
-                m_last = None
-                for m in re.finditer(r'^\s*\{', up_to, flags=re.M):
-                    m_last = m
-                if m_last:
-                    start = m_last.end() - 1  # point at the '{'
+                    p = next_lower
+                hit = read_key_value(p)
+                if hit is None:
+                    pos = p + 1
                 else:
-                    return None
-
-            # ---------------- Forward robust balance ----------------
-            i = start
+                    value, pos = hit
+                    # Include an opening quote in the anchor, as for a quoted key
+                    start = p - 1 if p > 0 and raw[p-1] == '"' else p
+                    yield start, pos, value
+                if next_upper != -1 and next_upper < pos:
+                    next_upper = raw.find('Key', pos, hi)
+                if next_lower != -1 and next_lower < pos:
+                    next_lower = raw.find('key', pos, hi)
+
+        def fallback_bounds(anchor: int):
+            """
+            Bounds for a key with no '{' open before it: take the nearest line-anchored
+            '{' (ignores bracket noise in comments above) and balance forward from it.
+            """
+            m_last = None
+            for m in _LINE_OPEN_BRACE_RX.finditer(raw, lo, anchor):
+                m_last = m
+            if not m_last:
+                return None
+            start = m_last.end() - 1  # point at the '{'
             depth = 0
-            in_dq = False
-            in_sq = False
-            esc = False
-
-            def skip_line_comment(j):
-                # Skip //... or #... to end-of-line
-                while j < n and raw[j] != "\n":
-                    j += 1
-                return j
-            def skip_block_comment(j):
-                # Skip /* ... */ safely
-                j += 2  # after '/*'
-                while j < n-1:
-                    if raw[j] == '*' and raw[j+1] == '/':
-                        return j + 2
-                    j += 1
-                return n
-
-            while i < n:
-                ch = raw[i]
-                # comments only outside strings
-                if not (in_dq or in_sq):
-                    if raw[i:i+2] == "//" or raw[i] == "#":
-                        i = skip_line_comment(i); continue
-                    if raw[i:i+2] == "/*":
-                        i = skip_block_comment(i); continue
-                if in_dq or in_sq:
-                    if esc:
-                        esc = False
-                    elif ch == '\\':
-                        esc = True
-                    elif in_dq and ch == '"':
-                        in_dq = False
-                    elif in_sq and ch == "'":
-                        in_sq = False
-                else:
-                    if ch == '"':
-                        in_dq = True
-                    elif ch == "'":
-                        in_sq = True
-                    elif ch == '{':
-                        depth += 1
-                    elif ch == '}':
-                        depth -= 1
-                        if depth == 0:
-                            return (start, i + 1)
-                i += 1
+            for i, ch in _scan_tokens(raw, start, hi):
+                if ch == '{':
+                    depth += 1
+                elif ch == '}':
+                    depth -= 1
+                    if depth == 0:
+                        return (start, i + 1)
             return None
 
-        idx = 0
-        for m in key_pat.finditer(raw):
-            idx += 1
-            mv = m.group("dval") or m.group("sval") or m.group("bval") or ""
+        anchors = list(iter_key_values())
+        bounds = [None] * len(anchors)
+        waiting = {}    # offset of an open '{' -> anchors it is the innermost brace of
+        orphans = []
+        opened = []
+        a = 0
+
+        def assign(upto: int):
+            """Pair anchors before offset upto with the brace innermost at that point."""
+            nonlocal a
+            while a < len(anchors) and anchors[a][0] < upto:
+                if opened:
+                    waiting.setdefault(opened[-1], []).append(a)
+                else:
+                    orphans.append(a)
+                a += 1
+
+        for i, ch in _scan_tokens(raw, lo, hi):
+            assign(i + 1)
+            if ch == '{':
+                opened.append(i)
+            elif ch == '}' and opened:
+                start = opened.pop()
+                for k in waiting.pop(start, ()):
+                    bounds[k] = (start, i + 1)
+        assign(n + 1)
+        for k in orphans:
+            bounds[k] = fallback_bounds(anchors[k][0])
+
+        index = {}
+        for (m_start, m_end, mv), span in zip(anchors, bounds):
             if self._debug_surgical:
-                snippet = raw[max(0, m.start()-40): m.end()+40].replace("\n", "\\n")
-                print(f"[surgical] key-match#{idx}: found value='{mv}' wanted='{wanted}' at {m.start()}..{m.end()}  ctx='{snippet[:160]}...'")
-            if mv != wanted:
-                continue
-            bounds = find_object_bounds(m.start())
-            if bounds:
-                if self._debug_surgical:
-                    print(f"[surgical] key='{mv}' -> object bounds {bounds}")
-                yield bounds
-            elif self._debug_surgical:
-                print(f"[surgical] key='{mv}' but failed to find balanced object around index {m.start()}")
-
+                snippet = raw[max(0, m_start-40): m_end+40].replace("\n", "\\n")
+                print(f"[surgical] key-match: found value='{mv}' at {m_start}..{m_end} bounds={span} ctx='{snippet[:160]}...'")
+            if span:
+                index.setdefault(mv, []).append(span)
+        self._key_span_index_cache = index
+        self._key_span_index_text = raw
+        return index
 
     def _patch_scalar_in_block(self, block: str, key_names, value_str: str) -> tuple[str, int]:
         """
@@ -1107,17 +1715,7 @@ class ShipEditor:
         replaces the *entire* scalar value correctly even if it contains commas
         (e.g., "station,carrier") or escaped quotes.
         """
-        import re
-        key_alt = "|".join(re.escape(k) for k in key_names)
-        comment = r'(?:\s*(?://[^\n]*|#[^\n]*|/\*.*?\*/))*'
-        # Value token can be:
-        #   - double-quoted string with escapes: " ... "
-        #   - single-quoted string with escapes: ' ... '
-        #   - bare token up to comma/brace/newline/bracket
-        value_tok = r'(?:"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'+|[^,\r\n}\]]+)'
-        # group(1): key + colon + comments/space; group(2): complete scalar token
-        pattern = rf'((?:"(?:{key_alt})"|(?:{key_alt}))\s*:\s*{comment})({value_tok})'
-        rx = re.compile(pattern, flags=re.M | re.S)
+        rx = _scalar_patch_rx(tuple(key_names))
         def _repl(m):
             # Use function replacement to avoid \1 + digit being parsed as group 10, etc.
             return m.group(1) + value_str
@@ -1133,11 +1731,7 @@ class ShipEditor:
         Robust to whitespace/comments after ':', and to multi-line pretty-printed lists.
         Preserves trailing comma and any comments after the list by only replacing the bracketed region.
         """
-        import re
-        key_alt = "|".join(re.escape(k) for k in key_names)
-        comment = r'(?:\s*(?://[^\n]*|#[^\n]*|/\*.*?\*/))*'
-        # Find the key position and land just after colon+comments
-        head_rx = re.compile(rf'(?:"(?:{key_alt})"|(?:{key_alt}))\s*:\s*{comment}', flags=re.M | re.S)
+        head_rx = _list_head_rx(tuple(key_names))
         mh = head_rx.search(block)
         if not mh:
             return block, 0
@@ -1145,85 +1739,39 @@ class ShipEditor:
         n = len(block)
         # Determine current indentation (spaces before the '[' line)
         line_start = block.rfind("\n", 0, pos) + 1
-        base_indent = block[line_start:pos]
-        base_indent = re.match(r'[ \t]*', base_indent).group(0)
+        line = block[line_start:pos]
+        base_indent = line[:len(line) - len(line.lstrip(" \t"))]
         # Skip whitespace/comments until we hit the opening '['
-        i = pos
-        def skip_line_comment(j):
-            while j < n and block[j] != "\n":
-                j += 1
-            return j
-        def skip_block_comment(j):
-            j += 2
-            while j < n - 1:
-                if block[j] == "*" and block[j+1] == "/":
-                    return j + 2
-                j += 1
-            return n
-        while i < n:
-            ch = block[i]
-            if block[i:i+2] == "//" or block[i] == "#":
-                i = skip_line_comment(i); continue
-            if block[i:i+2] == "/*":
-                i = skip_block_comment(i); continue
-            if ch.isspace():
-                i += 1; continue
-            if ch == '[':
-                break
+        i = _skip_ws_and_comments(block, pos)
+        if i < n and block[i] != '[':
             # If we encounter something else (e.g., a scalar), fall back to scalar replacement
             if new_list_str is None and new_list_obj is not None:
                 # If the file unexpectedly holds a scalar, replace scalar with a proper list string
                 rendered = self._repr_hjson_list_pretty(new_list_obj, base_indent)
                 return self._patch_scalar_in_block(block, key_names, rendered)
             return self._patch_scalar_in_block(block, key_names, new_list_str or "[]")
-        if i >= n or block[i] != '[':
+        if i >= n:
             return block, 0
-        # Now balance brackets to find the matching ']'
+        # Now balance brackets to find the matching ']' (strings and comments skipped)
         start = i
         depth = 0
-        in_dq = False
-        in_sq = False
-        esc = False
-        j = i
-        while j < n:
-            ch = block[j]
-            # Handle comments only when outside strings
-            if not (in_dq or in_sq):
-                if block[j:j+2] == "//" or block[j] == "#":
-                    j = skip_line_comment(j); continue
-                if block[j:j+2] == "/*":
-                    j = skip_block_comment(j); continue
-            if in_dq or in_sq:
-                if esc:
-                    esc = False
-                elif ch == '\\':
-                    esc = True
-                elif in_dq and ch == '"':
-                    in_dq = False
-                elif in_sq and ch == "'":
-                    in_sq = False
-            else:
-                if ch == '"':
-                    in_dq = True
-                elif ch == "'":
-                    in_sq = True
-                elif ch == '[':
-                    depth += 1
-                elif ch == ']':
-                    depth -= 1
-                    if depth == 0:
-                        end = j + 1
-                        # Replace only the [ ... ] slice; keep any following comma/comments intact
-                        # If caller provided an object, render with file's indentation.
-                        if new_list_str is None and new_list_obj is not None:
-                            rendered = self._repr_hjson_list_pretty(new_list_obj, base_indent)
-                        else:
-                            rendered = new_list_str if new_list_str is not None else "[]"
-                        new_block = block[:start] + rendered + block[end:]
-                        if getattr(self, "_debug_surgical", False):
-                            print(f"[surgical]  patched list key(s) {key_names} -> {new_list_str} at slice {start}:{end}")
-                        return new_block, 1
-            j += 1
+        for j, ch in _scan_tokens(block, start):
+            if ch == '[':
+                depth += 1
+            elif ch == ']':
+                depth -= 1
+                if depth == 0:
+                    end = j + 1
+                    # Replace only the [ ... ] slice; keep any following comma/comments intact
+                    # If caller provided an object, render with file's indentation.
+                    if new_list_str is None and new_list_obj is not None:
+                        rendered = self._repr_hjson_list_pretty(new_list_obj, base_indent)
+                    else:
+                        rendered = new_list_str if new_list_str is not None else "[]"
+                    new_block = block[:start] + rendered + block[end:]
+                    if getattr(self, "_debug_surgical", False):
+                        print(f"[surgical]  patched list key(s) {key_names} -> {new_list_str} at slice {start}:{end}")
+                    return new_block, 1
         return block, 0
 
     # ---------- New ship insertion & deletion (surgical mode) ----------
@@ -1244,7 +1792,7 @@ class ShipEditor:
         """
         Return (base_indent, item_indent, linebreak) inferred from the #ship-list region.
         """
-        lb = "\r\n" if "\r\n" in raw else "\n"
+        lb = self._line_break_of(raw)
         # Indent of the line containing '['
         line_start = raw.rfind("\n", 0, arr_start) + 1
         base_indent = raw[line_start:arr_start]
@@ -1270,11 +1818,20 @@ class ShipEditor:
         ordered.update(d)
         return self._repr_hjson_map_pretty(ordered, item_indent[:-2] if len(item_indent) >= 2 else "")
 
-    def _surgical_insert_ship_block(self, ship: dict, cluster_by_side: bool = True) -> None:
+    def _surgical_insert_ship_block(self, ship: dict, cluster_by_side: bool = True) -> tuple[int, int, str]:
         """
-        Insert a new ship block into the raw text inside #ship-list.
-        If cluster_by_side is True, place the new entry after the last ship with the same 'side' (casefold);
-        otherwise append to the end of the array.
+        Return the (start, end, replacement) edit that inserts a new ship block into the raw
+        text inside #ship-list; apply it with _apply_edits. See _surgical_insert_ships.
+        """
+        return self._surgical_insert_ships([ship], cluster_by_side)[0]
+
+    def _surgical_insert_ships(self, ships: list, cluster_by_side: bool = True) -> list:
+        """
+        Return the edits that insert new ship blocks into the raw text inside #ship-list,
+        for a single _apply_edits pass.
+        If cluster_by_side is True, place each new entry after the last ship with the same 'side' (casefold);
+        otherwise append to the end of the array. The region, indentation and side clusters are
+        worked out once for the whole batch; ships bound for the same spot keep their list order.
         """
         if not self._raw_text:
             raise RuntimeError("No raw text captured for surgical insert.")
@@ -1284,114 +1841,94 @@ class ShipEditor:
         arr_start, arr_end = region  # arr_start points at '[', arr_end just after ']'
         base_indent, item_indent, lb = self._ship_list_indentation(self._raw_text, arr_start, arr_end)
 
-        # Probe an existing block for key casing preferences
+        blocks, _ = self._ship_block_index(self._raw_text)
+
+        # One pass over the indexed blocks: key casing preferences from the first parseable
+        # block, and where the last block of each side ends (for clustering)
         key_style = None
-        for bs, be in self._iter_top_level_flow_maps(self._raw_text, arr_start, arr_end):
-            try:
-                sample = hjson.loads(self._raw_text[bs:be], object_pairs_hook=dict)
-                key_style = self._deduce_key_style(sample)
-                break
-            except Exception:
+        side_last_end = {}
+        for _, be, d in blocks:
+            if d is None:
                 continue
+            if key_style is None:
+                key_style = self._deduce_key_style(d)
+                if not cluster_by_side:
+                    break
+            side_last_end[(d.get("side") or d.get("Side") or "").casefold()] = be
         if key_style is None:
             key_style = {"key": "Key", "name": "name", "side": "side", "artfileroot": "artfileroot"}
 
-        # Apply key style to the new ship copy
-        s = dict(ship)
-        if "Key" in s and key_style["key"] == "key":
-            s["key"] = s.pop("Key")
-        if "key" in s and key_style["key"] == "Key":
-            s["Key"] = s.pop("key")
-        if "Name" in s and key_style["name"] == "name":
-            s["name"] = s.pop("Name")
-        if "name" in s and key_style["name"] == "Name":
-            s["Name"] = s.pop("name")
-        if "Side" in s and key_style["side"] == "side":
-            s["side"] = s.pop("Side")
-        if "side" in s and key_style["side"] == "Side":
-            s["Side"] = s.pop("side")
-        if "Artfileroot" in s and key_style["artfileroot"] == "artfileroot":
-            s["artfileroot"] = s.pop("Artfileroot")
-        if "artfileroot" in s and key_style["artfileroot"] == "Artfileroot":
-            s["Artfileroot"] = s.pop("artfileroot")
-
-        # Decide insertion location
-        same_side_last_end = None
-        new_side = (s.get("side") or s.get("Side") or "").casefold()
-        if cluster_by_side and new_side:
-            for bs, be in self._iter_top_level_flow_maps(self._raw_text, arr_start, arr_end):
-                try:
-                    d = hjson.loads(self._raw_text[bs:be], object_pairs_hook=dict)
-                except Exception:
-                    continue
-                side_val = (d.get("side") or d.get("Side") or "").casefold()
-                if side_val == new_side:
-                    same_side_last_end = be
-
-        insertion_pos = None
-        trailing_comma_needed = False
-        if same_side_last_end is not None:
-            # Insert just after the last same-side block.
-            insertion_pos = same_side_last_end
-            trailing_comma_needed = True
-        else:
+        after_side = {}   # end of a same-side block -> new blocks to insert right after it
+        appended = []     # new blocks for the end of the array
+        for ship in ships:
+            # Apply key style to the new ship copy
+            s = dict(ship)
+            if "Key" in s and key_style["key"] == "key":
+                s["key"] = s.pop("Key")
+            if "key" in s and key_style["key"] == "Key":
+                s["Key"] = s.pop("key")
+            if "Name" in s and key_style["name"] == "name":
+                s["name"] = s.pop("Name")
+            if "name" in s and key_style["name"] == "Name":
+                s["Name"] = s.pop("name")
+            if "Side" in s and key_style["side"] == "side":
+                s["side"] = s.pop("Side")
+            if "side" in s and key_style["side"] == "Side":
+                s["Side"] = s.pop("side")
+            if "Artfileroot" in s and key_style["artfileroot"] == "artfileroot":
+                s["artfileroot"] = s.pop("Artfileroot")
+            if "artfileroot" in s and key_style["artfileroot"] == "Artfileroot":
+                s["Artfileroot"] = s.pop("artfileroot")
+
+            block_txt = item_indent + self._render_ship_block(s, item_indent).strip()
+            # Decide insertion location
+            new_side = (s.get("side") or s.get("Side") or "").casefold()
+            same_side_last_end = side_last_end.get(new_side) if cluster_by_side and new_side else None
+            if same_side_last_end is not None:
+                # Just after the last same-side block; whatever followed it (comma or ']') stays after us
+                after_side.setdefault(same_side_last_end, []).append("," + lb + block_txt)
+            else:
+                appended.append(block_txt)
+
+        edits = [(pos, pos, "".join(parts)) for pos, parts in after_side.items()]
+        if appended:
             # Append before the closing bracket
             insertion_pos = arr_end - 1  # points at ']'
             # Add comma if the array is non-empty (prev non-space != '[')
             i = insertion_pos - 1
             while i > arr_start and self._raw_text[i].isspace():
                 i -= 1
-            if self._raw_text[i] != '[':
-                trailing_comma_needed = True
-
-        block_txt = self._render_ship_block(s, item_indent)
-        prefix = self._raw_text[:insertion_pos]
-        suffix = self._raw_text[insertion_pos:]
-        add = ""
-        if trailing_comma_needed:
-            add += "," + lb
-        add += item_indent + block_txt.strip()
-        if same_side_last_end is not None:
-            add += ","
-        add += lb
+            lead = "," + lb if self._raw_text[i] != '[' else ""
+            edits.append((insertion_pos, insertion_pos, lead + ("," + lb).join(appended) + lb))
+        return edits
 
-        self._raw_text = prefix + add + suffix
-
-    def _surgical_delete_ship_by_key(self, key_value: str) -> bool:
+    def _surgical_delete_ship_by_key(self, key_value: str):
         """
-        Remove the ship block with given Key from the raw text inside #ship-list.
-        Returns True if a block was removed.
+        Return the (start, end, "") edit that removes the ship block with given Key from the
+        raw text inside #ship-list, or None if no such block was found.
         """
         if not self._raw_text:
-            return False
+            return None
         region = self._extract_ship_list_region(self._raw_text)
         if not region:
-            return False
+            return None
         arr_start, arr_end = region
-        matches = list(self._iter_object_spans_for_key(self._raw_text, str(key_value)))
-        if not matches:
-            return False
-        start, end = matches[0]
+        span = self._first_object_span_for_key(self._raw_text, str(key_value))
+        if span is None:
+            return None
+        start, end = span
         # Trim whitespace around to decide where the separating comma lives
-        i = start - 1
-        while i > arr_start and self._raw_text[i].isspace():
-            i -= 1
-        removed = False
+        # (arr_start holds the '[', so the rstrip never reaches past it)
+        i = arr_start + len(self._raw_text[arr_start:start].rstrip()) - 1
         # Case A: there's a comma right before the block -> remove from that comma
-        if i >= arr_start and self._raw_text[i] == ',':
-            self._raw_text = self._raw_text[:i] + self._raw_text[end:]
-            removed = True
-        else:
-            # Case B: try to consume a trailing comma after the block
-            j = end
-            n = len(self._raw_text)
-            while j < n and self._raw_text[j].isspace():
-                j += 1
-            if j < n and self._raw_text[j] == ',':
-                j += 1
-            self._raw_text = self._raw_text[:start] + self._raw_text[j:]
-            removed = True
-        return removed
+        if self._raw_text[i] == ',':
+            return (i, end, "")
+        # Case B: try to consume a trailing comma after the block
+        j = _WS_RX.match(self._raw_text, end).end()
+        n = len(self._raw_text)
+        if j < n and self._raw_text[j] == ',':
+            j += 1
+        return (start, j, "")
     def _surgical_save_current_ship(self, ship: dict, updates: dict):
         """
         Perform an in-place textual patch for the current ship inside self._raw_text.
@@ -1413,40 +1950,38 @@ class ShipEditor:
         if key_val:
             wanted = str(key_val)
             _log(f"[surgical] Saving ship with Key='{wanted}'. Beginning search in raw text...")
-            matches = list(self._iter_object_spans_for_key(self._raw_text, wanted))
-            _log(f"[surgical] Matches for Key='{wanted}': {len(matches)}")
-            if matches:
+            if getattr(self, "_debug_surgical", False):
+                matches = list(self._iter_object_spans_for_key(self._raw_text, wanted))
+                _log(f"[surgical] Matches for Key='{wanted}': {len(matches)}")
                 # Show a short preview of each candidate block (first line + first few fields)
-                if getattr(self, "_debug_surgical", False):
-                    for i, (bs, be) in enumerate(matches, 1):
-                        block = self._raw_text[bs:be]
-                        preview = block.splitlines()[0][:200]
-                        _log(f"[surgical]  candidate#{i} span=({bs},{be}) first-line='{preview}'")
-                span = matches[0]
+                for i, (bs, be) in enumerate(matches, 1):
+                    block = self._raw_text[bs:be]
+                    preview = block.splitlines()[0][:200]
+                    _log(f"[surgical]  candidate#{i} span=({bs},{be}) first-line='{preview}'")
+            span = self._first_object_span_for_key(self._raw_text, wanted)
         # Optional fallback: locate by name if Key is missing
         if not span and name_val:
-            matches = list(self._iter_object_spans_for_key(self._raw_text, str(name_val)))
-            if matches:
-                span = matches[0]
+            span = self._first_object_span_for_key(self._raw_text, str(name_val))
         if not span:
-            # Not found → treat as a brand-new ship entry: insert a new block,
-            # then run the patcher against that fresh block (so current edits are applied).
-            # Merge updates into a temporary copy for insertion.
+            # Not found → treat as a brand-new ship entry. Its block is rendered from a copy
+            # with the current edits merged in, so there is nothing left to patch: the
+            # insertion and the banner stamp go into the text in one splice.
+            if not key_val:
+                raise RuntimeError("New ship has no Key, so it cannot be inserted into the file.")
             tmp = dict(ship)
             tmp.update(updates)
-            self._surgical_insert_ship_block(tmp, cluster_by_side=True)
-            # Recompute span (on the inserted block)
-            if key_val:
-                matches = list(self._iter_object_spans_for_key(self._raw_text, str(key_val)))
-                span = matches[0] if matches else None
-            elif name_val:
-                matches = list(self._iter_object_spans_for_key(self._raw_text, str(name_val)))
-                span = matches[0] if matches else None
-            if not span:
-                raise RuntimeError("Inserted new ship, but could not re-locate it for patching.")
+            self._apply_edits_with_banner([self._surgical_insert_ship_block(tmp, cluster_by_side=True)])
+            _write_text_file(self._resolve_data_path(YAML_PATH), self._raw_text)
+            return
 
         start, end = span
         block = self._raw_text[start:end]
+        # What the file holds right now; fields already carrying their new value are
+        # left alone instead of being re-rendered and patched back in unchanged
+        try:
+            current = _loads_hjson(block)
+        except Exception:
+            current = None
 
         # Apply updates (deterministic order helps testing)
         for k in sorted(updates.keys()):
@@ -1456,6 +1991,8 @@ class ShipEditor:
             if k == "name": key_forms.append("Name")
             if k == "side": key_forms.append("Side")
             if k == "artfileroot": key_forms.append("Artfileroot")
+            if current is not None and _same_json_value(_first_value_for(current, key_forms), v):
+                continue
             if isinstance(v, list):
                 # Lists may be of scalars or dicts. When dicts present, let the patcher
                 # render with proper indentation based on file context.
@@ -1473,13 +2010,10 @@ class ShipEditor:
             elif getattr(self, "_debug_surgical", False):
                 print(f"[surgical]  no match to patch for key {k} (list={isinstance(v, list)})")
 
-        # Splice back
-        self._raw_text = self._raw_text[:start] + block + self._raw_text[end:]
-        # Stamp/update the Orion banner right after the first '{'
-        self._raw_text = self._upsert_editor_banner_simple(self._raw_text)
+        # Splice back and stamp/update the Orion banner right after the first '{'
+        self._apply_edits_with_banner([(start, end, block)])
         # Write raw text back unchanged except for patched values and banner
-        with open(self._resolve_data_path(YAML_PATH), "w", encoding="utf-8") as f:
-            f.write(self._raw_text)
+        _write_text_file(self._resolve_data_path(YAML_PATH), self._raw_text)
 
     # --- Round-trip: update nodes in place preserving style/ordering/comments ---
     def _rt_update_preserve(self, cm, updates: dict):
@@ -1588,7 +2122,7 @@ class ShipEditor:
         except Exception:
             pass
         for k in simple:
-            if isinstance(k, str) and k.strip() and k == re.sub(r'[^A-Za-z0-9_]', '', k):
+            if isinstance(k, str) and k.strip() and not _NON_IDENT_RX.search(k):
                 # Already normalized 'Key' above if it was 'key'
                 target = k
                 # Skip if it's already plain 'Key' that we want capitalized
@@ -1686,57 +2220,50 @@ class ShipEditor:
           - leave comments/blank lines intact.
         This looks only inside '#ship-list'/'ship-list' arrays.
         """
-        # Regex strategy:
-        # Find flow maps within ship list entries: { ... } and replace ", " between pairs with ",\n"
-        # We keep it conservative to avoid touching nested lists/maps: only replace at top level commas inside a single {}
-        def fix_flow_map(m):
-            inner = m.group(1)
-            # Replace ", " that separate pairs at top depth (no nested braces/brackets)
-            out = []
-            depth = 0
-            i = 0
-            while i < len(inner):
-                ch = inner[i]
-                if ch in '"\'':
-                    # copy quoted string verbatim
-                    q = ch
-                    out.append(ch)
-                    i += 1
-                    while i < len(inner):
-                        out.append(inner[i])
-                        if inner[i] == '\\':
-                            i += 2
-                            continue
-                        if inner[i] == q:
-                            i += 1
-                            break
-                        i += 1
-                    continue
-                elif ch in '{[':
-                    depth += 1; out.append(ch); i += 1; continue
-                elif ch in '}]':
-                    depth = max(0, depth-1); out.append(ch); i += 1; continue
-                elif ch == ',' and depth == 0:
-                    # ensure comma at EOL followed by newline
-                    out.append(',\n')
-                    # skip any single space after comma
-                    i += 1
-                    if i < len(inner) and inner[i] == ' ':
-                        i += 1
-                    continue
-                else:
-                    out.append(ch); i += 1
-            return '{' + ''.join(out).strip() + '}'
-
-        # Only run the expensive pass within ship list array text regions:
-        ship_list_pattern = re.compile(r'(#ship-list|ship-list)\s*:\s*\[\s*(.*?)\s*\]', re.DOTALL)
-        def per_ship_fix(arr_m):
-            arr_body = arr_m.group(2)
-            # Replace top-level { ... } occurrences in the array body
-            fixed = re.sub(r'\{(.*?)\}', lambda m: fix_flow_map(m), arr_body, flags=re.DOTALL)
-            return f"{arr_m.group(1)}: [\n{fixed}\n]"
+        # One bracket-aware walk over each ship-list array: commas directly inside a ship's
+        # { ... } become ",\n"; nested lists/maps and quoted strings are copied verbatim.
         try:
-            return ship_list_pattern.sub(per_ship_fix, text)
+            out = []
+            pos = 0
+            m = _SHIP_LIST_HEAD_RX.search(text)
+            while m:
+                body = []
+                depth = 0          # 0 = the array itself, 1 = directly inside a ship map
+                map_start = None   # index in body of the current ship's '{'
+                close = None
+                for t in _PP_TOKEN_RX.finditer(text, m.end()):
+                    tok = t.group()
+                    if tok == '{' or tok == '[':
+                        if depth == 0 and tok == '{':
+                            map_start = len(body)
+                        depth += 1
+                    elif tok == '}' or tok == ']':
+                        if depth == 0:
+                            if tok == ']':
+                                close = t.start()
+                                break
+                        else:
+                            depth -= 1
+                            if depth == 0 and map_start is not None:
+                                inner = ''.join(body[map_start + 1:]).strip()
+                                del body[map_start + 1:]
+                                body.append(inner)
+                                map_start = None
+                    elif tok == ',' and depth == 1 and map_start is not None:
+                        # ensure comma at EOL followed by newline (absorbing one space)
+                        body.append(',\n')
+                        continue
+                    elif tok[0] == ' ' and body and body[-1] == ',\n':
+                        tok = tok[1:]
+                    body.append(tok)
+                if close is None:
+                    break
+                out.append(text[pos:m.start()])
+                out.append(f"{m.group(1)}: [\n{''.join(body).rstrip()}\n]")
+                pos = close + 1
+                m = _SHIP_LIST_HEAD_RX.search(text, pos)
+            out.append(text[pos:])
+            return ''.join(out)
         except Exception:
             return text
 
@@ -1771,40 +2298,35 @@ class ShipEditor:
             cy = 200
         scale = cy / 2500.0  # Adjust the scale as needed.
         
-        beam_ports = self.ships_data[self.current_ship_index].get("hull_port_sets", {}).get("beam Primary Beams", [])
-        for beam in beam_ports:
-            try:
-                barrel_angle = float(beam.get("barrel_angle", 0))
-                arc_width = float(beam.get("arcwidth", 0))
-                port_range = float(beam.get("range", 0))
-            except Exception as e:
-                print("Error converting beam port values:", e)
-                continue
-
-            arc_color = beam.get("arccolor", "red")
+        ship = self.ships_data[self.current_ship_index]
+        for arc_color, port_range, start_angle, extent, rays in self._beam_derived(ship, "overlay"):
             pixel_radius = port_range * scale
-            center_angle = 90 - barrel_angle
             x0, y0 = cx - pixel_radius, cy - pixel_radius
             x1, y1 = cx + pixel_radius, cy + pixel_radius
-            
-            if arc_width >= 360:
+
+            if extent is None:
                 self.ship_canvas.create_oval(x0, y0, x1, y1, outline=arc_color, width=2)
-                angle_rad = math.radians(center_angle)
-                x_line = cx + pixel_radius * math.cos(angle_rad)
-                y_line = cy - pixel_radius * math.sin(angle_rad)
-                self.ship_canvas.create_line(cx, cy, x_line, y_line, fill=arc_color, width=2)
             else:
-                start_angle = center_angle - (arc_width / 2)
-                self.ship_canvas.create_arc(x0, y0, x1, y1, start=start_angle, extent=arc_width,
+                self.ship_canvas.create_arc(x0, y0, x1, y1, start=start_angle, extent=extent,
                                              style="arc", outline=arc_color, width=2)
-                start_rad = math.radians(start_angle)
-                end_rad = math.radians(start_angle + arc_width)
-                x_start = cx + pixel_radius * math.cos(start_rad)
-                y_start = cy - pixel_radius * math.sin(start_rad)
-                x_end = cx + pixel_radius * math.cos(end_rad)
-                y_end = cy - pixel_radius * math.sin(end_rad)
-                self.ship_canvas.create_line(cx, cy, x_start, y_start, fill=arc_color, width=2)
-                self.ship_canvas.create_line(cx, cy, x_end, y_end, fill=arc_color, width=2)
+            for ux, uy in rays:
+                self.ship_canvas.create_line(cx, cy, cx + pixel_radius * ux, cy - pixel_radius * uy,
+                                             fill=arc_color, width=2)
+
+    _BEAM_DERIVED = {"stats": calculate_damage_statistics, "overlay": beam_overlay_geometry}
+
+    def _beam_derived(self, ship, what):
+        """
+        _BEAM_DERIVED[what](ship) — damage stats or overlay geometry — computed once per
+        ship and kept until its beams are edited, so canvas redraws don't walk the beams.
+        """
+        entry = self._beam_cache.get(id(ship))
+        if entry is None or entry[0] is not ship:
+            entry = self._beam_cache[id(ship)] = (ship, {})
+        derived = entry[1]
+        if what not in derived:
+            derived[what] = self._BEAM_DERIVED[what](ship)
+        return derived[what]
 
     def draw_damage_statistics(self):
         """
@@ -1814,7 +2336,7 @@ class ShipEditor:
           - Forward DPM in the top-right corner.
           - Rear DPM in the bottom-left corner.
         """
-        stats = calculate_damage_statistics(self.ships_data[self.current_ship_index])
+        stats = self._beam_derived(self.ships_data[self.current_ship_index], "stats")
         total_dpm = stats["total_dpm"]
         forward_dpm = stats["forward_dpm"]
         rear_dpm = stats["rear_dpm"]
@@ -1859,26 +2381,40 @@ class ShipEditor:
         self._side_list_order = []  # index -> normalized_key
         self._ship_list_order = []  # index -> ship dict for the current side
         self.ships_data = []
-        self.ships_data = []
+        self._data_loading = False  # True while a worker thread parses the ship file
+        self._beam_cache = {}  # id(ship) -> (ship, {stats/overlay}); dropped when beams are edited
         # Option B state:
         self._save_mode = "yaml"   # "yaml" (ruamel) or "surgical" (HJSON-ish text patch)
         self._raw_text = None      # original file text for surgical mode
+        self._raw_line_break = None  # "\r\n" or "\n", decided once when the file is loaded
+        try:
+            # banner timestamps are in UK time; resolved once rather than on every save
+            self._banner_tz = ZoneInfo("Europe/London") if ZoneInfo else None
+        except Exception:
+            self._banner_tz = None
+        self._loaded_ships = None  # ships as read by libyaml, until _ensure_rt_doc takes over
+        self._data_root = {}       # parsed top-level mapping (the round-trip doc once built)
+        self._ship_list_key = "#ship-list"
         self._debug_surgical = False  # enable extra diagnostics for surgical mode
+        self._ship_span_index = None       # (blocks, by_ident) for _ship_span_index_text
+        self._ship_span_index_text = None
+        self._key_span_index_cache = None  # {Key value: [spans]} for _key_span_index_text
+        self._key_span_index_text = None
         self.raw_hjson = ""
         self.current_ship_index = 0
         self.image_label = None
         self.image_cache = None
+        self._thumb_cache = OrderedDict()  # see _get_ship_thumb
 
         # Optionally initialize the easter egg key sequence.
         self.setup_easter_egg()
 
         try:
+            # The ship file parses on a worker thread while the GUI is built
             print("Loading data...")
-            self.load_data()
+            self.load_data(on_loaded=self.populate_side_selection)
             print("Building GUI...")
             self.build_gui()
-            print("Populating side selection...")
-            self.populate_side_selection()
         except Exception as e:
             print(f"Error during initialization: {e}")
             messagebox.showerror("Error", f"An error occurred during initialization: {e}")
@@ -1904,19 +2440,11 @@ class ShipEditor:
         frm_header = ttk.Frame(self.master)
         frm_header.pack(fill="x", padx=10, pady=5)
 
-        # Determine appropriate resampling mode (for Pillow v10+)
-        try:
-            resample_mode = Image.Resampling.LANCZOS
-        except AttributeError:
-            resample_mode = Image.ANTIALIAS
-
         # Load the main logo strictly from <cosmos_root>/data/graphics/CosmosLogo.png
         logo_path = os.path.join(self._get_data_dir(), "graphics", "CosmosLogo.png")
         if os.path.exists(logo_path):
             try:
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((165, 125), resample_mode)
-                self.logo_image = ImageTk.PhotoImage(logo_img)
+                self.logo_image = self._load_logo(logo_path, (165, 125))
             except Exception as e:
                 print(f"Error loading Cosmos logo at {self._abs(logo_path)}:", e)
                 self.logo_image = None
@@ -1926,9 +2454,7 @@ class ShipEditor:
 
         # Load the developer logo (Fish.png) and resize to 125x125.
         try:
-            dev_img = Image.open("OrionData/Fish.png")
-            dev_img = dev_img.resize((125, 125), resample_mode)
-            self.dev_logo_image = ImageTk.PhotoImage(dev_img)
+            self.dev_logo_image = self._load_logo("OrionData/Fish.png", (125, 125))
         except Exception as e:
             print("Error loading Fish.png:", e)
             self.dev_logo_image = None
@@ -1953,9 +2479,7 @@ class ShipEditor:
         
         # Orion image above the version info (fixed path like dev logo)
         try:
-            orion_img = Image.open("OrionData/Orion500.png")
-            orion_img = orion_img.resize((170, 170), resample_mode)
-            self.orion_logo_image = ImageTk.PhotoImage(orion_img)
+            self.orion_logo_image = self._load_logo("OrionData/Orion500.png", (170, 170))
         except Exception as e:
             print("Error loading Orion500.png:", e)
             self.orion_logo_image = None
@@ -2261,6 +2785,28 @@ class ShipEditor:
             print(f"⚠️ Error in on_ship_selected: {e}")
             messagebox.showerror("Error", f"An error occurred while selecting the ship: {e}")
 
+    def _get_ship_thumb(self, image_path, max_w, max_h):
+        """
+        (PhotoImage, width, height) of the rotated ship image fitted to max_w x max_h.
+        Kept in a small LRU keyed by path, mtime, size and fit box, so flipping between
+        ships doesn't decode and resample the PNG again.
+        """
+        st = os.stat(image_path)
+        key = (image_path, st.st_mtime_ns, st.st_size, max_w, max_h)
+        entry = self._thumb_cache.get(key)
+        if entry is not None:
+            self._thumb_cache.move_to_end(key)
+            return entry
+        img = Image.open(image_path)
+        img.thumbnail((max_w, max_h))
+        img = img.rotate(180)
+        img = img.convert("RGBA")
+        entry = (ImageTk.PhotoImage(img), img.width, img.height)
+        self._thumb_cache[key] = entry
+        if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        return entry
+
     def load_ship_image(self, artfileroot):
         try:
             artfileroot = os.path.normpath(artfileroot)
@@ -2285,11 +2831,7 @@ class ShipEditor:
                 desired_h = canvas_h * 0.8
                 
                 # Load and scale the image while preserving the aspect ratio:
-                img = Image.open(image_path)
-                img.thumbnail((desired_w, desired_h))
-                img = img.rotate(180)
-                img = img.convert("RGBA")
-                self.image_cache = ImageTk.PhotoImage(img)
+                self.image_cache, img_w, img_h = self._get_ship_thumb(image_path, desired_w, desired_h)
                 
                 # Compute the canvas center:
                 cx, cy = canvas_w // 2, canvas_h // 2
@@ -2299,8 +2841,8 @@ class ShipEditor:
                 
                 # Save the center for overlays:
                 self.ship_canvas.image_center = (cx + offset_x, cy + offset_y)
-                self.ship_canvas.image_width = img.width
-                self.ship_canvas.image_height = img.height
+                self.ship_canvas.image_width = img_w
+                self.ship_canvas.image_height = img_h
                 
                 self.draw_beam_field_overlay()
                 self.draw_damage_statistics()
@@ -2312,7 +2854,10 @@ class ShipEditor:
 
 
     def save_changes(self):
+        if self._data_loading:  # ships_data is replaced when the load finishes
+            return
         try:
+            self._ensure_rt_doc()
             ship = self.ships_data[self.current_ship_index]
             # Define required numeric fields with defaults.
             int_fields = {
@@ -2493,7 +3038,7 @@ class ShipEditor:
                 self._rt_update_preserve(ship, new_values)
                 self._normalize_ship_keys(ship)
                 self._apply_hjson_layout()
-                if YAML is None or getattr(self, "_yaml_doc", None) is None:
+                if _get_ruamel() is None or getattr(self, "_yaml_doc", None) is None:
                     raise RuntimeError("ruamel.yaml round-trip context not initialized.")
                 y = getattr(self, "_yaml_rt", None) or YAML(typ="rt")
                 self._configure_yaml_emitter(y)
@@ -2504,8 +3049,7 @@ class ShipEditor:
                 dumped = self._postprocess_hjson_text(dumped)
                 # Stamp/update the Orion banner right after the first '{'
                 dumped = self._upsert_editor_banner_simple(dumped)
-                with open(self._resolve_data_path(YAML_PATH), "w", encoding="utf-8") as f:
-                    f.write(dumped)
+                _write_text_file(self._resolve_data_path(YAML_PATH), dumped)
                 self.data_path = self._resolve_data_path(YAML_PATH)
                 messagebox.showinfo("Saved", "Changes saved to YAML (comments preserved).")
 
@@ -2515,9 +3059,10 @@ class ShipEditor:
 
 
     def reload_data(self):
+        if self._data_loading:
+            return
         try:
-            self.load_data()
-            self.populate_side_selection()
+            self.load_data(on_loaded=self.populate_side_selection)
         except Exception as e:
             print(f"Error reloading data: {e}")
             messagebox.showerror("Error", f"An error occurred while reloading data: {e}")
@@ -2531,7 +3076,7 @@ class ShipEditor:
                 ytext = f.read()
                 # remember line endings for emitter
                 self._yaml_line_break = "\r\n" if "\r\n" in ytext else "\n"
-            if YAML is None:
+            if _get_ruamel() is None:
                 raise RuntimeError("ruamel.yaml is required. Install with: pip install ruamel.yaml")
             YAML(typ="rt").load(ytext)
             messagebox.showinfo("Verify", "YAML verified successfully!")
@@ -2688,12 +3233,17 @@ class ShipEditor:
 
     def save_as_yaml(self):
         """Always write YAML (conversion/export). If loaded via ruamel, preserve comments."""
+        if self._data_loading:  # ships_data is replaced when the load finishes
+            return
         try:
-            if YAML is not None and getattr(self, "_yaml_doc", None) is not None:
+            self._ensure_rt_doc()
+            if _get_ruamel() is not None and getattr(self, "_yaml_doc", None) is not None:
                 y = getattr(self, "_yaml_rt", None) or YAML(typ="rt")
                 self._configure_yaml_emitter(y)
-                with open(self._resolve_data_path(YAML_PATH), "w", encoding="utf-8") as f:
-                    y.dump(self._yaml_doc, f)
+                import io
+                buf = io.StringIO()
+                y.dump(self._yaml_doc, buf)
+                _write_text_file(self._resolve_data_path(YAML_PATH), buf.getvalue())
                 self.data_path = self._resolve_data_path(YAML_PATH)
                 self.data_format = "yaml"
                 messagebox.showinfo("Saved", f"Saved YAML with comments preserved:\n{YAML_PATH}")
@@ -2702,8 +3252,8 @@ class ShipEditor:
                     raise RuntimeError("Cannot save YAML: PyYAML is not installed. Run: pip install pyyaml")
                 root = dict(self.header_data)
                 root["#ship-list"] = self.ships_data
-                with open(self._resolve_data_path(YAML_PATH), "w", encoding="utf-8") as f:
-                    yaml.safe_dump(root, f, sort_keys=False, allow_unicode=True, default_flow_style=False)
+                dumped = yaml.safe_dump(root, sort_keys=False, allow_unicode=True, default_flow_style=False)
+                _write_text_file(self._resolve_data_path(YAML_PATH), dumped)
                 self.data_path = self._resolve_data_path(YAML_PATH)
                 self.data_format = "yaml"
                 messagebox.showinfo("Saved", f"Exported to YAML:\n{YAML_PATH}")
@@ -2711,6 +3261,8 @@ class ShipEditor:
             messagebox.showerror("Error", f"Failed to save YAML:\n{e}")
 
     def new_ship(self):
+        if self._data_loading:  # ships_data is replaced when the load finishes
+            return
         existing_sides = sorted(set(ship["side"] for ship in self.ships_data))
         dialog = NewShipDialog(self.master, existing_sides)
         if dialog.result:
@@ -2720,26 +3272,29 @@ class ShipEditor:
             self.populate_side_selection()
 
     def delete_ship(self):
+        if self._data_loading:  # ships_data is replaced when the load finishes
+            return
         try:
             confirm = messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this ship?")
             if not confirm:
                 return
+            self._ensure_rt_doc()
             ship = self.ships_data[self.current_ship_index]
             print(f"Deleting ship: {ship['key']}")
             self.ships_data.remove(ship)
             # Persist deletion to disk:
             if getattr(self, "_save_mode", "surgical") == "surgical":
                 ident = ship.get("Key") or ship.get("key") or ship.get("name")
-                if ident is not None and self._surgical_delete_ship_by_key(str(ident)):
+                edit = self._surgical_delete_ship_by_key(str(ident)) if ident is not None else None
+                if edit is not None:
                     # Stamp/update banner and write out
-                    self._raw_text = self._upsert_editor_banner_simple(self._raw_text or "")
-                    with open(self._resolve_data_path(YAML_PATH), "w", encoding="utf-8") as f:
-                        f.write(self._raw_text)
+                    self._apply_edits_with_banner([edit])
+                    _write_text_file(self._resolve_data_path(YAML_PATH), self._raw_text)
                 else:
                     messagebox.showwarning("Delete", "Entry removed from the list, but it was not found in the file.")
             else:
                 # YAML round-trip: write immediately for consistency
-                if YAML is not None and getattr(self, "_yaml_doc", None) is not None:
+                if _get_ruamel() is not None and getattr(self, "_yaml_doc", None) is not None:
                     self._apply_hjson_layout()
                     y = getattr(self, "_yaml_rt", None) or YAML(typ="rt")
                     self._configure_yaml_emitter(y)
@@ -2749,14 +3304,15 @@ class ShipEditor:
                     dumped = buf.getvalue()
                     dumped = self._postprocess_hjson_text(dumped)
                     dumped = self._upsert_editor_banner_simple(dumped)
-                    with open(self._resolve_data_path(YAML_PATH), "w", encoding="utf-8") as f:
-                        f.write(dumped)
+                    _write_text_file(self._resolve_data_path(YAML_PATH), dumped)
             self.populate_side_selection()
         except Exception as e:
             print(f"Error deleting ship: {e}")
             messagebox.showerror("Error", f"An error occurred while deleting the ship: {e}")
 
     def edit_torpedo(self):
+        if self._data_loading:  # ships_data is replaced when the load finishes
+            return
         ship = self.ships_data[self.current_ship_index]
         current_torpedo = ship.get("torpedostart", [])
         available_types = set()
@@ -2775,6 +3331,8 @@ class ShipEditor:
             messagebox.showinfo("Updated", "Torpedo start values updated.")
 
     def edit_beam_ports(self):
+        if self._data_loading:  # ships_data is replaced when the load finishes
+            return
         ship = self.ships_data[self.current_ship_index]
         hull_ports = ship.get("hull_port_sets", {})
         current_beam = hull_ports.get("beam Primary Beams", [])
@@ -2784,6 +3342,7 @@ class ShipEditor:
             if "hull_port_sets" not in ship:
                 ship["hull_port_sets"] = {}
             ship["hull_port_sets"]["beam Primary Beams"] = dialog.result
+            self._beam_cache.pop(id(ship), None)
             print(f"Updated beam ports: {ship['hull_port_sets']['beam Primary Beams']}")
             # messagebox.showinfo("Updated", "Beam port values updated.")
             # *** NEW: Update the main editor overlay after beam edits ***
@@ -2791,6 +3350,8 @@ class ShipEditor:
 
 
     def edit_exhaust_ports(self):
+        if self._data_loading:  # ships_data is replaced when the load finishes
+            return
         ship = self.ships_data[self.current_ship_index]
         hull_ports = ship.get("hull_port_sets", {})
         current_exhaust = hull_ports.get("exhaust", [])
@@ -2846,11 +3407,11 @@ class ShipEditor:
         """
         Open a Toplevel window with an OpenGL textured preview of the ship's OBJ.
         """
-        if ObjTexturedGLFrame is None:
+        if _load_obj_viewer() is None:
             msg = (
                 "OpenGL viewer not available.\n\n"
                 "Please install dependencies:\n"
-                "  pip install pyopengltk PyOpenGL Pillow\n"
+                "  pip install pyopengltk PyOpenGL Pillow numpy\n"
                 "and ensure OrionData/obj_view_gl.py exists next to this app.\n"
             )
             if OBJ_VIEW_GL_IMPORT_ERROR:
@@ -2980,6 +3541,7 @@ class ShipEditor:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     try:
         root = tk.Tk()
         app = ShipEditor(root)